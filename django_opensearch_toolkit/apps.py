@@ -1,14 +1,17 @@
 """App configuration for django-opensearch-toolkit."""
 
-from typing import Any, Dict
-
 from django.apps import AppConfig
-from django.conf import settings
 from opensearchpy.connection import connections
 
-
-_OpenSearchClusterName = str
-_OpenSearchConfiguration = Dict[str, Any]
+from django_opensearch_toolkit.async_client.connections import async_connections
+from django_opensearch_toolkit.conf import (
+    get_cluster_configurations,
+    get_lazy_connections,
+    get_search_cache_options,
+)
+from django_opensearch_toolkit.lazy_client import LazyOpenSearch
+from django_opensearch_toolkit.search.cache import handle_index_written
+from django_opensearch_toolkit.signals import index_written
 
 
 class DjangoOpensearchToolkitConfig(AppConfig):
@@ -20,25 +23,24 @@ class DjangoOpensearchToolkitConfig(AppConfig):
 
     def ready(self) -> None:
         """Initialize the app."""
-        cluster_configurations = _get_opensearch_cluster_configurations()
+        cluster_configurations = get_cluster_configurations()
+        for c_name, client in list(connections.connections._conns.items()):
+            if isinstance(client, LazyOpenSearch):
+                # configure() keeps connections whose configuration is unchanged, so a proxy registered
+                # before (e.g., when the settings changed) would otherwise survive.
+                connections.remove_connection(c_name)
         connections.configure(**cluster_configurations)
+        async_connections.configure(**cluster_configurations)
 
+        if get_lazy_connections():
+            # Register proxies that build each cluster's client on first use, once per process.
+            for c_name, c_config in cluster_configurations.items():
+                connections.add_connection(c_name, LazyOpenSearch(**c_config))
 
-def _get_opensearch_cluster_configurations() -> Dict[_OpenSearchClusterName, _OpenSearchConfiguration]:
-    """Load the OpenSearch cluster configurations from the project settings file."""
-    cluster_configurations = getattr(settings, "OPENSEARCH_CLUSTERS", {})
-
-    if not isinstance(cluster_configurations, dict):
-        raise ValueError("OPENSEARCH_CLUSTERS must be a dictionary. Please check your settings.py file.")
-
-    for c_name, c_config in cluster_configurations.items():
-        if not isinstance(c_name, str):
-            raise ValueError(
-                "All keys in OPENSEARCH_CLUSTERS must be strings. Please check your settings.py file."
-            )
-        if not isinstance(c_config, dict):
-            raise ValueError(
-                "All values in OPENSEARCH_CLUSTERS must be dictionaries. Please check your settings.py file."
-            )
+        # NOTE: connections are never warmed up here. This runs in the master process of pre-fork
+        # servers (whose workers would share the warmed sockets), and for every management command.
+        # See warmup.warm_up_connections().
 
-    return cluster_configurations
+        if get_search_cache_options() is not None:
+            # Every process that writes must invalidate, not only the ones that cache search responses.
+            index_written.connect(handle_index_written, dispatch_uid="django_opensearch_toolkit.search_cache")
@@ -0,0 +1,13 @@
+"""Async (asyncio) support for interacting with OpenSearch clusters.
+
+The clients here are built from the same `OPENSEARCH_CLUSTERS` setting as the
+synchronous ones, but use `AsyncOpenSearch` with an aiohttp connection pool per
+cluster. They are intended for async views served under ASGI.
+
+NOTE: this requires the optional aiohttp dependency, i.e.
+`pip install django-opensearch-toolkit[async]`.
+"""
+
+from .asgi import OpenSearchLifespanMiddleware
+from .connections import async_connections, close_async_connections, get_async_connection
+from .documents import async_get, async_save, async_search
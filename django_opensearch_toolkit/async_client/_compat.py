@@ -0,0 +1,9 @@
+"""Imports from opensearch-py that moved between its versions."""
+
+try:
+    from opensearchpy import AsyncSearch  # type: ignore[attr-defined]
+except ImportError:  # opensearch-py < 3 only exports it from its private module
+    from opensearchpy._async.helpers.search import AsyncSearch
+
+
+__all__ = ["AsyncSearch"]
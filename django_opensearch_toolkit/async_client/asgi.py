@@ -0,0 +1,42 @@
+"""ASGI integration that ties the lifecycle of the async clients to the ASGI application."""
+
+from typing import Any, Awaitable, Callable, Dict
+
+from django_opensearch_toolkit.async_client.connections import close_async_connections
+
+
+_Scope = Dict[str, Any]
+_Receive = Callable[[], Awaitable[Dict[str, Any]]]
+_Send = Callable[[Dict[str, Any]], Awaitable[None]]
+_ASGIApplication = Callable[..., Awaitable[None]]
+
+
+class OpenSearchLifespanMiddleware:
+    """ASGI middleware that handles the `lifespan` protocol on behalf of the Django application.
+
+    Django's ASGI handler only supports `http` scopes. This middleware answers
+    the startup/shutdown events itself, and closes the async OpenSearch clients
+    (and their aiohttp connection pools) when the server shuts down.
+
+    Usage (asgi.py):
+        application = OpenSearchLifespanMiddleware(get_asgi_application())
+    """
+
+    def __init__(self, application: _ASGIApplication) -> None:
+        self.application = application
+
+    async def __call__(self, scope: _Scope, receive: _Receive, send: _Send) -> None:
+        """Handle an ASGI connection."""
+        if scope["type"] != "lifespan":
+            await self.application(scope, receive, send)
+            return
+
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                # Clients are created lazily on first use, so there is nothing to do here
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await close_async_connections()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
@@ -0,0 +1,92 @@
+"""Registry of AsyncOpenSearch clients, configured from the Django settings.
+
+This mirrors opensearchpy.connection.connections, which the toolkit configures
+for the synchronous clients. The main difference is that async clients hold an
+aiohttp session, which is bound to the event loop it was created on. So clients
+are created lazily and cached per (event loop, cluster) pair.
+"""
+
+import asyncio
+import threading
+from typing import Any, Dict
+import weakref
+
+from opensearchpy.serializer import serializer
+
+
+class AsyncOpenSearchConnections:
+    """Registry of AsyncOpenSearch clients, keyed by cluster (connection) name."""
+
+    def __init__(self) -> None:
+        self._kwargs: Dict[str, Dict[str, Any]] = {}
+        self._overrides: Dict[str, Any] = {}
+        self._conns_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def configure(self, **kwargs: Dict[str, Any]) -> None:
+        """Set the configuration for each cluster. Clients are only created when requested."""
+        self._kwargs = {alias: _to_async_kwargs(config) for alias, config in kwargs.items()}
+
+    def add_connection(self, alias: str, conn: Any) -> None:
+        """Register a client object that is returned as-is, regardless of the event loop (e.g., a mock)."""
+        self._overrides[alias] = conn
+
+    def remove_connection(self, alias: str) -> None:
+        """Remove a client object previously registered with add_connection()."""
+        del self._overrides[alias]
+
+    def get_connection(self, alias: str) -> Any:
+        """Return the client for this cluster on the running event loop, creating it if necessary.
+
+        Raises:
+            KeyError: if the cluster is not configured.
+            RuntimeError: if called outside of a running event loop.
+        """
+        if alias in self._overrides:
+            return self._overrides[alias]
+        if alias not in self._kwargs:
+            raise KeyError(f"There is no async connection with alias {alias!r}.")
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            conns = self._conns_by_loop.setdefault(loop, {})
+            if alias not in conns:
+                # Imported here, so the toolkit can be used without the optional aiohttp dependency
+                from opensearchpy import AsyncOpenSearch
+
+                conns[alias] = AsyncOpenSearch(serializer=serializer, **self._kwargs[alias])
+            return conns[alias]
+
+    async def close(self) -> None:
+        """Close all clients created on the running event loop, releasing their connection pools."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            conns = self._conns_by_loop.pop(loop, {})
+        for conn in conns.values():
+            await conn.close()
+
+
+def _to_async_kwargs(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate a synchronous client configuration into the equivalent async configuration.
+
+    The aiohttp connection names its pool size `maxsize` instead of `pool_maxsize`.
+    """
+    kwargs = dict(config)
+    if "pool_maxsize" in kwargs:
+        kwargs.setdefault("maxsize", kwargs.pop("pool_maxsize"))
+    return kwargs
+
+
+async_connections = AsyncOpenSearchConnections()
+
+
+def get_async_connection(alias: str) -> Any:
+    """Return the AsyncOpenSearch client for a cluster on the running event loop."""
+    return async_connections.get_connection(alias)
+
+
+async def close_async_connections() -> None:
+    """Close all AsyncOpenSearch clients created on the running event loop."""
+    await async_connections.close()
@@ -0,0 +1,82 @@
+"""Async counterparts of the common Document operations.
+
+These accept the (synchronous) Document classes used throughout a project, so
+the same models can be used from both sync and async views.
+"""
+
+from typing import Any, Optional, Type, TypeVar
+
+from opensearchpy.helpers.document import Document
+from opensearchpy.helpers.utils import DOC_META_FIELDS, META_FIELDS
+
+from django_opensearch_toolkit.async_client._compat import AsyncSearch
+from django_opensearch_toolkit.async_client.connections import get_async_connection
+from django_opensearch_toolkit.signals import index_written
+
+
+_DocumentT = TypeVar("_DocumentT", bound=Document)
+
+
+def async_search(document_cls: Type[Document], using: Optional[str] = None) -> AsyncSearch:
+    """Return an AsyncSearch over the document's index, analogous to Document.search().
+
+    Hits in the response are deserialized into instances of `document_cls`.
+    Must be called from within a running event loop.
+    """
+    return AsyncSearch(
+        using=get_async_connection(document_cls._get_using(using)),
+        index=document_cls._default_index(),
+        doc_type=[document_cls],
+    )
+
+
+async def async_get(
+    document_cls: Type[_DocumentT],
+    id: str,
+    using: Optional[str] = None,
+    index: Optional[str] = None,
+    **kwargs: Any,
+) -> Optional[_DocumentT]:
+    """Retrieve a single document by id, analogous to Document.get()."""
+    client = get_async_connection(document_cls._get_using(using))
+    doc = await client.get(index=document_cls._default_index(index), id=id, **kwargs)
+    if not doc.get("found", False):
+        return None
+    return document_cls.from_opensearch(doc)  # type: ignore[no-any-return]
+
+
+async def async_save(
+    document: Document,
+    using: Optional[str] = None,
+    index: Optional[str] = None,
+    validate: bool = True,
+    skip_empty: bool = True,
+    **kwargs: Any,
+) -> str:
+    """Save the document into OpenSearch, analogous to Document.save().
+
+    Returns:
+        str: the operation result, i.e. "created" or "updated".
+    """
+    if validate:
+        document.full_clean()
+
+    connection_name = document._get_using(using)
+    client = get_async_connection(connection_name)
+    doc_meta = {k: document.meta[k] for k in DOC_META_FIELDS if k in document.meta}
+    if "seq_no" in document.meta and "primary_term" in document.meta:
+        doc_meta["if_seq_no"] = document.meta["seq_no"]
+        doc_meta["if_primary_term"] = document.meta["primary_term"]
+    doc_meta.update(kwargs)
+
+    index_name = document._get_index(index)
+    meta = await client.index(
+        index=index_name,
+        body=document.to_dict(skip_empty=skip_empty),
+        **doc_meta,
+    )
+    index_written.send(sender=document.__class__, connection_name=connection_name, index=index_name)
+    for k in META_FIELDS:
+        if "_" + k in meta:
+            setattr(document.meta, k, meta["_" + k])
+    return meta["result"]  # type: ignore[no-any-return]
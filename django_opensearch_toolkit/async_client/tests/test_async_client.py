@@ -0,0 +1,161 @@
+"""Unit tests for the async_client package."""
+
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+from django.test import TestCase
+from opensearchpy import AsyncOpenSearch
+from opensearchpy.helpers.document import Document
+from opensearchpy.helpers.field import Keyword
+
+from django_opensearch_toolkit.async_client import (
+    OpenSearchLifespanMiddleware,
+    async_connections,
+    async_get,
+    async_save,
+    async_search,
+)
+from django_opensearch_toolkit.async_client.connections import AsyncOpenSearchConnections
+
+
+class SampleDocument(Document):
+    """Document for unit tests."""
+
+    name = Keyword()
+
+    class Index:
+        using = "async_unittest"
+        name = "sample_documents"
+
+
+class AsyncOpenSearchConnectionsTest(TestCase):
+    """Unit tests for AsyncOpenSearchConnections."""
+
+    databases = set()
+
+    def setUp(self) -> None:
+        self.registry = AsyncOpenSearchConnections()
+        self.registry.configure(cluster1={"hosts": [{"host": "localhost", "port": 9200}], "pool_maxsize": 32})
+
+    async def test_get_connection_is_cached_per_loop(self) -> None:
+        client = self.registry.get_connection("cluster1")
+        self.assertIsInstance(client, AsyncOpenSearch)
+        self.assertIs(client, self.registry.get_connection("cluster1"))
+        self.assertEqual(client.transport.kwargs["maxsize"], 32)
+        await self.registry.close()
+
+        # A new client is created once the previous ones are closed
+        self.assertIsNot(client, self.registry.get_connection("cluster1"))
+        await self.registry.close()
+
+    async def test_get_connection_unknown_cluster(self) -> None:
+        with self.assertRaises(KeyError):
+            self.registry.get_connection("cluster2")
+
+    def test_get_connection_requires_running_loop(self) -> None:
+        with self.assertRaises(RuntimeError):
+            self.registry.get_connection("cluster1")
+
+    async def test_add_connection_overrides_configuration(self) -> None:
+        mock_client = MagicMock()
+        self.registry.add_connection("cluster1", mock_client)
+        self.assertIs(self.registry.get_connection("cluster1"), mock_client)
+        self.registry.remove_connection("cluster1")
+        self.assertIsNot(self.registry.get_connection("cluster1"), mock_client)
+        await self.registry.close()
+
+
+class AsyncDocumentHelpersTest(TestCase):
+    """Unit tests for the async Document helpers."""
+
+    databases = set()
+
+    def setUp(self) -> None:
+        self.os_client = AsyncMock()
+        async_connections.add_connection("async_unittest", self.os_client)
+
+    def tearDown(self) -> None:
+        async_connections.remove_connection("async_unittest")
+
+    async def test_async_search(self) -> None:
+        self.os_client.search.return_value = {
+            "hits": {"hits": [{"_index": "sample_documents", "_id": "1", "_source": {"name": "n1"}}]}
+        }
+
+        response = await async_search(SampleDocument).query("match_all").execute()
+
+        self.os_client.search.assert_awaited_once_with(
+            index=["sample_documents"],
+            body={"query": {"match_all": {}}},
+        )
+        hits = list(response)
+        self.assertEqual(len(hits), 1)
+        self.assertIsInstance(hits[0], SampleDocument)
+        self.assertEqual(hits[0].meta.id, "1")
+        self.assertEqual(hits[0].name, "n1")
+
+    async def test_async_get(self) -> None:
+        self.os_client.get.return_value = {
+            "found": True,
+            "_index": "sample_documents",
+            "_id": "1",
+            "_source": {"name": "n1"},
+        }
+        doc = await async_get(SampleDocument, id="1")
+        self.os_client.get.assert_awaited_once_with(index="sample_documents", id="1")
+        assert doc is not None
+        self.assertEqual(doc.name, "n1")
+
+        self.os_client.get.return_value = {"found": False}
+        self.assertIsNone(await async_get(SampleDocument, id="2"))
+
+    async def test_async_save(self) -> None:
+        self.os_client.index.return_value = {"_id": "abc", "_version": 1, "result": "created"}
+
+        doc = SampleDocument(name="n1")
+        result = await async_save(doc)
+
+        self.assertEqual(result, "created")
+        self.assertEqual(doc.meta.id, "abc")
+        self.os_client.index.assert_awaited_once_with(index="sample_documents", body={"name": "n1"})
+
+
+class OpenSearchLifespanMiddlewareTest(TestCase):
+    """Unit tests for OpenSearchLifespanMiddleware."""
+
+    databases = set()
+
+    async def test_lifespan(self) -> None:
+        application = AsyncMock()
+        middleware = OpenSearchLifespanMiddleware(application)
+        client = AsyncMock()
+        registry_conns = async_connections._conns_by_loop.setdefault(asyncio.get_running_loop(), {})
+        registry_conns["cluster1"] = client
+
+        messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+        sent: List[Dict[str, Any]] = []
+
+        async def receive() -> Dict[str, Any]:
+            return messages.pop(0)
+
+        async def send(message: Dict[str, Any]) -> None:
+            sent.append(message)
+
+        await middleware({"type": "lifespan"}, receive, send)
+
+        application.assert_not_called()
+        client.close.assert_awaited_once_with()
+        self.assertEqual(
+            sent,
+            [{"type": "lifespan.startup.complete"}, {"type": "lifespan.shutdown.complete"}],
+        )
+
+    async def test_http_is_forwarded(self) -> None:
+        application = AsyncMock()
+        middleware = OpenSearchLifespanMiddleware(application)
+        receive, send = AsyncMock(), AsyncMock()
+
+        await middleware({"type": "http"}, receive, send)
+
+        application.assert_awaited_once_with({"type": "http"}, receive, send)
@@ -0,0 +1,163 @@
+"""Access to the settings for django-opensearch-toolkit in the project settings file."""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+_OpenSearchClusterName = str
+_OpenSearchConfiguration = Dict[str, Any]
+_ToolkitOptions = Dict[str, Any]
+
+# Key reserved in each cluster's configuration for options handled by the toolkit
+# itself. It's removed before the configuration is passed to the OpenSearch client.
+TOOLKIT_OPTIONS_KEY = "toolkit_options"
+
+_DEFAULT_TOOLKIT_OPTIONS: _ToolkitOptions = {
+    # Number of keep-alive connections to open to each node when warming up the client (0 = no warmup)
+    "prefill_connections": 0,
+}
+
+_DEFAULT_SEARCH_CACHE_OPTIONS: Dict[str, Any] = {
+    # Alias of the Django cache (in settings.CACHES) to store search results in
+    "cache": "default",
+    # Seconds to keep search results for
+    "timeout": 60,
+    # Seconds after a write to invalidate the cached results of its index again, once the write is
+    # visible to searches (i.e., the refresh interval of the indices). 0 disables the second invalidation.
+    "refresh_interval": 1,
+}
+
+
+def get_cluster_configurations() -> Dict[_OpenSearchClusterName, _OpenSearchConfiguration]:
+    """Load the OpenSearch client configuration for each cluster from the project settings file."""
+    return {
+        c_name: client_config for c_name, (client_config, _) in _get_split_cluster_configurations().items()
+    }
+
+
+def get_cluster_toolkit_options() -> Dict[_OpenSearchClusterName, _ToolkitOptions]:
+    """Load the toolkit options for each cluster from the project settings file."""
+    return {c_name: options for c_name, (_, options) in _get_split_cluster_configurations().items()}
+
+
+def get_lazy_connections() -> bool:
+    """Load whether to use lazily created, per-process clients from the project settings file."""
+    lazy_connections = getattr(settings, "OPENSEARCH_LAZY_CONNECTIONS", False)
+
+    if not isinstance(lazy_connections, bool):
+        raise ValueError("OPENSEARCH_LAZY_CONNECTIONS must be a boolean. Please check your settings.py file.")
+
+    return lazy_connections
+
+
+def get_migration_metrics_hook() -> Optional[Callable[..., Any]]:
+    """Load the function to call with migration timings from the project settings file, if any."""
+    hook_path = getattr(settings, "OPENSEARCH_MIGRATION_METRICS_HOOK", None)
+    if hook_path is None:
+        return None
+
+    if not isinstance(hook_path, str):
+        raise ValueError(
+            "OPENSEARCH_MIGRATION_METRICS_HOOK must be a dotted path to a function. "
+            "Please check your settings.py file."
+        )
+    try:
+        return import_string(hook_path)
+    except ImportError as e:
+        raise ValueError(
+            f"OPENSEARCH_MIGRATION_METRICS_HOOK '{hook_path}' could not be imported. "
+            "Please check your settings.py file."
+        ) from e
+
+
+def get_search_cache_options() -> Optional[Dict[str, Any]]:
+    """Load the options of the search result cache from the project settings file, if it's enabled."""
+    options = getattr(settings, "OPENSEARCH_SEARCH_CACHE", None)
+    if options is None:
+        return None
+
+    if not isinstance(options, dict):
+        raise ValueError("OPENSEARCH_SEARCH_CACHE must be a dictionary. Please check your settings.py file.")
+
+    unknown_options = set(options) - set(_DEFAULT_SEARCH_CACHE_OPTIONS)
+    if unknown_options:
+        raise ValueError(
+            f"Unknown options in OPENSEARCH_SEARCH_CACHE: {sorted(unknown_options)}. "
+            "Please check your settings.py file."
+        )
+
+    if not isinstance(options.get("cache", "default"), str):
+        raise ValueError(
+            "OPENSEARCH_SEARCH_CACHE['cache'] must be the alias of a cache in CACHES. "
+            "Please check your settings.py file."
+        )
+
+    timeout = options.get("timeout")
+    if timeout is not None and (not isinstance(timeout, int) or timeout <= 0):
+        raise ValueError(
+            "OPENSEARCH_SEARCH_CACHE['timeout'] must be a positive number of seconds. "
+            "Please check your settings.py file."
+        )
+
+    refresh_interval = options.get("refresh_interval", 0)
+    if not isinstance(refresh_interval, (int, float)) or refresh_interval < 0:
+        raise ValueError(
+            "OPENSEARCH_SEARCH_CACHE['refresh_interval'] must be a non-negative number of seconds. "
+            "Please check your settings.py file."
+        )
+
+    return {**_DEFAULT_SEARCH_CACHE_OPTIONS, **options}
+
+
+def _get_split_cluster_configurations() -> (
+    Dict[_OpenSearchClusterName, Tuple[_OpenSearchConfiguration, _ToolkitOptions]]
+):
+    """Load OPENSEARCH_CLUSTERS, splitting each configuration into the client config and toolkit options."""
+    cluster_configurations = getattr(settings, "OPENSEARCH_CLUSTERS", {})
+
+    if not isinstance(cluster_configurations, dict):
+        raise ValueError("OPENSEARCH_CLUSTERS must be a dictionary. Please check your settings.py file.")
+
+    split_configurations = {}
+    for c_name, c_config in cluster_configurations.items():
+        if not isinstance(c_name, str):
+            raise ValueError(
+                "All keys in OPENSEARCH_CLUSTERS must be strings. Please check your settings.py file."
+            )
+        if not isinstance(c_config, dict):
+            raise ValueError(
+                "All values in OPENSEARCH_CLUSTERS must be dictionaries. Please check your settings.py file."
+            )
+
+        client_config = dict(c_config)
+        options = client_config.pop(TOOLKIT_OPTIONS_KEY, {})
+        split_configurations[c_name] = (client_config, _validate_toolkit_options(c_name, options))
+
+    return split_configurations
+
+
+def _validate_toolkit_options(c_name: str, options: Any) -> _ToolkitOptions:
+    """Validate the toolkit options for a cluster, and fill in the defaults."""
+    if not isinstance(options, dict):
+        raise ValueError(
+            f"OPENSEARCH_CLUSTERS['{c_name}']['{TOOLKIT_OPTIONS_KEY}'] must be a dictionary. "
+            "Please check your settings.py file."
+        )
+
+    unknown_options = set(options) - set(_DEFAULT_TOOLKIT_OPTIONS)
+    if unknown_options:
+        raise ValueError(
+            f"Unknown options in OPENSEARCH_CLUSTERS['{c_name}']['{TOOLKIT_OPTIONS_KEY}']: "
+            f"{sorted(unknown_options)}. Please check your settings.py file."
+        )
+
+    prefill_connections = options.get("prefill_connections", 0)
+    if not isinstance(prefill_connections, int) or prefill_connections < 0:
+        raise ValueError(
+            f"OPENSEARCH_CLUSTERS['{c_name}']['{TOOLKIT_OPTIONS_KEY}']['prefill_connections'] must be a "
+            "non-negative integer. Please check your settings.py file."
+        )
+
+    return {**_DEFAULT_TOOLKIT_OPTIONS, **options}
@@ -0,0 +1,3 @@
+"""Tools to write data into OpenSearch indices efficiently."""
+
+from .bulk_writer import BulkWriterStats, OpenSearchBulkWriter
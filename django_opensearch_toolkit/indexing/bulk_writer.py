@@ -0,0 +1,427 @@
+"""Buffered, parallel writer for the OpenSearch bulk API."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import dataclasses
+from logging import getLogger
+import random
+import threading
+import time
+from typing import Any, Dict, Final, List, Optional, Set, Union
+
+from opensearchpy.client import OpenSearch
+from opensearchpy.connection import connections
+from opensearchpy.exceptions import ConnectionError, TransportError
+from opensearchpy.helpers.document import Document
+from opensearchpy.helpers.errors import BulkIndexError
+from opensearchpy.serializer import serializer
+
+from django_opensearch_toolkit.signals import index_written
+
+
+_logger = getLogger(__name__)
+
+# HTTP statuses worth retrying: the cluster is overloaded or temporarily unavailable
+_RETRYABLE_STATUSES: Final[Set[int]] = {429, 502, 503, 504}
+
+# Maximum number of item errors kept in memory for reporting
+_MAX_ERRORS_TO_KEEP: Final[int] = 100
+
+
+@dataclasses.dataclass(frozen=True)
+class BulkWriterStats:
+    """Snapshot of the counters of an OpenSearchBulkWriter."""
+
+    actions_submitted: int
+    actions_succeeded: int
+    actions_failed: int
+    bulk_requests: int
+    retries: int
+    bytes_sent: int
+    elapsed_seconds: float
+
+    @property
+    def actions_per_second(self) -> float:
+        """Throughput of successfully written actions since the first action was submitted."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.actions_succeeded / self.elapsed_seconds
+
+
+@dataclasses.dataclass(frozen=True)
+class _BulkAction:
+    """A single serialized bulk action (the action line plus the optional source line)."""
+
+    op_type: str
+    index: str
+    payload: bytes
+
+
+class OpenSearchBulkWriter:
+    """Buffers index/update/delete actions and writes them with the bulk API.
+
+    Actions are buffered and flushed as a single bulk request when the buffer
+    reaches `max_actions` actions or `max_bytes` bytes, or when `flush_interval`
+    seconds have passed since the last flush. Flushes run on a bounded thread
+    pool. Once `max_pending_flushes` flushes are queued or in-flight, adding
+    more actions blocks until one completes (back-pressure).
+
+    Requests or individual actions rejected because the cluster is overloaded
+    (e.g., HTTP 429) are retried with exponential backoff and full jitter.
+
+    NOTE: flushes run concurrently, so actions on the same document in different
+    flushes may be applied out of order. Use max_workers=1 if that matters.
+
+    Usage:
+        with OpenSearchBulkWriter("cluster_name") as writer:
+            for merchant in merchants:
+                writer.index(merchant)
+        print(writer.stats())
+
+    Exiting the context (or calling close()) flushes the remaining actions and
+    waits for all flushes to complete. If any action failed, and raise_on_error
+    is set, a BulkIndexError is then raised.
+    """
+
+    def __init__(
+        self,
+        connection_name: str,
+        max_actions: int = 1_000,
+        max_bytes: int = 10 * 1024 * 1024,
+        flush_interval: Optional[float] = None,
+        max_workers: int = 4,
+        max_pending_flushes: Optional[int] = None,
+        max_retries: int = 5,
+        initial_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        raise_on_error: bool = True,
+        bulk_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            connection_name: The name of the OpenSearch connection to write to.
+            max_actions: Flush when this many actions are buffered.
+            max_bytes: Flush when the serialized actions in the buffer reach this size.
+            flush_interval: If set, flush buffered actions at least this often (in seconds).
+            max_workers: Maximum number of bulk requests in-flight at a time.
+            max_pending_flushes: Maximum number of flushes queued or in-flight before adding
+                actions blocks. Defaults to twice the number of workers.
+            max_retries: Maximum number of retries of a request or action.
+            initial_backoff: Backoff (in seconds) before the first retry. It doubles on each retry.
+            max_backoff: Maximum backoff (in seconds) before any retry.
+            raise_on_error: Whether close() raises a BulkIndexError if any action failed.
+            bulk_kwargs: Additional keyword arguments for each call to OpenSearch.bulk().
+        """
+        if max_actions < 1 or max_bytes < 1 or max_workers < 1:
+            raise ValueError("max_actions, max_bytes and max_workers must be positive")
+
+        self.connection_name: Final[str] = connection_name
+        self.max_actions: Final[int] = max_actions
+        self.max_bytes: Final[int] = max_bytes
+        self.flush_interval: Final[Optional[float]] = flush_interval
+        self.max_workers: Final[int] = max_workers
+        self.max_retries: Final[int] = max_retries
+        self.initial_backoff: Final[float] = initial_backoff
+        self.max_backoff: Final[float] = max_backoff
+        self.raise_on_error: Final[bool] = raise_on_error
+        self.bulk_kwargs: Final[Dict[str, Any]] = dict(bulk_kwargs or {})
+        self.client: Final[OpenSearch] = connections.get_connection(self.connection_name)
+
+        # Buffer of actions for the next flush
+        self._lock = threading.Lock()
+        self._buffer: List[_BulkAction] = []
+        self._buffer_bytes = 0
+        self._last_flush_at = time.monotonic()
+
+        # Flushes
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending_flushes = threading.BoundedSemaphore(max_pending_flushes or 2 * max_workers)
+        self._futures: Set["Future[None]"] = set()
+        self._closed = False
+        self._flush_timer_stop = threading.Event()
+        self._flush_timer: Optional[threading.Thread] = None
+
+        # Counters
+        self._stats_lock = threading.Lock()
+        self._started_at: Optional[float] = None
+        self._actions_submitted = 0
+        self._actions_succeeded = 0
+        self._actions_failed = 0
+        self._bulk_requests = 0
+        self._retries = 0
+        self._bytes_sent = 0
+        self._errors: List[Dict[str, Any]] = []
+
+    def __enter__(self) -> "OpenSearchBulkWriter":
+        """Enter the context."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        """Close the writer when leaving the context."""
+        self.close()
+
+    # Public Methods
+
+    def index(
+        self,
+        document: Union[Document, Dict[str, Any]],
+        *,
+        index: Optional[str] = None,
+        id: Optional[str] = None,
+        **meta: Any,
+    ) -> None:
+        """Add an action to create or overwrite a document.
+
+        Args:
+            document: A Document instance, or the source of the document as a dict.
+            index: The index to write to. Defaults to the Document's index.
+            id: The id of the document. Defaults to the Document's id, if it has one.
+            meta: Any other metadata for the action (e.g., routing).
+        """
+        index, id, source = self._unpack_document(document, index, id)
+        self._add("index", source, _index=index, _id=id, **meta)
+
+    def update(
+        self,
+        document: Union[Document, Dict[str, Any]],
+        *,
+        index: Optional[str] = None,
+        id: Optional[str] = None,
+        doc_as_upsert: bool = False,
+        **meta: Any,
+    ) -> None:
+        """Add an action to partially update a document.
+
+        Args:
+            document: A Document instance, or a dict with the fields to update.
+            index: The index to write to. Defaults to the Document's index.
+            id: The id of the document. Defaults to the Document's id.
+            doc_as_upsert: Whether to create the document if it doesn't exist.
+            meta: Any other metadata for the action (e.g., routing).
+        """
+        index, id, source = self._unpack_document(document, index, id)
+        if id is None:
+            raise ValueError("An id is required to update a document")
+        self._add("update", {"doc": source, "doc_as_upsert": doc_as_upsert}, _index=index, _id=id, **meta)
+
+    def delete(self, *, index: str, id: str, **meta: Any) -> None:
+        """Add an action to delete a document. Deleting a missing document is not an error."""
+        self._add("delete", None, _index=index, _id=id, **meta)
+
+    def flush(self, wait: bool = False) -> None:
+        """Flush the buffered actions, optionally waiting for all flushes to complete."""
+        with self._lock:
+            batch = self._take_buffer_locked()
+        if batch:
+            self._submit(batch)
+        if wait:
+            self._wait_for_flushes()
+
+    def close(self) -> None:
+        """Flush the remaining actions, wait for all flushes to complete and release the thread pool.
+
+        Raises:
+            BulkIndexError: if any action failed and raise_on_error is set.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            batch = self._take_buffer_locked()
+
+        self._flush_timer_stop.set()
+        if self._flush_timer is not None:
+            self._flush_timer.join()
+
+        # The final batch is sent from the caller's thread, since there is nothing left to overlap with
+        if batch:
+            self._send(batch)
+        self._wait_for_flushes()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+        stats = self.stats()
+        _logger.info(
+            f"[{self.__class__.__name__}] [{self.connection_name}] Wrote {stats.actions_succeeded} actions "
+            f"({stats.actions_failed} failed) in {stats.bulk_requests} requests "
+            f"at {stats.actions_per_second:.0f} actions/s"
+        )
+        if self.raise_on_error and stats.actions_failed > 0:
+            raise BulkIndexError(f"{stats.actions_failed} bulk action(s) failed", self.errors())
+
+    def stats(self) -> BulkWriterStats:
+        """Return a snapshot of the writer's counters."""
+        with self._stats_lock:
+            return BulkWriterStats(
+                actions_submitted=self._actions_submitted,
+                actions_succeeded=self._actions_succeeded,
+                actions_failed=self._actions_failed,
+                bulk_requests=self._bulk_requests,
+                retries=self._retries,
+                bytes_sent=self._bytes_sent,
+                elapsed_seconds=(time.monotonic() - self._started_at) if self._started_at else 0.0,
+            )
+
+    def errors(self) -> List[Dict[str, Any]]:
+        """Return (up to the first 100) errors of failed actions."""
+        with self._stats_lock:
+            return list(self._errors)
+
+    # Private Methods
+
+    @staticmethod
+    def _unpack_document(
+        document: Union[Document, Dict[str, Any]],
+        index: Optional[str],
+        id: Optional[str],
+    ) -> Any:
+        """Return the index, id and source of a document."""
+        if isinstance(document, Document):
+            index = document._get_index(index)
+            if id is None:
+                id = getattr(document.meta, "id", None)
+            return index, id, document.to_dict()
+        if index is None:
+            raise ValueError("An index is required when the document is a dict")
+        return index, id, document
+
+    def _add(self, op_type: str, source: Optional[Dict[str, Any]], **meta: Any) -> None:
+        """Serialize an action and add it to the buffer, flushing if it's full."""
+        action_meta = {k: v for k, v in meta.items() if v is not None}
+        lines = [serializer.dumps({op_type: action_meta})]
+        if source is not None:
+            lines.append(serializer.dumps(source))
+        action = _BulkAction(
+            op_type=op_type,
+            index=meta["_index"],
+            payload=("\n".join(lines) + "\n").encode("utf-8"),
+        )
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot add actions to a closed OpenSearchBulkWriter")
+            with self._stats_lock:
+                if self._started_at is None:
+                    self._started_at = time.monotonic()
+                self._actions_submitted += 1
+            self._buffer.append(action)
+            self._buffer_bytes += len(action.payload)
+            batch = None
+            if len(self._buffer) >= self.max_actions or self._buffer_bytes >= self.max_bytes:
+                batch = self._take_buffer_locked()
+            self._start_flush_timer_locked()
+        if batch:
+            self._submit(batch)
+
+    def _take_buffer_locked(self) -> List[_BulkAction]:
+        """Empty the buffer and return its actions. The caller must hold self._lock."""
+        batch = self._buffer
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._last_flush_at = time.monotonic()
+        return batch
+
+    def _start_flush_timer_locked(self) -> None:
+        """Start the thread that flushes the buffer periodically, if configured. Requires self._lock."""
+        if self.flush_interval is None or self._flush_timer is not None:
+            return
+
+        def _run() -> None:
+            assert self.flush_interval is not None
+            while not self._flush_timer_stop.wait(self.flush_interval / 2):
+                with self._lock:
+                    batch = None
+                    if self._buffer and time.monotonic() - self._last_flush_at >= self.flush_interval:
+                        batch = self._take_buffer_locked()
+                if batch:
+                    self._submit(batch)
+
+        self._flush_timer = threading.Thread(
+            target=_run, name="OpenSearchBulkWriter-flush-timer", daemon=True
+        )
+        self._flush_timer.start()
+
+    def _submit(self, batch: List[_BulkAction]) -> None:
+        """Send a batch on the thread pool, blocking while too many flushes are pending."""
+        self._pending_flushes.acquire()
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="OpenSearchBulkWriter",
+                )
+            future = self._executor.submit(self._send, batch)
+            self._futures.add(future)
+
+        def _on_done(f: "Future[None]") -> None:
+            with self._lock:
+                self._futures.discard(f)
+            self._pending_flushes.release()
+
+        future.add_done_callback(_on_done)
+
+    def _wait_for_flushes(self) -> None:
+        """Block until all submitted flushes have completed."""
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.result()
+
+    def _backoff(self, attempt: int) -> None:
+        """Sleep before a retry, using exponential backoff with full jitter."""
+        time.sleep(random.uniform(0, min(self.max_backoff, self.initial_backoff * (2**attempt))))
+
+    def _send(self, batch: List[_BulkAction]) -> None:
+        """Send a batch with the bulk API, retrying rejected requests and actions."""
+        pending = batch
+        attempt = 0
+        while pending:
+            body = b"".join(action.payload for action in pending)
+            try:
+                response = self.client.bulk(body=body, **self.bulk_kwargs)
+            except TransportError as e:
+                retryable = isinstance(e, ConnectionError) or e.status_code in _RETRYABLE_STATUSES
+                if retryable and attempt < self.max_retries:
+                    self._record_retries(len(pending))
+                    self._backoff(attempt)
+                    attempt += 1
+                    continue
+                _logger.exception(f"[{self.__class__.__name__}] [{self.connection_name}] Bulk request failed")
+                self._record_results(len(body), succeeded=0, errors=[{"error": str(e)} for _ in pending])
+                return
+
+            succeeded = 0
+            errors = []
+            to_retry = []
+            written_indices: Set[str] = set()
+            for action, item in zip(pending, response["items"]):
+                result = next(iter(item.values()))
+                status = result.get("status", 500)
+                if 200 <= status < 300 or (action.op_type == "delete" and status == 404):
+                    succeeded += 1
+                    written_indices.add(action.index)
+                elif status in _RETRYABLE_STATUSES and attempt < self.max_retries:
+                    to_retry.append(action)
+                else:
+                    errors.append(item)
+            self._record_results(len(body), succeeded=succeeded, errors=errors)
+            for index in sorted(written_indices):
+                index_written.send(sender=self.__class__, connection_name=self.connection_name, index=index)
+
+            pending = to_retry
+            if pending:
+                self._record_retries(len(pending))
+                self._backoff(attempt)
+                attempt += 1
+
+    def _record_retries(self, num_actions: int) -> None:
+        with self._stats_lock:
+            self._retries += num_actions
+
+    def _record_results(self, num_bytes: int, succeeded: int, errors: List[Dict[str, Any]]) -> None:
+        with self._stats_lock:
+            self._bulk_requests += 1
+            self._bytes_sent += num_bytes
+            self._actions_succeeded += succeeded
+            self._actions_failed += len(errors)
+            self._errors.extend(errors[: _MAX_ERRORS_TO_KEEP - len(self._errors)])
@@ -0,0 +1,191 @@
+"""Copy (and optionally transform) the documents of one index into another."""
+
+from concurrent.futures import ThreadPoolExecutor, wait
+import dataclasses
+from logging import getLogger
+import threading
+import time
+from typing import Any, Callable, Dict, Final, List, Optional, Union
+
+from opensearchpy.client import OpenSearch
+from opensearchpy.connection import connections
+from opensearchpy.helpers.actions import scan
+
+from django_opensearch_toolkit.indexing.bulk_writer import OpenSearchBulkWriter
+from django_opensearch_toolkit.indexing.tasks import TaskProgress, wait_for_task
+from django_opensearch_toolkit.signals import index_written
+
+
+_logger = getLogger(__name__)
+
+# Transforms a hit (with `_id`, `_source`, etc.) into the source of the new document, or None to skip it
+Transform = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+@dataclasses.dataclass(frozen=True)
+class ReindexResult:
+    """Outcome of a reindex."""
+
+    docs: int  # number of source documents processed
+    failures: List[Any]
+    elapsed_seconds: float
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether all documents were reindexed."""
+        return len(self.failures) == 0
+
+    @property
+    def docs_per_second(self) -> float:
+        """Throughput of the reindex."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.docs / self.elapsed_seconds
+
+
+class OpenSearchReindexer:
+    """Copy the documents of one index into another, within a single cluster.
+
+    Without a transform, this uses the server-side _reindex API with sliced
+    parallelism and optional throttling, and polls the task for progress.
+
+    With a transform, documents are read client-side with a sliced scroll (one
+    thread per slice), passed through the transform, and written with a
+    parallel OpenSearchBulkWriter.
+    """
+
+    def __init__(self, connection_name: str, poll_interval: float = 10.0) -> None:
+        self.connection_name: Final[str] = connection_name
+        self.poll_interval: Final[float] = poll_interval
+        self.client: Final[OpenSearch] = connections.get_connection(self.connection_name)
+
+    # Public Methods
+
+    def reindex(
+        self,
+        source: str,
+        dest: str,
+        query: Optional[Dict[str, Any]] = None,
+        transform: Optional[Transform] = None,
+        slices: Union[int, str] = "auto",
+        requests_per_second: Optional[float] = None,
+        batch_size: int = 1_000,
+        max_workers: int = 4,
+    ) -> ReindexResult:
+        """Copy the documents of `source` (optionally matching `query`) into `dest`.
+
+        Args:
+            source: The index (or alias) to read from.
+            dest: The index (or alias) to write to.
+            query: Optional query to select which documents to copy.
+            transform: Optional function applied to each hit client-side.
+            slices: Number of slices to read in parallel, or "auto" to use one per shard
+                (server-side only; client-side defaults to one slice per worker).
+            requests_per_second: Throttle for the server-side reindex. Unthrottled by default.
+            batch_size: Number of documents read per batch.
+            max_workers: Maximum number of concurrent bulk requests (client-side only).
+        """
+        if transform is None:
+            return self._reindex_server_side(source, dest, query, slices, requests_per_second, batch_size)
+        num_slices = slices if isinstance(slices, int) else max_workers
+        return self._reindex_client_side(source, dest, query, transform, num_slices, batch_size, max_workers)
+
+    # Private Methods
+
+    def _log(self, message: str) -> None:
+        """Log message with a custom prefix."""
+        _logger.info(f"[{self.__class__.__name__}] [{self.connection_name}] {message}")
+
+    def _reindex_server_side(
+        self,
+        source: str,
+        dest: str,
+        query: Optional[Dict[str, Any]],
+        slices: Union[int, str],
+        requests_per_second: Optional[float],
+        batch_size: int,
+    ) -> ReindexResult:
+        """Reindex with the _reindex API, polling the task until it completes."""
+        body: Dict[str, Any] = {"source": {"index": source, "size": batch_size}, "dest": {"index": dest}}
+        if query is not None:
+            body["source"]["query"] = query
+
+        response = self.client.reindex(
+            body=body,
+            slices=slices,
+            requests_per_second=requests_per_second if requests_per_second is not None else -1,
+            wait_for_completion=False,
+        )
+        task_id = response["task"]
+        self._log(f"Started server-side reindex of {source} into {dest} (task={task_id})")
+
+        result = wait_for_task(
+            self.client,
+            task_id,
+            poll_interval=self.poll_interval,
+            on_progress=lambda progress: self._log(progress.describe()),
+        )
+        failures = list(result.failures) + ([result.error] if result.error is not None else [])
+        if result.progress.done > 0:
+            index_written.send(sender=self.__class__, connection_name=self.connection_name, index=dest)
+        return ReindexResult(
+            docs=result.progress.done,
+            failures=failures,
+            elapsed_seconds=result.progress.elapsed_seconds,
+        )
+
+    def _reindex_client_side(
+        self,
+        source: str,
+        dest: str,
+        query: Optional[Dict[str, Any]],
+        transform: Transform,
+        num_slices: int,
+        batch_size: int,
+        max_workers: int,
+    ) -> ReindexResult:
+        """Reindex with a sliced scroll, a transform, and a parallel bulk writer."""
+        total = self.client.count(index=source, body={"query": query} if query is not None else None)["count"]
+        self._log(
+            f"Started client-side reindex of {total} docs from {source} into {dest} ({num_slices} slices)"
+        )
+
+        processed = 0
+        processed_lock = threading.Lock()
+        started_at = time.monotonic()
+
+        def _read_slice(writer: OpenSearchBulkWriter, slice_id: int) -> None:
+            nonlocal processed
+            slice_query: Dict[str, Any] = {"query": query} if query is not None else {}
+            if num_slices > 1:
+                slice_query["slice"] = {"id": slice_id, "max": num_slices}
+            for hit in scan(self.client, index=source, query=slice_query, size=batch_size):
+                new_source = transform(hit)
+                if new_source is not None:
+                    writer.index(new_source, index=dest, id=hit["_id"], routing=hit.get("_routing"))
+                with processed_lock:
+                    processed += 1
+
+        writer = OpenSearchBulkWriter(
+            self.connection_name,
+            max_actions=batch_size,
+            max_workers=max_workers,
+            raise_on_error=False,
+        )
+        try:
+            with ThreadPoolExecutor(max_workers=num_slices, thread_name_prefix="OpenSearchReindexer") as pool:
+                futures = [pool.submit(_read_slice, writer, slice_id) for slice_id in range(num_slices)]
+                pending = set(futures)
+                while pending:
+                    _, pending = wait(pending, timeout=self.poll_interval)
+                    self._log(TaskProgress(total, processed, time.monotonic() - started_at).describe())
+                for f in futures:
+                    f.result()  # re-raise any error from reading a slice
+        finally:
+            writer.close()
+
+        return ReindexResult(
+            docs=processed,
+            failures=writer.errors(),
+            elapsed_seconds=time.monotonic() - started_at,
+        )
@@ -0,0 +1,93 @@
+"""Helpers to track long-running OpenSearch tasks (e.g., _reindex, _update_by_query)."""
+
+import dataclasses
+from logging import getLogger
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from opensearchpy.client import OpenSearch
+
+
+_logger = getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class TaskProgress:
+    """Progress of a document-processing task, as reported by the tasks API."""
+
+    total: int
+    done: int
+    elapsed_seconds: float
+
+    @property
+    def docs_per_second(self) -> float:
+        """Throughput since the task started."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.done / self.elapsed_seconds
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated time until completion, if it can be estimated."""
+        if self.docs_per_second <= 0 or self.total <= 0:
+            return None
+        return max(0, self.total - self.done) / self.docs_per_second
+
+    def describe(self) -> str:
+        """Return a human-readable summary of the progress."""
+        percent = f" ({100 * self.done / self.total:.1f}%)" if self.total > 0 else ""
+        eta = f", ETA {self.eta_seconds:.0f}s" if self.eta_seconds is not None else ""
+        return f"{self.done}/{self.total} docs{percent} at {self.docs_per_second:.0f} docs/s{eta}"
+
+
+@dataclasses.dataclass(frozen=True)
+class TaskResult:
+    """Outcome of a completed task."""
+
+    task_id: str
+    completed: bool
+    progress: TaskProgress
+    failures: List[Any]
+    error: Optional[Dict[str, Any]]
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the task completed without errors or failures."""
+        return self.completed and self.error is None and len(self.failures) == 0
+
+
+def get_task_result(client: OpenSearch, task_id: str) -> TaskResult:
+    """Fetch the current state of a task from the tasks API."""
+    response = client.tasks.get(task_id=task_id)
+    task = response.get("task", {})
+    status = task.get("status", {})
+    done = sum(status.get(k, 0) for k in ("created", "updated", "deleted", "noops", "version_conflicts"))
+    progress = TaskProgress(
+        total=status.get("total", 0),
+        done=done,
+        elapsed_seconds=task.get("running_time_in_nanos", 0) / 1e9,
+    )
+    task_response = response.get("response", {})
+    return TaskResult(
+        task_id=task_id,
+        completed=response.get("completed", False),
+        progress=progress,
+        failures=task_response.get("failures", []),
+        error=response.get("error"),
+    )
+
+
+def wait_for_task(
+    client: OpenSearch,
+    task_id: str,
+    poll_interval: float = 10.0,
+    on_progress: Optional[Callable[[TaskProgress], None]] = None,
+) -> TaskResult:
+    """Poll a task until it completes, reporting its progress after each poll."""
+    while True:
+        result = get_task_result(client, task_id)
+        if on_progress is not None:
+            on_progress(result.progress)
+        if result.completed:
+            return result
+        time.sleep(poll_interval)
@@ -0,0 +1,215 @@
+"""Unit tests for OpenSearchBulkWriter."""
+
+import json
+import threading
+import time
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+from opensearchpy.exceptions import TransportError
+from opensearchpy.helpers.document import Document
+from opensearchpy.helpers.errors import BulkIndexError
+from opensearchpy.helpers.field import Keyword
+
+from django_opensearch_toolkit.indexing import OpenSearchBulkWriter
+from django_opensearch_toolkit.signals import index_written
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+class SampleDocument(Document):
+    """Document for unit tests."""
+
+    name = Keyword()
+
+    class Index:
+        name = "sample_documents"
+
+
+def _parse_body(body: bytes) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in body.decode("utf-8").splitlines()]
+
+
+def _bulk_response(*statuses: int) -> Dict[str, Any]:
+    return {"items": [{"index": {"status": status}} for status in statuses]}
+
+
+def _ok_response(body: bytes) -> Dict[str, Any]:
+    actions = [line for line in _parse_body(body) if set(line) <= {"index", "update", "delete"}]
+    return {"items": [{op: {"status": 200}} for action in actions for op in action]}
+
+
+class OpenSearchBulkWriterTest(MagicMockOpenSearchTestCase):
+    """Unit tests for OpenSearchBulkWriter."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.bulk.side_effect = _ok_response
+
+    def _writer(self, **kwargs: Any) -> OpenSearchBulkWriter:
+        kwargs.setdefault("initial_backoff", 0)
+        return OpenSearchBulkWriter(self.unittest_connection, **kwargs)
+
+    def test_actions_are_serialized(self) -> None:
+        with self._writer() as writer:
+            writer.index(SampleDocument(name="n1", meta={"id": "1"}))
+            writer.index({"name": "n2"}, index="other_index")
+            writer.update({"name": "n3"}, id="3", index="other_index", doc_as_upsert=True)
+            writer.delete(id="4", index="other_index")
+
+        self.test_client.bulk.assert_called_once()
+        self.assertListEqual(
+            _parse_body(self.test_client.bulk.call_args.kwargs["body"]),
+            [
+                {"index": {"_index": "sample_documents", "_id": "1"}},
+                {"name": "n1"},
+                {"index": {"_index": "other_index"}},
+                {"name": "n2"},
+                {"update": {"_index": "other_index", "_id": "3"}},
+                {"doc": {"name": "n3"}, "doc_as_upsert": True},
+                {"delete": {"_index": "other_index", "_id": "4"}},
+            ],
+        )
+        stats = writer.stats()
+        self.assertEqual(stats.actions_submitted, 4)
+        self.assertEqual(stats.actions_succeeded, 4)
+        self.assertEqual(stats.actions_failed, 0)
+        self.assertEqual(stats.bulk_requests, 1)
+
+    def test_flush_by_count(self) -> None:
+        with self._writer(max_actions=10) as writer:
+            for i in range(25):
+                writer.index({"i": i}, index="idx")
+        self.assertEqual(self.test_client.bulk.call_count, 3)
+        self.assertEqual(writer.stats().actions_succeeded, 25)
+
+    def test_flush_by_bytes(self) -> None:
+        with self._writer(max_bytes=100) as writer:
+            for i in range(10):
+                writer.index({"value": "x" * 100}, index="idx")
+        self.assertEqual(self.test_client.bulk.call_count, 10)
+
+    def test_flush_by_interval(self) -> None:
+        flushed = threading.Event()
+
+        def _bulk(body: bytes) -> Dict[str, Any]:
+            flushed.set()
+            return _bulk_response(201)
+
+        self.test_client.bulk.side_effect = _bulk
+        with self._writer(flush_interval=0.05) as writer:
+            writer.index({"i": 1}, index="idx")
+            self.assertTrue(flushed.wait(timeout=5))
+        self.assertEqual(self.test_client.bulk.call_count, 1)
+
+    def test_rejected_actions_are_retried(self) -> None:
+        self.test_client.bulk.side_effect = [
+            _bulk_response(201, 429, 429),
+            _bulk_response(429, 201),
+            _bulk_response(201),
+        ]
+        with self._writer() as writer:
+            for i in range(3):
+                writer.index({"i": i}, index="idx")
+
+        bodies = [_parse_body(c.kwargs["body"]) for c in self.test_client.bulk.call_args_list]
+        self.assertListEqual([len(body) for body in bodies], [6, 4, 2])
+        self.assertListEqual(bodies[2], [{"index": {"_index": "idx"}}, {"i": 1}])
+        stats = writer.stats()
+        self.assertEqual(stats.actions_succeeded, 3)
+        self.assertEqual(stats.retries, 3)
+        self.assertEqual(stats.bulk_requests, 3)
+
+    def test_rejected_requests_are_retried(self) -> None:
+        self.test_client.bulk.side_effect = [TransportError(429, "rejected"), _bulk_response(201)]
+        with self._writer() as writer:
+            writer.index({"i": 1}, index="idx")
+        self.assertEqual(self.test_client.bulk.call_count, 2)
+        self.assertEqual(writer.stats().actions_succeeded, 1)
+
+    def test_failures_raise_on_close(self) -> None:
+        self.test_client.bulk.side_effect = [
+            {"items": [{"index": {"status": 201}}, {"index": {"status": 400, "error": "mapping"}}]}
+        ]
+        writer = self._writer()
+        writer.index({"i": 1}, index="idx")
+        writer.index({"i": 2}, index="idx")
+        with self.assertRaises(BulkIndexError) as cm:
+            writer.close()
+        self.assertListEqual(cm.exception.errors, [{"index": {"status": 400, "error": "mapping"}}])
+        self.assertEqual(writer.stats().actions_failed, 1)
+
+    def test_retries_are_bounded(self) -> None:
+        self.test_client.bulk.side_effect = lambda body: _bulk_response(429)
+        writer = self._writer(max_retries=2, raise_on_error=False)
+        writer.index({"i": 1}, index="idx")
+        writer.close()
+        self.assertEqual(self.test_client.bulk.call_count, 3)
+        self.assertEqual(writer.stats().actions_failed, 1)
+
+    def test_index_written_is_sent(self) -> None:
+        """Test that index_written is sent once per index with successful actions, per bulk request."""
+        self.test_client.bulk.side_effect = lambda body: {
+            "items": [{"index": {"status": 200}}, {"index": {"status": 400}}, {"index": {"status": 201}}]
+        }
+        receiver = MagicMock()
+        index_written.connect(receiver)
+        self.addCleanup(index_written.disconnect, receiver)
+        with self.assertRaises(BulkIndexError):
+            with self._writer() as writer:
+                writer.index({"name": "n1"}, index="index_a")
+                writer.index({"name": "n2"}, index="index_b")  # fails
+                writer.index({"name": "n3"}, index="index_c")
+
+        self.assertListEqual(
+            [c.kwargs["index"] for c in receiver.call_args_list],
+            ["index_a", "index_c"],
+        )
+        self.assertEqual(receiver.call_args.kwargs["connection_name"], self.unittest_connection)
+
+    def test_delete_missing_document_is_not_an_error(self) -> None:
+        self.test_client.bulk.side_effect = [{"items": [{"delete": {"status": 404}}]}]
+        with self._writer() as writer:
+            writer.delete(id="1", index="idx")
+        self.assertEqual(writer.stats().actions_succeeded, 1)
+
+    def test_back_pressure(self) -> None:
+        release = threading.Event()
+        in_flight: List[int] = []
+
+        def _bulk(body: bytes) -> Dict[str, Any]:
+            in_flight.append(1)
+            release.wait(timeout=5)
+            return _bulk_response(201)
+
+        self.test_client.bulk.side_effect = _bulk
+        writer = self._writer(max_actions=1, max_workers=1, max_pending_flushes=2)
+        writer.index({"i": 1}, index="idx")
+        writer.index({"i": 2}, index="idx")
+
+        # The third flush blocks until a pending one completes
+        third = threading.Thread(target=writer.index, args=({"i": 3},), kwargs={"index": "idx"})
+        third.start()
+        time.sleep(0.05)
+        self.assertTrue(third.is_alive())
+
+        release.set()
+        third.join(timeout=5)
+        self.assertFalse(third.is_alive())
+        writer.close()
+        self.assertEqual(writer.stats().actions_succeeded, 3)
+
+    def test_closed_writer(self) -> None:
+        writer = self._writer()
+        writer.close()
+        with self.assertRaises(RuntimeError):
+            writer.index({"i": 1}, index="idx")
+        self.assertEqual(writer.stats().actions_submitted, 0)
+
+    def test_index_and_id_are_keyword_only(self) -> None:
+        with self._writer() as writer:
+            with self.assertRaises(TypeError):
+                writer.update({"name": "n1"}, "idx")  # type: ignore[misc]
+            with self.assertRaises(TypeError):
+                writer.delete("1", "idx")  # type: ignore[misc]
+        self.assertEqual(writer.stats().actions_submitted, 0)
@@ -0,0 +1,147 @@
+"""Unit tests for OpenSearchReindexer and the task helpers."""
+
+import json
+from typing import Any, Dict, List, Optional
+
+from django_opensearch_toolkit.indexing.reindexer import OpenSearchReindexer
+from django_opensearch_toolkit.indexing.tasks import TaskProgress
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+def _parse_body(body: bytes) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in body.decode("utf-8").splitlines()]
+
+
+def _ok_response(body: bytes) -> Dict[str, Any]:
+    actions = [line for line in _parse_body(body) if set(line) <= {"index", "update", "delete"}]
+    return {"items": [{op: {"status": 200}} for action in actions for op in action]}
+
+
+def _search_response(hits: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "_scroll_id": "scroll",
+        "_shards": {"total": 1, "successful": 1, "skipped": 0, "failed": 0},
+        "hits": {"hits": hits},
+    }
+
+
+def _task_response(
+    completed: bool, done: int, total: int, failures: Optional[List[Any]] = None
+) -> Dict[str, Any]:
+    return {
+        "completed": completed,
+        "task": {"status": {"total": total, "created": done}, "running_time_in_nanos": 2 * 10**9},
+        "response": {"failures": failures or []},
+    }
+
+
+def uppercase_name(hit: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Transform used in unit tests: uppercase names, and skip hidden documents."""
+    if hit["_source"].get("hidden"):
+        return None
+    return {"name": hit["_source"]["name"].upper()}
+
+
+class TaskProgressTest(MagicMockOpenSearchTestCase):
+    """Unit tests for TaskProgress."""
+
+    def test_rate_and_eta(self) -> None:
+        progress = TaskProgress(total=100, done=20, elapsed_seconds=2)
+        self.assertEqual(progress.docs_per_second, 10)
+        self.assertEqual(progress.eta_seconds, 8)
+        self.assertEqual(progress.describe(), "20/100 docs (20.0%) at 10 docs/s, ETA 8s")
+
+    def test_no_progress(self) -> None:
+        progress = TaskProgress(total=0, done=0, elapsed_seconds=0)
+        self.assertIsNone(progress.eta_seconds)
+        self.assertEqual(progress.describe(), "0/0 docs at 0 docs/s")
+
+
+class OpenSearchReindexerTest(MagicMockOpenSearchTestCase):
+    """Unit tests for OpenSearchReindexer."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.bulk.side_effect = _ok_response
+        self.test_client.scroll.return_value = _search_response([])
+        self.reindexer = OpenSearchReindexer(self.unittest_connection, poll_interval=0)
+
+    def test_server_side(self) -> None:
+        self.test_client.reindex.return_value = {"task": "node:1"}
+        self.test_client.tasks.get.side_effect = [
+            _task_response(completed=False, done=5, total=10),
+            _task_response(completed=True, done=10, total=10),
+        ]
+
+        result = self.reindexer.reindex("src", "dest", slices="auto", requests_per_second=500)
+
+        self.assertTrue(result.succeeded)
+        self.assertEqual(result.docs, 10)
+        self.assertEqual(self.test_client.tasks.get.call_count, 2)
+        self.test_client.reindex.assert_called_once_with(
+            body={"source": {"index": "src", "size": 1000}, "dest": {"index": "dest"}},
+            slices="auto",
+            requests_per_second=500,
+            wait_for_completion=False,
+        )
+        self.test_client.search.assert_not_called()
+
+    def test_server_side_failures(self) -> None:
+        self.test_client.reindex.return_value = {"task": "node:1"}
+        self.test_client.tasks.get.return_value = _task_response(
+            completed=True, done=9, total=10, failures=[{"id": "1"}]
+        )
+
+        result = self.reindexer.reindex("src", "dest", requests_per_second=None)
+
+        self.assertFalse(result.succeeded)
+        self.assertListEqual(result.failures, [{"id": "1"}])
+        self.assertEqual(self.test_client.reindex.call_args.kwargs["requests_per_second"], -1)
+
+    def test_client_side_with_transform(self) -> None:
+        hits_by_slice = {
+            0: [
+                {"_id": "1", "_source": {"name": "a"}},
+                {"_id": "2", "_source": {"name": "b", "hidden": True}},
+            ],
+            1: [{"_id": "3", "_source": {"name": "c"}, "_routing": "r"}],
+        }
+        self.test_client.count.return_value = {"count": 3}
+        self.test_client.search.side_effect = lambda body, **kwargs: _search_response(
+            hits_by_slice[body["slice"]["id"]]
+        )
+
+        result = self.reindexer.reindex("src", "dest", transform=uppercase_name, slices=2, batch_size=10)
+
+        self.assertTrue(result.succeeded)
+        self.assertEqual(result.docs, 3)
+        self.assertEqual(self.test_client.search.call_count, 2)
+        self.assertSetEqual(
+            {call.kwargs["body"]["slice"]["max"] for call in self.test_client.search.call_args_list}, {2}
+        )
+        actions = [
+            line for call in self.test_client.bulk.call_args_list for line in _parse_body(call.kwargs["body"])
+        ]
+        self.assertCountEqual(
+            actions,
+            [
+                {"index": {"_index": "dest", "_id": "1"}},
+                {"name": "A"},
+                {"index": {"_index": "dest", "_id": "3", "routing": "r"}},
+                {"name": "C"},
+            ],
+        )
+
+    def test_client_side_single_slice(self) -> None:
+        self.test_client.count.return_value = {"count": 1}
+        self.test_client.search.return_value = _search_response([{"_id": "1", "_source": {"name": "a"}}])
+
+        result = self.reindexer.reindex(
+            "src", "dest", query={"match_all": {}}, transform=uppercase_name, slices=1
+        )
+
+        self.assertEqual(result.docs, 1)
+        body = self.test_client.search.call_args.kwargs["body"]
+        self.assertDictEqual(body["query"], {"match_all": {}})
+        self.assertNotIn("slice", body)
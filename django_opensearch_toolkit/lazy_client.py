@@ -0,0 +1,78 @@
+"""A fork-safe OpenSearch client that is created lazily, once per process.
+
+Pre-fork servers (e.g., gunicorn, uWSGI) import the Django project in a master
+process and then fork workers. Any client (and urllib3 connection pool) created
+in the master before the fork is inherited by every worker, so its sockets end
+up shared between processes. LazyOpenSearch avoids this by building the client
+on first use, and rebuilding it whenever it detects it is running in a different
+process from the one that built it.
+"""
+
+import os
+import threading
+from typing import Any, Optional
+import weakref
+
+from opensearchpy.client import OpenSearch
+from opensearchpy.serializer import serializer
+
+
+class LazyOpenSearch:
+    """Proxy for an OpenSearch client that creates the underlying client on first use in each process.
+
+    All attribute access is forwarded to the underlying client, so instances can
+    be registered with opensearchpy.connection.connections in place of a client.
+    This is a proxy, not an OpenSearch subclass, so `isinstance(client, OpenSearch)`
+    is False for it: use get_client() where the actual client is needed.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._kwargs = kwargs
+        self._client: Optional[OpenSearch] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        _instances.add(self)
+
+    def get_client(self) -> OpenSearch:
+        """Return the client for the current process, creating it if necessary."""
+        pid = os.getpid()
+        client = self._client
+        if client is None or self._pid != pid:
+            with self._lock:
+                if self._client is None or self._pid != pid:
+                    # NOTE: a client inherited from the parent process is discarded rather
+                    # than closed, because closing it would shut down sockets the parent
+                    # process is still using.
+                    self._client = OpenSearch(serializer=serializer, **self._kwargs)
+                    self._pid = pid
+                client = self._client
+        return client
+
+    def has_client(self) -> bool:
+        """Return whether the underlying client was already created in the current process."""
+        return self._client is not None and self._pid == os.getpid()
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward attribute access to the underlying client."""
+        return getattr(self.get_client(), name)
+
+    def _reset_after_fork(self) -> None:
+        """Drop state inherited from the parent process."""
+        self._lock = threading.Lock()
+        self._client = None
+        self._pid = None
+
+
+_instances: "weakref.WeakSet[LazyOpenSearch]" = weakref.WeakSet()
+
+
+def _reset_all_after_fork() -> None:
+    for instance in list(_instances):
+        instance._reset_after_fork()
+
+
+# The PID check in get_client() covers forks made outside of the Python runtime
+# (e.g., by uWSGI); this covers os.fork(), and also resets the locks, which may
+# have been held by another thread at the time of the fork.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_all_after_fork)
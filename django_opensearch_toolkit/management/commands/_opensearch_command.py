@@ -1,23 +1,57 @@
 """Common logic for all custom django-admin (manage.py) commands for the django_opensearch_toolkit."""
 
 import importlib
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Type
 
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
+from opensearchpy.helpers.document import Document
 
 from django_opensearch_toolkit.migration_manager import OpenSearchMigration
 
 
 class OpenSearchCommand(BaseCommand):
-    """Common logic for all custom django-admin (manage.py) commands for the django_opensearch_toolkit."""
+    """Common logic for all custom django-admin (manage.py) commands for the django_opensearch_toolkit.
+
+    Migration modules are only imported when a command asks for the migrations
+    of a cluster (see get_migrations), so commands that don't need them start fast.
+    """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
 
         self.available_clusters = self._get_clusters()
         assert len(self.available_clusters) > 0
-        self.migrations_by_cluster = self._get_migrations_by_cluster(self.available_clusters)
+        self.migration_paths = self._get_migration_paths(self.available_clusters)
+        self.document_paths = self._get_document_paths(self.available_clusters)
+        self._migrations_cache: Dict[str, List[OpenSearchMigration]] = {}
+
+    @property
+    def migrations_by_cluster(self) -> Dict[str, List[OpenSearchMigration]]:
+        """Return the migrations of every cluster with a migration path.
+
+        Prefer get_migrations(), which only imports the migrations of the requested cluster.
+        """
+        return {cluster_name: self.get_migrations(cluster_name) for cluster_name in self.migration_paths}
+
+    def get_migrations(self, cluster_name: str) -> List[OpenSearchMigration]:
+        """Return the (validated) migrations for a cluster, importing them on first use.
+
+        Returns an empty list if the cluster has no migration path.
+        """
+        if cluster_name not in self._migrations_cache:
+            migrations_path = self.migration_paths.get(cluster_name)
+            migrations = self._import_migrations(migrations_path) if migrations_path is not None else []
+            self._migrations_cache[cluster_name] = migrations
+        return self._migrations_cache[cluster_name]
+
+    def get_documents(self, cluster_name: str) -> List[Type[Document]]:
+        """Return the (validated) Document classes for a cluster, importing them.
+
+        Returns an empty list if the cluster has no document path.
+        """
+        documents_path = self.document_paths.get(cluster_name)
+        return self._import_documents(documents_path) if documents_path is not None else []
 
     @staticmethod
     def _get_clusters() -> List[str]:
@@ -42,17 +76,13 @@ class OpenSearchCommand(BaseCommand):
         return available_clusters
 
     @staticmethod
-    def _get_migrations_by_cluster(
-        available_clusters: List[str],
-    ) -> Dict[str, List[OpenSearchMigration]]:
+    def _get_migration_paths(available_clusters: List[str]) -> Dict[str, str]:
         all_migration_paths = getattr(settings, "OPENSEARCH_MIGRATION_PATHS", {})
 
         if not isinstance(all_migration_paths, dict):
             raise CommandError("Invalid value for settings.OPENSEARCH_MIGRATION_PATHS. Must be a dictionary.")
 
-        migrations_by_cluster: Dict[str, List[OpenSearchMigration]] = {}
-
-        for cluster_name, migrations_path in all_migration_paths.items():
+        for cluster_name in all_migration_paths:
             if not isinstance(cluster_name, str):
                 raise CommandError(
                     f"Invalid cluster name '{cluster_name}' for migration paths. "
@@ -63,23 +93,67 @@ class OpenSearchCommand(BaseCommand):
                     f"Cluster '{cluster_name}' in settings.OPENSEARCH_MIGRATION_PATHS is not in "
                     "settings.OPENSEARCH_CLUSTERS."
                 )
-            try:
-                migrations = importlib.import_module(migrations_path).MIGRATIONS
-            except ModuleNotFoundError as e:
-                raise CommandError(f"Module '{migrations_path}' not found") from e
-            except AttributeError as e:
-                raise CommandError(f"Module '{migrations_path}' must contain a 'MIGRATIONS' attribute") from e
-            if not isinstance(migrations, list):
+
+        return all_migration_paths
+
+    @staticmethod
+    def _get_document_paths(available_clusters: List[str]) -> Dict[str, str]:
+        all_document_paths = getattr(settings, "OPENSEARCH_DOCUMENT_PATHS", {})
+
+        if not isinstance(all_document_paths, dict):
+            raise CommandError("Invalid value for settings.OPENSEARCH_DOCUMENT_PATHS. Must be a dictionary.")
+
+        for cluster_name in all_document_paths:
+            if not isinstance(cluster_name, str):
+                raise CommandError(
+                    f"Invalid cluster name '{cluster_name}' for document paths. "
+                    "All cluster names must be strings."
+                )
+            if cluster_name not in available_clusters:
+                raise CommandError(
+                    f"Cluster '{cluster_name}' in settings.OPENSEARCH_DOCUMENT_PATHS is not in "
+                    "settings.OPENSEARCH_CLUSTERS."
+                )
+
+        return all_document_paths
+
+    @staticmethod
+    def _import_documents(documents_path: str) -> List[Type[Document]]:
+        try:
+            documents = importlib.import_module(documents_path).DOCUMENTS
+        except ModuleNotFoundError as e:
+            raise CommandError(f"Module '{documents_path}' not found") from e
+        except AttributeError as e:
+            raise CommandError(f"Module '{documents_path}' must contain a 'DOCUMENTS' attribute") from e
+        if not isinstance(documents, list):
+            raise CommandError(
+                f"Invalid value for documents in '{documents_path}.DOCUMENTS'. "
+                "Must be a list of Document classes."
+            )
+        for document in documents:
+            if not (isinstance(document, type) and issubclass(document, Document)):
+                raise CommandError(
+                    f"Invalid document in '{documents_path}.DOCUMENTS'. Must be a subclass of Document."
+                )
+        return documents
+
+    @staticmethod
+    def _import_migrations(migrations_path: str) -> List[OpenSearchMigration]:
+        try:
+            migrations = importlib.import_module(migrations_path).MIGRATIONS
+        except ModuleNotFoundError as e:
+            raise CommandError(f"Module '{migrations_path}' not found") from e
+        except AttributeError as e:
+            raise CommandError(f"Module '{migrations_path}' must contain a 'MIGRATIONS' attribute") from e
+        if not isinstance(migrations, list):
+            raise CommandError(
+                f"Invalid value for migrations in '{migrations_path}.MIGRATIONS'. "
+                "Must be a list of migrations."
+            )
+        for migration in migrations:
+            if not isinstance(migration, OpenSearchMigration):
                 raise CommandError(
-                    f"Invalid value for migrations in '{migrations_path}.MIGRATIONS'. "
-                    "Must be a list of migrations."
+                    f"Invalid migration in '{migrations_path}.MIGRATIONS'. "
+                    "Must be an instance of OpenSearchMigration."
                 )
-            for migration in migrations:
-                if not isinstance(migration, OpenSearchMigration):
-                    raise CommandError(
-                        f"Invalid migration in '{migrations_path}.MIGRATIONS'. "
-                        "Must be an instance of OpenSearchMigration."
-                    )
-            migrations_by_cluster[cluster_name] = migrations
-
-        return migrations_by_cluster
+        return migrations
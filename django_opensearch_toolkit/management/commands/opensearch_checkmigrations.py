@@ -0,0 +1,56 @@
+"""Custom django-admin (manage.py) command for checking whether OpenSearch clusters are fully migrated."""
+
+import json
+from typing import Any, Dict, List
+
+from django.core.management.base import CommandError, CommandParser
+
+from django_opensearch_toolkit.management.commands._opensearch_command import OpenSearchCommand
+from django_opensearch_toolkit.migration_manager.migration_manager import OpenSearchMigrationsManager
+
+
+class Command(OpenSearchCommand):
+    """Custom django-admin (manage.py) command for checking whether OpenSearch clusters are fully migrated."""
+
+    help = (
+        "Print the status of the migrations of OpenSearch clusters as JSON, "
+        "and exit with an error if any migration is not applied"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Define arguments for this command."""
+        parser.add_argument(
+            "cluster",
+            type=str,
+            nargs="+",
+            choices=self.available_clusters,
+            help="Cluster Name(s)",
+        )
+        parser.add_argument(
+            "--full-check",
+            action="store_true",
+            default=False,
+            help="Always look up each migration, even if the saved fingerprint matches.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the command."""
+        del args  # unused
+        clusters: List[str] = list(dict.fromkeys(options["cluster"]))  # dedupe, preserving order
+
+        for cluster in clusters:
+            if len(self.get_migrations(cluster)) == 0:
+                raise CommandError(f"No migrations available for cluster={cluster}")
+
+        statuses: Dict[str, Dict[str, Any]] = {}
+        for cluster in clusters:
+            manager = OpenSearchMigrationsManager(
+                connection_name=cluster,
+                use_fingerprint=not options["full_check"],
+            )
+            statuses[cluster] = manager.get_migrations_status(self.get_migrations(cluster)).to_dict()
+        self.stdout.write(json.dumps(statuses, sort_keys=True))
+
+        behind = [cluster for cluster, status in statuses.items() if not status["up_to_date"]]
+        if behind:
+            raise CommandError(f"Migrations are not applied for cluster(s): {', '.join(behind)}")
@@ -0,0 +1,246 @@
+"""Custom django-admin (manage.py) command for generating OpenSearch migrations from Document classes."""
+
+import importlib
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from django.core.management.base import CommandError, CommandParser
+from opensearchpy.client import OpenSearch
+from opensearchpy.connection import connections
+from opensearchpy.exceptions import NotFoundError
+from opensearchpy.helpers.document import Document
+from opensearchpy.helpers.index import Index
+
+from django_opensearch_toolkit.management.commands._opensearch_command import OpenSearchCommand
+from django_opensearch_toolkit.migration_manager import AliasSwapMigration
+from django_opensearch_toolkit.migration_manager.mapping_diff import (
+    ChangeKind,
+    MappingDiff,
+    diff_index_bodies,
+    get_declared_index_bodies,
+)
+
+
+_MIGRATION_TEMPLATE = '''"""{description}
+
+Generated by opensearch_makemigrations.
+"""
+
+from django_opensearch_toolkit.migration_manager import {class_name}
+
+
+MIGRATION = {class_name}(
+{arguments}
+)
+'''
+
+
+def _get_alias_version(alias: str, index_name: str) -> int:
+    """Return the version of an `{alias}_v{version}` index, or 0 for any other index."""
+    match = re.fullmatch(rf"{re.escape(alias)}_v(\d+)", index_name)
+    return int(match.group(1)) if match else 0
+
+
+def _format_value(value: Any, level: int) -> str:
+    """Format a value of an index body as Python source, one item per line (like black does)."""
+    if isinstance(value, dict) and value:
+        indent = "    " * (level + 1)
+        items = [f"{indent}{json.dumps(k)}: {_format_value(v, level + 1)}," for k, v in value.items()]
+        return "{\n" + "\n".join(items) + "\n" + "    " * level + "}"
+    if isinstance(value, list) and value:
+        indent = "    " * (level + 1)
+        items = [f"{indent}{_format_value(v, level + 1)}," for v in value]
+        return "[\n" + "\n".join(items) + "\n" + "    " * level + "]"
+    if isinstance(value, str):
+        return json.dumps(value)
+    return repr(value)
+
+
+class Command(OpenSearchCommand):
+    """Custom django-admin (manage.py) command for generating OpenSearch migrations from Document classes.
+
+    Each Document's index body (Document._index.to_dict()) is diffed against its
+    current state, and the cheapest migration that applies the changes is
+    generated: CreateIndexMigration for a new index, UpdateIndexMigration for
+    changes that can be applied in place, and AliasSwapMigration for the others.
+    """
+
+    help = "Generate migrations for the changes to the Documents of an OpenSearch cluster"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Define arguments for this command."""
+        parser.add_argument(
+            "cluster",
+            type=str,
+            choices=self.available_clusters,
+            help="Cluster Name",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            default=False,
+            help="Display the changes and migrations, without writing any migration files.",
+        )
+        parser.add_argument(
+            "--live",
+            action="store_true",
+            default=False,
+            help=(
+                "Always diff against the live indices in the cluster. By default, indices described by the "
+                "built-in migrations are diffed against the last of them."
+            ),
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the command."""
+        del args  # unused
+        cluster: str = options["cluster"]
+        dry_run: bool = options["dry_run"]
+
+        documents = self.get_documents(cluster)
+        if len(documents) == 0:
+            raise CommandError(f"No documents available for cluster={cluster}")
+        if cluster not in self.migration_paths:
+            raise CommandError(f"No migration path available for cluster={cluster}")
+
+        migrations = self.get_migrations(cluster)
+        declared_bodies = {} if options["live"] else get_declared_index_bodies(migrations)
+        alias_versions = {m.alias: m.version for m in migrations if isinstance(m, AliasSwapMigration)}
+        client = connections.get_connection(cluster)
+
+        number = len(migrations) + 1
+        generated: List[str] = []
+        for document in documents:
+            name, source = self._make_migration(client, document, number, declared_bodies, alias_versions)
+            if source is None:
+                continue
+            if not dry_run:
+                with open(os.path.join(self._get_migrations_dir(cluster), f"{name}.py"), "w") as f:
+                    f.write(source)
+            generated.append(name)
+            number += 1
+
+        if not generated:
+            self.stdout.write("No changes detected")
+        elif not dry_run:
+            self.stdout.write(
+                f"Add the MIGRATION of each new module to {self.migration_paths[cluster]}.MIGRATIONS, "
+                f"in this order: {', '.join(generated)}"
+            )
+
+    def _make_migration(
+        self,
+        client: OpenSearch,
+        document: Type[Document],
+        number: int,
+        declared_bodies: Dict[str, Dict[str, Any]],
+        alias_versions: Dict[str, int],
+    ) -> Tuple[str, Optional[str]]:
+        """Return the module name and source of the migration for a Document, or None if it has no changes."""
+        index: Index = document._index  # type: ignore[attr-defined]
+        index_name: str = index._name
+        target = index.to_dict()
+        target.pop("aliases", None)
+        slug = re.sub(r"\W", "_", index_name).strip("_")
+
+        if index_name in declared_bodies:
+            current: Optional[Dict[str, Any]] = declared_bodies[index_name]
+            is_alias = index_name in alias_versions
+        else:
+            current = self._get_live_index_body(client, index_name)
+            is_alias = current is not None and client.indices.exists_alias(name=index_name)
+
+        self.stdout.write(f"[{document.__name__}] index={index_name}")
+        if current is None:
+            self.stdout.write("  New index")
+            key = f"{number:04}_create_{slug}"
+            return self._render(
+                key, "CreateIndexMigration", f"Create index {index_name}", index=index_name, body=target
+            )
+
+        diff = diff_index_bodies(current, target)
+        self._write_diff(diff)
+        if diff.is_empty:
+            return "", None
+
+        if not diff.is_breaking:
+            key = f"{number:04}_update_{slug}"
+            arguments: Dict[str, Any] = {"index": index_name}
+            if diff.put_mapping_body:
+                arguments["mappings"] = diff.put_mapping_body
+            if diff.put_settings_body:
+                arguments["settings"] = diff.put_settings_body
+            return self._render(
+                key, "UpdateIndexMigration", f"Update index {index_name} in place", **arguments
+            )
+
+        if is_alias:
+            version = (
+                max(alias_versions.get(index_name, 0), self._get_live_alias_version(client, index_name)) + 1
+            )
+        else:
+            # AliasSwapMigration reindexes the concrete index into the first version, and replaces it
+            # with the alias
+            self.stdout.write(f"  {index_name} is an index, not an alias; it will be replaced by an alias")
+            version = 1
+        alias_versions[index_name] = version
+        key = f"{number:04}_rebuild_{slug}_v{version}"
+        return self._render(
+            key,
+            "AliasSwapMigration",
+            f"Rebuild index {index_name} (the changes can't be applied in place)",
+            alias=index_name,
+            version=version,
+            index_body=target,
+        )
+
+    def _write_diff(self, diff: MappingDiff) -> None:
+        """Display the changes of a diff."""
+        if diff.is_empty:
+            self.stdout.write("  No changes")
+        for change in diff.changes:
+            marker = "+" if change.kind == ChangeKind.ADDITIVE else "!"
+            self.stdout.write(f"  {marker} {change.path}: {change.description}")
+
+    def _render(self, key: str, class_name: str, description: str, **kwargs: Any) -> Tuple[str, str]:
+        """Return the module name and source of a migration."""
+        self.stdout.write(f"  -> {class_name} {key}")
+        lines = [f"    key={_format_value(key, 1)},"]
+        for name, value in kwargs.items():
+            lines.append(f"    {name}={_format_value(value, 1)},")
+        source = _MIGRATION_TEMPLATE.format(
+            description=description,
+            class_name=class_name,
+            arguments="\n".join(lines),
+        )
+        return f"m{key}", source
+
+    def _get_migrations_dir(self, cluster: str) -> str:
+        """Return the directory of the migrations package of a cluster."""
+        module = importlib.import_module(self.migration_paths[cluster])
+        if not hasattr(module, "__path__"):
+            raise CommandError(
+                f"Module '{self.migration_paths[cluster]}' must be a package to add migrations"
+            )
+        return list(module.__path__)[0]
+
+    @staticmethod
+    def _get_live_index_body(client: OpenSearch, index_name: str) -> Optional[Dict[str, Any]]:
+        """Return the mappings and settings of the index (behind the alias), or None if it doesn't exist."""
+        try:
+            response = client.indices.get(index=index_name)
+        except NotFoundError:
+            return None
+        # the latest version, if an alias points to several
+        return response[max(response, key=lambda i: _get_alias_version(index_name, i))]
+
+    @staticmethod
+    def _get_live_alias_version(client: OpenSearch, alias: str) -> int:
+        """Return the highest version among the `{alias}_v{version}` indices the alias points to."""
+        try:
+            indices = client.indices.get_alias(name=alias)
+        except NotFoundError:
+            return 0
+        return max((_get_alias_version(alias, i) for i in indices), default=0)
@@ -0,0 +1,54 @@
+"""Custom django-admin (manage.py) command for summarizing the migration runs of OpenSearch clusters."""
+
+from typing import Any, List
+
+from django.core.management.base import CommandParser
+
+from django_opensearch_toolkit.management.commands._opensearch_command import OpenSearchCommand
+from django_opensearch_toolkit.migration_manager.migration_manager import OpenSearchMigrationsManager
+
+
+class Command(OpenSearchCommand):
+    """Custom django-admin (manage.py) command for summarizing the migration runs of OpenSearch clusters."""
+
+    help = "Summarize migration durations, time spent per phase, and the slowest migrations per cluster"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Define arguments for this command."""
+        parser.add_argument(
+            "cluster",
+            type=str,
+            nargs="+",
+            choices=self.available_clusters,
+            help="Cluster Name(s)",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=10,
+            help="Number of slowest migrations to display. Default is 10.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the command."""
+        del args  # unused
+        clusters: List[str] = options["cluster"]
+
+        for cluster in clusters:
+            stats = OpenSearchMigrationsManager(connection_name=cluster).get_migration_stats(
+                top=options["top"]
+            )
+
+            self.stdout.write(f"[{cluster}]")
+            statuses = ", ".join(f"{status}={n}" for status, n in sorted(stats.count_by_status.items()))
+            self.stdout.write(f"  Migrations: {sum(stats.count_by_status.values())} ({statuses or 'none'})")
+            self.stdout.write(
+                f"  Duration: total={stats.total_duration_ms / 1000:.1f}s, "
+                f"mean={stats.mean_duration_ms / 1000:.1f}s"
+            )
+            for phase, duration_ms in sorted(stats.phase_totals_ms.items(), key=lambda item: -item[1]):
+                self.stdout.write(f"  Phase {phase}: {duration_ms / 1000:.1f}s")
+            if stats.slowest:
+                self.stdout.write("  Slowest migrations:")
+                for duration_ms, key in stats.slowest:
+                    self.stdout.write(f"    {duration_ms / 1000:>10.1f}s  {key}")
@@ -0,0 +1,111 @@
+"""Custom django-admin (manage.py) command for copying the documents of one index into another."""
+
+import argparse
+from typing import Any, Optional, Union
+
+from django.core.management.base import CommandError, CommandParser
+from django.utils.module_loading import import_string
+from opensearchpy.exceptions import TransportError
+
+from django_opensearch_toolkit.indexing.reindexer import OpenSearchReindexer, Transform
+from django_opensearch_toolkit.management.commands._opensearch_command import OpenSearchCommand
+
+
+def _parse_slices(value: str) -> Union[int, str]:
+    """Parse the --slices argument, which is either 'auto' or a positive integer."""
+    if value == "auto":
+        return value
+    try:
+        slices = int(value)
+    except ValueError:
+        slices = 0
+    if slices < 1:
+        raise argparse.ArgumentTypeError(f"must be 'auto' or a positive integer, got '{value}'")
+    return slices
+
+
+class Command(OpenSearchCommand):
+    """Custom django-admin (manage.py) command for copying the documents of one index into another."""
+
+    help = "Copy (and optionally transform) the documents of one index into another, in parallel"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Define arguments for this command."""
+        parser.add_argument(
+            "cluster",
+            type=str,
+            choices=self.available_clusters,
+            help="Cluster Name",
+        )
+        parser.add_argument("source", type=str, help="Index (or alias) to read from")
+        parser.add_argument("dest", type=str, help="Index (or alias) to write to")
+        parser.add_argument(
+            "--transform",
+            type=str,
+            default=None,
+            help=(
+                "Dotted path to a function that receives each hit and returns the new document source "
+                "(or None to skip it). Transforms run client-side; otherwise the server-side _reindex API "
+                "is used."
+            ),
+        )
+        parser.add_argument(
+            "--slices",
+            type=_parse_slices,
+            default="auto",
+            help="Number of slices to read in parallel, or 'auto'. Default is 'auto'.",
+        )
+        parser.add_argument(
+            "--requests-per-second",
+            type=float,
+            default=None,
+            help="Throttle for the server-side reindex. Unthrottled by default.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1_000,
+            help="Number of documents read and written per batch.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Maximum number of concurrent bulk requests (client-side only).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the command."""
+        del args  # unused
+
+        transform: Optional[Transform] = None
+        if options["transform"] is not None:
+            try:
+                transform = import_string(options["transform"])
+            except ImportError as e:
+                raise CommandError(f"Invalid transform '{options['transform']}': {e}") from e
+
+        reindexer = OpenSearchReindexer(connection_name=options["cluster"])
+        try:
+            result = reindexer.reindex(
+                source=options["source"],
+                dest=options["dest"],
+                transform=transform,
+                slices=options["slices"],
+                requests_per_second=options["requests_per_second"],
+                batch_size=options["batch_size"],
+                max_workers=options["workers"],
+            )
+        except TransportError as e:
+            raise CommandError(
+                f"Reindex of '{options['source']}' into '{options['dest']}' failed: {e}"
+            ) from e
+
+        if not result.succeeded:
+            raise CommandError(
+                f"Reindex finished with {len(result.failures)} failure(s): {result.failures[:5]}"
+            )
+        self.stdout.write(
+            f"Reindexed {result.docs} docs in {result.elapsed_seconds:.1f}s "
+            f"({result.docs_per_second:.0f} docs/s)"
+        )
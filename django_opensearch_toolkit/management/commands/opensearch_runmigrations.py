@@ -1,6 +1,9 @@
-"""Custom django-admin (manage.py) command for running migrations for an OpenSearch cluster."""
+"""Custom django-admin (manage.py) command for running migrations for OpenSearch clusters."""
 
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+import dataclasses
+from logging import getLogger
+from typing import Any, Dict, List
 
 from django.core.management.base import CommandError, CommandParser
 
@@ -8,18 +11,34 @@ from django_opensearch_toolkit.management.commands._opensearch_command import Op
 from django_opensearch_toolkit.migration_manager.migration_manager import OpenSearchMigrationsManager
 
 
+_logger = getLogger(__name__)
+
+# Exit status when --nowait left task migrations running, so their dependents were not applied yet
+EXIT_TASKS_RUNNING = 3
+
+
+@dataclasses.dataclass
+class _ClusterResult:
+    """Outcome of running the migrations of a cluster."""
+
+    succeeded: bool
+    running_task_ids: Dict[str, str] = dataclasses.field(default_factory=dict)
+    blocked_migrations: List[str] = dataclasses.field(default_factory=list)
+
+
 class Command(OpenSearchCommand):
-    """Custom django-admin (manage.py) command for running migrations for an OpenSearch cluster."""
+    """Custom django-admin (manage.py) command for running migrations for OpenSearch clusters."""
 
-    help = "Run migrations for an OpenSearch cluster"
+    help = "Run migrations for one or more OpenSearch clusters, concurrently"
 
     def add_arguments(self, parser: CommandParser) -> None:
         """Define arguments for this command."""
         parser.add_argument(
             "cluster",
             type=str,
+            nargs="+",
             choices=self.available_clusters,
-            help="Cluster Name",
+            help="Cluster Name(s)",
         )
         parser.add_argument(
             "--nodry",
@@ -28,16 +47,104 @@ class Command(OpenSearchCommand):
             default=True,
             help="Run in non-dry mode, i.e. apply the migrations. Default is dry.",
         )
+        parser.add_argument(
+            "--nowait",
+            dest="wait",
+            action="store_false",
+            default=True,
+            help=(
+                "Don't wait for migrations running as OpenSearch tasks to complete. "
+                "A later run resumes watching them. If any task is still running, the command "
+                f"exits with status {EXIT_TASKS_RUNNING}, since the migrations that depend on it "
+                "were not applied yet."
+            ),
+        )
+        parser.add_argument(
+            "--full-check",
+            action="store_true",
+            default=False,
+            help="Always check the full migration history, even if the saved fingerprint matches.",
+        )
+        parser.add_argument(
+            "--max-workers",
+            type=int,
+            default=4,
+            help="Maximum number of clusters to migrate concurrently. Default is 4.",
+        )
+        parser.add_argument(
+            "--migration-workers",
+            type=int,
+            default=1,
+            help="Maximum number of independent migrations to apply concurrently per cluster. Default is 1.",
+        )
 
     def handle(self, *args: Any, **options: Any) -> None:
         """Run the command."""
         del args  # unused
-        cluster: str = options["cluster"]
+        clusters: List[str] = list(dict.fromkeys(options["cluster"]))  # dedupe, preserving order
         dry: bool = options["dry"]
 
-        migrations = self.migrations_by_cluster.get(cluster, [])
-        if len(migrations) == 0:
-            raise CommandError(f"No migrations available for cluster={cluster}")
+        # Validate all clusters before migrating any of them
+        for cluster in clusters:
+            if len(self.get_migrations(cluster)) == 0:
+                raise CommandError(f"No migrations available for cluster={cluster}")
+
+        max_workers = max(1, min(options["max_workers"], len(clusters)))
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="opensearch_runmigrations"
+        ) as pool:
+            futures = {
+                cluster: pool.submit(
+                    self._run_migrations,
+                    cluster,
+                    dry,
+                    options["migration_workers"],
+                    options["wait"],
+                    options["full_check"],
+                )
+                for cluster in clusters
+            }
+            results: Dict[str, _ClusterResult] = {cluster: f.result() for cluster, f in futures.items()}
+
+        waiting_clusters = [cluster for cluster, result in results.items() if result.running_task_ids]
+        for cluster in waiting_clusters:
+            result = results[cluster]
+            running = ", ".join(f"{key} (task {task_id})" for key, task_id in result.running_task_ids.items())
+            self.stdout.write(f"[{cluster}] Migrations still running as tasks: {running}")
+            if result.blocked_migrations:
+                self.stdout.write(
+                    f"[{cluster}] Migrations not applied until they complete: "
+                    f"{', '.join(result.blocked_migrations)}"
+                )
+
+        failed_clusters = [cluster for cluster, result in results.items() if not result.succeeded]
+        if failed_clusters:
+            raise CommandError(f"Migrations failed for cluster(s): {', '.join(failed_clusters)}")
+        if waiting_clusters:
+            raise CommandError(
+                f"Migrations are still running as tasks for cluster(s): {', '.join(waiting_clusters)}. "
+                "Run the migrations again to resume watching them.",
+                returncode=EXIT_TASKS_RUNNING,
+            )
 
-        manager = OpenSearchMigrationsManager(connection_name=cluster)
-        manager.run_migrations(migrations=migrations, dry=dry)
+    def _run_migrations(
+        self,
+        cluster: str,
+        dry: bool,
+        migration_workers: int,
+        wait: bool,
+        full_check: bool,
+    ) -> _ClusterResult:
+        """Run the migrations for a single cluster."""
+        try:
+            manager = OpenSearchMigrationsManager(
+                connection_name=cluster,
+                max_workers=migration_workers,
+                wait_for_tasks=wait,
+                use_fingerprint=not full_check,
+            )
+            succeeded = manager.run_migrations(migrations=self.get_migrations(cluster), dry=dry)
+            return _ClusterResult(succeeded, manager.running_task_ids, manager.blocked_migrations)
+        except Exception:
+            _logger.exception(f"[{cluster}] Failed to run migrations")
+            return _ClusterResult(succeeded=False)
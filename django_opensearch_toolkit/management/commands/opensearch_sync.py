@@ -0,0 +1,97 @@
+"""Custom django-admin (manage.py) command for syncing a Django model into an OpenSearch cluster."""
+
+from typing import Any
+
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist
+from django.core.management.base import CommandError, CommandParser
+from opensearchpy.helpers.errors import BulkIndexError
+
+from django_opensearch_toolkit.management.commands._opensearch_command import OpenSearchCommand
+from django_opensearch_toolkit.model_sync import get_registration
+from django_opensearch_toolkit.model_sync.model_syncer import ModelSyncer
+
+
+class Command(OpenSearchCommand):
+    """Custom django-admin (manage.py) command for syncing a Django model into an OpenSearch cluster."""
+
+    help = "Incrementally sync the rows of a registered Django model into an OpenSearch cluster"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Define arguments for this command."""
+        parser.add_argument(
+            "cluster",
+            type=str,
+            choices=self.available_clusters,
+            help="Cluster Name",
+        )
+        parser.add_argument(
+            "model",
+            type=str,
+            help="Label of the Django model to sync, e.g. 'sample_app.Merchant'",
+        )
+        parser.add_argument(
+            "--watermark-field",
+            type=str,
+            default="updated",
+            help="Model field that increases whenever a row changes. Default is 'updated'.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2_000,
+            help="Number of rows fetched per database round-trip, and written between checkpoints.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Maximum number of concurrent bulk requests.",
+        )
+        parser.add_argument(
+            "--overlap",
+            type=float,
+            default=0,
+            help=(
+                "Resume from this far before the checkpoint, to also sync rows committed late: in "
+                "seconds for date and datetime watermark fields, or in the field's units for numeric "
+                "ones. Default is 0."
+            ),
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            default=False,
+            help="Ignore the saved checkpoint and sync all rows.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the command."""
+        del args  # unused
+        cluster: str = options["cluster"]
+
+        try:
+            model = apps.get_model(options["model"])
+        except (LookupError, ValueError) as e:
+            raise CommandError(f"Invalid model '{options['model']}': {e}") from e
+
+        registration = get_registration(model)
+        if registration is None:
+            raise CommandError(f"Model '{options['model']}' is not registered with model_sync")
+
+        try:
+            syncer = ModelSyncer(
+                connection_name=cluster,
+                registration=registration,
+                watermark_field=options["watermark_field"],
+                chunk_size=options["chunk_size"],
+                max_workers=options["workers"],
+                overlap=options["overlap"],
+            )
+        except (FieldDoesNotExist, ValueError) as e:
+            raise CommandError(f"Invalid watermark field: {e}") from e
+
+        try:
+            syncer.sync(reset=options["reset"])
+        except (RuntimeError, BulkIndexError) as e:
+            raise CommandError(f"Sync of '{options['model']}' failed: {e}") from e
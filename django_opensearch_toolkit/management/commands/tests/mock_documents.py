@@ -0,0 +1,24 @@
+"""Mock documents for unit tests."""
+
+from typing import List, Type
+
+from opensearchpy.helpers.document import Document
+from opensearchpy.helpers.field import Keyword, Long
+
+
+class Product(Document):
+    """Fake document for unittests."""
+
+    name = Keyword()
+    price = Long()
+
+    class Index:
+        """Configuration for the index."""
+
+        name = "products"
+        settings = {"number_of_shards": 2, "number_of_replicas": 2, "refresh_interval": "5s"}
+
+
+DOCUMENTS: List[Type[Document]] = [
+    Product,
+]
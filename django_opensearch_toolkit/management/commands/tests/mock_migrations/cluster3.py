@@ -0,0 +1,28 @@
+"""Mock migrations for 'cluster3' for unit tests."""
+
+from typing import List
+
+from django_opensearch_toolkit.migration_manager import (
+    CreateIndexMigration,
+    OpenSearchMigration,
+    UpdateIndexMigration,
+)
+
+
+MIGRATIONS: List[OpenSearchMigration] = [
+    CreateIndexMigration(
+        "0001_create_products",
+        index="products",
+        body={
+            "settings": {
+                "index": {"number_of_shards": "2", "number_of_replicas": "2", "refresh_interval": "5s"}
+            },
+            "mappings": {"properties": {"name": {"type": "keyword"}}},
+        },
+    ),
+    UpdateIndexMigration(
+        "0002_update_products",
+        index="products",
+        mappings={"properties": {"price": {"type": "long"}}},
+    ),
+]
@@ -0,0 +1,92 @@
+"""Unit tests for the `opensearch_checkmigrations` command."""
+
+from io import StringIO
+import json
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from opensearchpy.exceptions import NotFoundError
+
+from django_opensearch_toolkit.migration_manager.migration_log import MigrationLog, MigrationLogStatus
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+class TestCheckMigrations(MagicMockOpenSearchTestCase):
+    """Unit tests for the `opensearch_checkmigrations` command."""
+
+    COMMAND_NAME = "opensearch_checkmigrations"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.get.side_effect = NotFoundError(404, "not found")  # no saved fingerprint
+        self.stdout = StringIO()
+
+    def _call_command(self, *args: Any) -> Dict[str, Any]:
+        migration_paths = {
+            "unittest": "django_opensearch_toolkit.management.commands.tests.mock_migrations.cluster2",
+        }
+        with patch.object(settings, "OPENSEARCH_CLUSTERS", new={"unittest": {}}, create=True):
+            with patch.object(settings, "OPENSEARCH_MIGRATION_PATHS", new=migration_paths, create=True):
+                with patch.object(settings, "OPENSEARCH_DOCUMENT_PATHS", new={}, create=True):
+                    call_command(self.COMMAND_NAME, *args, stdout=self.stdout)
+        return json.loads(self.stdout.getvalue())
+
+    def _set_logs(self, statuses: List[Optional[MigrationLogStatus]]) -> None:
+        self.test_client.mget.return_value = {
+            "docs": [
+                (
+                    {
+                        "_index": MigrationLog.Index.name,
+                        "_id": key,
+                        "found": True,
+                        "_source": {"status": s.value},
+                    }
+                    if s is not None
+                    else {"_index": MigrationLog.Index.name, "_id": key, "found": False}
+                )
+                for key, s in zip(["Migration1", "Migration2"], statuses)
+            ]
+        }
+
+    def test_up_to_date(self) -> None:
+        self._set_logs([MigrationLogStatus.SUCCEEDED, MigrationLogStatus.SUCCEEDED])
+        output = self._call_command("unittest")
+        self.assertDictEqual(
+            output,
+            {
+                "unittest": {
+                    "up_to_date": True,
+                    "applied": ["Migration1", "Migration2"],
+                    "in_progress": [],
+                    "failed": [],
+                    "pending": [],
+                }
+            },
+        )
+        self.test_client.mget.assert_called_once_with(
+            index=MigrationLog.Index.name,
+            body={"ids": ["Migration1", "Migration2"]},
+        )
+        self.test_client.search.assert_not_called()
+
+    def test_behind(self) -> None:
+        self._set_logs([MigrationLogStatus.FAILED, None])
+        with self.assertRaises(CommandError) as cm:
+            self._call_command("unittest")
+        self.assertEqual(str(cm.exception), "Migrations are not applied for cluster(s): unittest")
+        output = json.loads(self.stdout.getvalue())
+        self.assertFalse(output["unittest"]["up_to_date"])
+        self.assertListEqual(output["unittest"]["failed"], ["Migration1"])
+        self.assertListEqual(output["unittest"]["pending"], ["Migration2"])
+
+    def test_no_migration_logs_index(self) -> None:
+        self.test_client.mget.side_effect = NotFoundError(404, "index_not_found_exception")
+        with self.assertRaises(CommandError):
+            self._call_command("unittest")
+        output = json.loads(self.stdout.getvalue())
+        self.assertListEqual(output["unittest"]["pending"], ["Migration1", "Migration2"])
+        self.test_client.indices.create.assert_not_called()
@@ -0,0 +1,84 @@
+"""Unit tests for OpenSearchCommand."""
+
+import importlib
+from typing import Any, Dict
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from django_opensearch_toolkit.management.commands._opensearch_command import OpenSearchCommand
+
+
+_MOCK_MIGRATIONS = "django_opensearch_toolkit.management.commands.tests.mock_migrations"
+
+
+class TestOpenSearchCommand(TestCase):
+    """Unit tests for OpenSearchCommand."""
+
+    databases = set()
+
+    def setUp(self) -> None:
+        self.clusters: Dict[str, Dict[str, Any]] = {
+            "cluster1": {},
+            "cluster2": {},
+            "cluster3": {},
+        }
+        self.migration_paths = {
+            "cluster1": "no.such.module",
+            "cluster2": f"{_MOCK_MIGRATIONS}.cluster2",
+        }
+        self.document_paths: Dict[str, str] = {}
+
+    def _command(self) -> OpenSearchCommand:
+        with patch.object(settings, "OPENSEARCH_CLUSTERS", new=self.clusters, create=True):
+            with patch.object(settings, "OPENSEARCH_MIGRATION_PATHS", new=self.migration_paths, create=True):
+                with patch.object(
+                    settings, "OPENSEARCH_DOCUMENT_PATHS", new=self.document_paths, create=True
+                ):
+                    return OpenSearchCommand()
+
+    def test_migrations_are_loaded_lazily(self) -> None:
+        """Test that migration modules are only imported for the requested cluster, once."""
+        with patch("importlib.import_module", wraps=importlib.import_module) as import_module:
+            command = self._command()
+            import_module.assert_not_called()
+
+            migrations = command.get_migrations("cluster2")
+            self.assertListEqual([m.get_key() for m in migrations], ["Migration1", "Migration2"])
+            self.assertIs(command.get_migrations("cluster2"), migrations)  # cached
+            import_module.assert_called_once_with(f"{_MOCK_MIGRATIONS}.cluster2")
+
+        self.assertListEqual(command.get_migrations("cluster3"), [])  # no migration path
+
+    def test_invalid_module(self) -> None:
+        """Test that an invalid module is only reported when its migrations are requested."""
+        command = self._command()
+        with self.assertRaises(CommandError) as cm:
+            command.get_migrations("cluster1")
+        self.assertEqual(str(cm.exception), "Module 'no.such.module' not found")
+        with self.assertRaises(CommandError):
+            command.migrations_by_cluster
+
+    def test_invalid_cluster(self) -> None:
+        """Test that migration paths for unknown clusters are still rejected eagerly."""
+        self.migration_paths["cluster4"] = f"{_MOCK_MIGRATIONS}.cluster2"
+        with self.assertRaises(CommandError) as cm:
+            self._command()
+        self.assertEqual(
+            str(cm.exception),
+            "Cluster 'cluster4' in settings.OPENSEARCH_MIGRATION_PATHS is not in "
+            "settings.OPENSEARCH_CLUSTERS.",
+        )
+
+    def test_invalid_document_paths_cluster(self) -> None:
+        """Test that document paths for unknown clusters are rejected too."""
+        self.document_paths["cluster4"] = "no.such.module"
+        with self.assertRaises(CommandError) as cm:
+            self._command()
+        self.assertEqual(
+            str(cm.exception),
+            "Cluster 'cluster4' in settings.OPENSEARCH_DOCUMENT_PATHS is not in "
+            "settings.OPENSEARCH_CLUSTERS.",
+        )
@@ -31,7 +31,8 @@ class TestDisplayMigrations(TestCase):
     def _call_command(self, *args: Any, **kwargs: Any) -> None:
         with patch.object(settings, "OPENSEARCH_CLUSTERS", new=self.clusters, create=True):
             with patch.object(settings, "OPENSEARCH_MIGRATION_PATHS", new=self.migration_paths, create=True):
-                call_command(self.COMMAND_NAME, *args, **kwargs)
+                with patch.object(settings, "OPENSEARCH_DOCUMENT_PATHS", new={}, create=True):
+                    call_command(self.COMMAND_NAME, *args, **kwargs)
 
     def test_cluster_required(self) -> None:
         """Test that an error is raised when a cluser is not provided."""
@@ -0,0 +1,168 @@
+"""Unit tests for the `opensearch_makemigrations` command."""
+
+import importlib.util
+from io import StringIO
+import os
+import tempfile
+from typing import Any, Dict
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from opensearchpy.exceptions import NotFoundError
+
+from django_opensearch_toolkit.indexing.reindexer import ReindexResult
+from django_opensearch_toolkit.migration_manager import (
+    AliasSwapMigration,
+    CreateIndexMigration,
+    OpenSearchMigration,
+    UpdateIndexMigration,
+)
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+_MODULE = "django_opensearch_toolkit.management.commands.opensearch_makemigrations"
+_TESTS = "django_opensearch_toolkit.management.commands.tests"
+
+LIVE_BODY: Dict[str, Any] = {
+    "aliases": {"products": {}},
+    "settings": {
+        "index": {"number_of_shards": "2", "number_of_replicas": "2", "refresh_interval": "5s", "uuid": "abc"}
+    },
+    "mappings": {"properties": {"name": {"type": "keyword"}}},
+}
+
+
+class TestMakeMigrations(MagicMockOpenSearchTestCase):
+    """Unit tests for the `opensearch_makemigrations` command."""
+
+    COMMAND_NAME = "opensearch_makemigrations"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.indices.exists_alias.return_value = True
+        self.test_client.indices.get_alias.return_value = {"products_v1": {"aliases": {"products": {}}}}
+        self.migration_paths = {"unittest": f"{_TESTS}.mock_migrations.cluster2"}
+        self.document_paths = {"unittest": f"{_TESTS}.mock_documents"}
+
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.migrations_dir = tmp_dir.name
+        dir_patcher = patch(f"{_MODULE}.Command._get_migrations_dir", return_value=self.migrations_dir)
+        dir_patcher.start()
+        self.addCleanup(dir_patcher.stop)
+
+    def _call_command(self, *args: Any) -> str:
+        stdout = StringIO()
+        with patch.object(settings, "OPENSEARCH_CLUSTERS", new={"unittest": {}}, create=True):
+            with patch.object(settings, "OPENSEARCH_MIGRATION_PATHS", new=self.migration_paths, create=True):
+                with patch.object(
+                    settings, "OPENSEARCH_DOCUMENT_PATHS", new=self.document_paths, create=True
+                ):
+                    call_command(self.COMMAND_NAME, "unittest", *args, stdout=stdout, stderr=StringIO())
+        return stdout.getvalue()
+
+    def _load_migration(self, name: str) -> OpenSearchMigration:
+        spec = importlib.util.spec_from_file_location(name, os.path.join(self.migrations_dir, f"{name}.py"))
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.MIGRATION
+
+    def test_new_index(self) -> None:
+        self.test_client.indices.get.side_effect = NotFoundError(404, "index_not_found_exception")
+        self._call_command()
+
+        migration = self._load_migration("m0003_create_products")
+        self.assertIsInstance(migration, CreateIndexMigration)
+        assert isinstance(migration, CreateIndexMigration)
+        self.assertEqual(migration.get_key(), "0003_create_products")
+        self.assertDictEqual(
+            migration.body,
+            {
+                "settings": {"number_of_shards": 2, "number_of_replicas": 2, "refresh_interval": "5s"},
+                "mappings": {"properties": {"name": {"type": "keyword"}, "price": {"type": "long"}}},
+            },
+        )
+
+    def test_additive_change(self) -> None:
+        self.test_client.indices.get.return_value = {"products_v1": LIVE_BODY}
+        output = self._call_command()
+        self.assertIn("  + mappings.properties.price: Added field price", output)
+
+        migration = self._load_migration("m0003_update_products")
+        assert isinstance(migration, UpdateIndexMigration)
+        self.assertEqual(migration.index, "products")
+        self.assertDictEqual(migration.mappings, {"properties": {"price": {"type": "long"}}})
+        self.assertDictEqual(migration.settings, {})
+
+    def test_breaking_change(self) -> None:
+        body = {**LIVE_BODY, "mappings": {"properties": {"name": {"type": "text"}}}}
+        self.test_client.indices.get.return_value = {"products_v1": body}
+        output = self._call_command()
+        self.assertIn("  ! mappings.properties.name: Changed type from text to keyword", output)
+
+        migration = self._load_migration("m0003_rebuild_products_v2")
+        assert isinstance(migration, AliasSwapMigration)
+        self.assertEqual(migration.alias, "products")
+        self.assertEqual(migration.index_name, "products_v2")
+
+        # The rebuilt index gets the replicas and refresh interval of the Document once it is loaded
+        self.test_client.indices.exists.return_value = False
+        self.test_client.cluster.health.return_value = {"status": "green", "timed_out": False}
+        with patch(
+            "django_opensearch_toolkit.migration_manager.alias_swap_migration.OpenSearchReindexer"
+        ) as cls:
+            cls.return_value.reindex.return_value = ReindexResult(docs=1, failures=[], elapsed_seconds=1)
+            self.assertTrue(migration.apply(self.unittest_connection))
+        self.assertDictEqual(
+            self.test_client.indices.create.call_args.kwargs["body"]["settings"],
+            {"number_of_shards": 2, "index": {"number_of_replicas": "0", "refresh_interval": "-1"}},
+        )
+        self.test_client.indices.put_settings.assert_called_once_with(
+            index="products_v2",
+            body={"index": {"refresh_interval": "5s", "number_of_replicas": 2}},
+        )
+
+    def test_breaking_change_without_alias(self) -> None:
+        body = {**LIVE_BODY, "mappings": {"properties": {"name": {"type": "text"}}}}
+        self.test_client.indices.get.return_value = {"products": body}
+        self.test_client.indices.exists_alias.return_value = False
+        self.test_client.indices.get_alias.side_effect = NotFoundError(404, "aliases_not_found_exception")
+        output = self._call_command()
+        self.assertIn("  products is an index, not an alias; it will be replaced by an alias", output)
+
+        migration = self._load_migration("m0003_rebuild_products_v1")
+        assert isinstance(migration, AliasSwapMigration)
+        self.assertEqual(migration.alias, "products")
+        self.assertEqual(migration.index_name, "products_v1")
+
+    def test_breaking_change_picks_latest_version(self) -> None:
+        """Test that the live index with the highest version is diffed, by number rather than by name."""
+        body = {**LIVE_BODY, "mappings": {"properties": {"name": {"type": "text"}}}}
+        self.test_client.indices.get.return_value = {"products_v10": LIVE_BODY, "products_v9": body}
+        self.test_client.indices.get_alias.return_value = {"products_v9": {}, "products_v10": {}}
+        output = self._call_command()
+        self.assertIn("  -> UpdateIndexMigration 0003_update_products", output)
+
+    def test_declared_index_body(self) -> None:
+        """Test that indices described by built-in migrations are diffed against them, not the live index."""
+        self.migration_paths["unittest"] = f"{_TESTS}.mock_migrations.cluster3"
+        output = self._call_command()
+        self.assertIn("  No changes", output)
+        self.assertIn("No changes detected", output)
+        self.test_client.indices.get.assert_not_called()
+
+    def test_dry_run(self) -> None:
+        self.test_client.indices.get.return_value = {"products_v1": LIVE_BODY}
+        output = self._call_command("--dry-run")
+        self.assertIn("  -> UpdateIndexMigration 0003_update_products", output)
+        self.assertListEqual(os.listdir(self.migrations_dir), [])
+
+    def test_missing_documents(self) -> None:
+        self.document_paths = {}
+        with self.assertRaises(CommandError) as cm:
+            self._call_command()
+        self.assertEqual(str(cm.exception), "No documents available for cluster=unittest")
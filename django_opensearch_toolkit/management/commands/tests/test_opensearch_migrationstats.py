@@ -0,0 +1,61 @@
+"""Unit tests for the `opensearch_migrationstats` command."""
+
+from io import StringIO
+from typing import Any
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.management import call_command
+
+from django_opensearch_toolkit.migration_manager.migration_log import MigrationLog, MigrationLogStatus
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+class TestMigrationStats(MagicMockOpenSearchTestCase):
+    """Unit tests for the `opensearch_migrationstats` command."""
+
+    COMMAND_NAME = "opensearch_migrationstats"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.indices.exists.return_value = True
+        hits = [
+            {
+                "_index": MigrationLog.Index.name,
+                "_id": key,
+                "_source": {
+                    "order": i,
+                    "key": key,
+                    "status": MigrationLogStatus.SUCCEEDED.value,
+                    "started_at": 0,
+                    "ended_at": duration_ms,
+                    "durations_ms": {"create_log": 100, "apply": duration_ms - 100},
+                },
+            }
+            for i, (key, duration_ms) in enumerate([("fast", 1_000), ("slow", 60_000)])
+        ]
+        self.test_client.search.return_value = {"hits": {"total": {"value": len(hits)}, "hits": hits}}
+
+    def _call_command(self, *args: Any, **kwargs: Any) -> str:
+        stdout = StringIO()
+        with patch.object(settings, "OPENSEARCH_CLUSTERS", new={"unittest": {}}, create=True):
+            with patch.object(settings, "OPENSEARCH_MIGRATION_PATHS", new={}, create=True):
+                with patch.object(settings, "OPENSEARCH_DOCUMENT_PATHS", new={}, create=True):
+                    call_command(self.COMMAND_NAME, *args, stdout=stdout, **kwargs)
+        return stdout.getvalue()
+
+    def test_stats(self) -> None:
+        output = self._call_command("unittest", "--top=1")
+        self.assertListEqual(
+            output.splitlines(),
+            [
+                "[unittest]",
+                "  Migrations: 2 (SUCCEEDED=2)",
+                "  Duration: total=61.0s, mean=30.5s",
+                "  Phase apply: 60.8s",
+                "  Phase create_log: 0.2s",
+                "  Slowest migrations:",
+                "          60.0s  slow",
+            ],
+        )
@@ -0,0 +1,63 @@
+"""Unit tests for the `opensearch_reindex` command."""
+
+from typing import Any, Dict
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from opensearchpy.exceptions import NotFoundError
+from parameterized import parameterized
+
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+def _task_response(completed: bool, done: int, failures: Any = ()) -> Dict[str, Any]:
+    return {
+        "completed": completed,
+        "task": {"status": {"total": 10, "created": done}, "running_time_in_nanos": 10**9},
+        "response": {"failures": list(failures)},
+    }
+
+
+class TestReindexCommand(MagicMockOpenSearchTestCase):
+    """Unit tests for the `opensearch_reindex` command."""
+
+    COMMAND_NAME = "opensearch_reindex"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.reindex.return_value = {"task": "node:1"}
+
+    def _call_command(self, *args: Any, **kwargs: Any) -> None:
+        with patch.object(settings, "OPENSEARCH_CLUSTERS", new={"unittest": {}}, create=True):
+            with patch.object(settings, "OPENSEARCH_MIGRATION_PATHS", new={}, create=True):
+                with patch.object(settings, "OPENSEARCH_DOCUMENT_PATHS", new={}, create=True):
+                    call_command(self.COMMAND_NAME, *args, **kwargs)
+
+    def test_success(self) -> None:
+        self.test_client.tasks.get.return_value = _task_response(completed=True, done=10)
+        self._call_command("unittest", "src", "dest", "--slices", "4")
+        self.assertEqual(self.test_client.reindex.call_args.kwargs["slices"], 4)
+
+    def test_failures(self) -> None:
+        self.test_client.tasks.get.return_value = _task_response(
+            completed=True, done=9, failures=[{"id": "1"}]
+        )
+        with self.assertRaisesRegex(CommandError, "1 failure"):
+            self._call_command("unittest", "src", "dest")
+
+    def test_invalid_transform(self) -> None:
+        with self.assertRaisesRegex(CommandError, "Invalid transform"):
+            self._call_command("unittest", "src", "dest", "--transform", "no.such.func")
+
+    @parameterized.expand(["0", "-1", "two"])
+    def test_invalid_slices(self, slices: str) -> None:
+        with self.assertRaisesRegex(CommandError, "positive integer"):
+            self._call_command("unittest", "src", "dest", "--slices", slices)
+
+    def test_transport_error(self) -> None:
+        self.test_client.reindex.side_effect = NotFoundError(404, "index_not_found_exception", {})
+        with self.assertRaisesRegex(CommandError, "Reindex of 'src' into 'dest' failed"):
+            self._call_command("unittest", "src", "dest")
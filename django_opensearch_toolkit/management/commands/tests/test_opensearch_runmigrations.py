@@ -1,13 +1,19 @@
 """Unit tests for the `opensearch_runmigrations` command."""
 
+from io import StringIO
 from typing import Any, Dict
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from django.conf import settings
 from django.core.management import call_command
 from django.core.management.base import CommandError
 from django.test import TestCase
 
+from django_opensearch_toolkit.management.commands.opensearch_runmigrations import EXIT_TASKS_RUNNING
+
+
+_MODULE = "django_opensearch_toolkit.management.commands.opensearch_runmigrations"
+
 
 class TestRunMigrations(TestCase):
     """Unit tests for the `opensearch_runmigrations` command."""
@@ -31,7 +37,8 @@ class TestRunMigrations(TestCase):
     def _call_command(self, *args: Any, **kwargs: Any) -> None:
         with patch.object(settings, "OPENSEARCH_CLUSTERS", new=self.clusters, create=True):
             with patch.object(settings, "OPENSEARCH_MIGRATION_PATHS", new=self.migration_paths, create=True):
-                call_command(self.COMMAND_NAME, *args, **kwargs)
+                with patch.object(settings, "OPENSEARCH_DOCUMENT_PATHS", new={}, create=True):
+                    call_command(self.COMMAND_NAME, *args, **kwargs)
 
     def test_cluster_required(self) -> None:
         """Test that an error is raised when a cluser is not provided."""
@@ -68,3 +75,88 @@ class TestRunMigrations(TestCase):
             str(cm.exception),
             "No migrations available for cluster=cluster1",
         )
+
+    def test_missing_migrations_for_any_cluster(self) -> None:
+        """Test that no cluster is migrated if any of them has no migrations."""
+        with patch(f"{_MODULE}.OpenSearchMigrationsManager") as manager_cls:
+            with self.assertRaises(CommandError) as cm:
+                self._call_command("cluster2", "cluster3")
+        self.assertEqual(str(cm.exception), "No migrations available for cluster=cluster3")
+        manager_cls.assert_not_called()
+
+    def test_run_migrations_multiple_clusters(self) -> None:
+        """Test that each cluster is migrated with its own manager."""
+        self.migration_paths["cluster1"] = self.migration_paths["cluster2"]
+        with patch(f"{_MODULE}.OpenSearchMigrationsManager") as manager_cls:
+            manager_cls.return_value.run_migrations.return_value = True
+            manager_cls.return_value.running_task_ids = {}
+            manager_cls.return_value.blocked_migrations = []
+            self._call_command(
+                "cluster1",
+                "cluster2",
+                "cluster1",
+                "--nodry",
+                "--max-workers=2",
+                "--migration-workers=3",
+                "--nowait",
+                "--full-check",
+            )
+
+        self.assertCountEqual(
+            [c.kwargs for c in manager_cls.call_args_list],
+            [
+                {
+                    "connection_name": "cluster1",
+                    "max_workers": 3,
+                    "wait_for_tasks": False,
+                    "use_fingerprint": False,
+                },
+                {
+                    "connection_name": "cluster2",
+                    "max_workers": 3,
+                    "wait_for_tasks": False,
+                    "use_fingerprint": False,
+                },
+            ],
+        )
+        self.assertEqual(manager_cls.return_value.run_migrations.call_count, 2)
+        self.assertFalse(manager_cls.return_value.run_migrations.call_args.kwargs["dry"])
+
+    def test_run_migrations_aggregates_failures(self) -> None:
+        """Test that all clusters are migrated, and the failed ones are reported."""
+        self.migration_paths["cluster1"] = self.migration_paths["cluster2"]
+
+        def _create_manager(connection_name: str, **kwargs: Any) -> MagicMock:
+            manager = MagicMock()
+            if connection_name == "cluster1":
+                manager.run_migrations.side_effect = ValueError("Simulate unexpected error")
+            else:
+                manager.run_migrations.return_value = True
+                manager.running_task_ids = {}
+                manager.blocked_migrations = []
+            return manager
+
+        with patch(f"{_MODULE}.OpenSearchMigrationsManager", side_effect=_create_manager) as manager_cls:
+            with self.assertRaises(CommandError) as cm:
+                self._call_command("cluster1", "cluster2")
+
+        self.assertEqual(str(cm.exception), "Migrations failed for cluster(s): cluster1")
+        self.assertEqual(manager_cls.call_count, 2)
+
+    def test_run_migrations_nowait_with_running_tasks(self) -> None:
+        """Test that tasks left running are summarized, and exit with a distinct status."""
+        with patch(f"{_MODULE}.OpenSearchMigrationsManager") as manager_cls:
+            manager_cls.return_value.run_migrations.return_value = True
+            manager_cls.return_value.running_task_ids = {"backfill": "node:1"}
+            manager_cls.return_value.blocked_migrations = ["after_backfill"]
+            stdout = StringIO()
+            with self.assertRaises(CommandError) as cm:
+                self._call_command("cluster2", "--nodry", "--nowait", stdout=stdout)
+
+        self.assertEqual(cm.exception.returncode, EXIT_TASKS_RUNNING)
+        self.assertRegex(str(cm.exception), "still running as tasks for cluster\\(s\\): cluster2")
+        self.assertEqual(
+            stdout.getvalue(),
+            "[cluster2] Migrations still running as tasks: backfill (task node:1)\n"
+            "[cluster2] Migrations not applied until they complete: after_backfill\n",
+        )
@@ -0,0 +1,151 @@
+"""Unit tests for the `opensearch_sync` command."""
+
+import json
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from opensearchpy.exceptions import NotFoundError
+from opensearchpy.helpers.document import Document
+from opensearchpy.helpers.field import Keyword
+
+from django_opensearch_toolkit.model_sync import register, unregister
+from django_opensearch_toolkit.model_sync.sync_checkpoint import SyncCheckpoint
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+class GroupDocument(Document):
+    """Document mirroring the Group model for unit tests."""
+
+    name = Keyword()
+
+    class Index:
+        using = "unittest"
+        name = "groups"
+
+
+def _parse_body(body: bytes) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in body.decode("utf-8").splitlines()]
+
+
+class TestSync(MagicMockOpenSearchTestCase):
+    """Unit tests for the `opensearch_sync` command."""
+
+    databases = {"default"}
+
+    COMMAND_NAME = "opensearch_sync"
+
+    def setUp(self) -> None:
+        super().setUp()
+        register(Group, GroupDocument)
+        self.groups = [Group.objects.create(name=f"group{i}") for i in range(5)]
+
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.indices.exists.return_value = False
+        self.test_client.get.side_effect = NotFoundError(404, "not found")
+        self.test_client.index.return_value = {"_id": "id", "result": "created"}
+        self.test_client.bulk.side_effect = lambda body: {
+            "items": [{"index": {"status": 201}} for _ in range(len(_parse_body(body)) // 2)]
+        }
+
+    def tearDown(self) -> None:
+        unregister(Group)
+        super().tearDown()
+
+    def _call_command(self, *args: Any, **kwargs: Any) -> None:
+        with patch.object(settings, "OPENSEARCH_CLUSTERS", new={"unittest": {}}, create=True):
+            with patch.object(settings, "OPENSEARCH_MIGRATION_PATHS", new={}, create=True):
+                with patch.object(settings, "OPENSEARCH_DOCUMENT_PATHS", new={}, create=True):
+                    call_command(self.COMMAND_NAME, *args, **kwargs)
+
+    def _synced_ids(self) -> List[str]:
+        return [
+            line["index"]["_id"]
+            for c in self.test_client.bulk.call_args_list
+            for line in _parse_body(c.kwargs["body"])
+            if "index" in line
+        ]
+
+    def _checkpoints(self) -> List[Dict[str, Any]]:
+        return [c.kwargs["body"] for c in self.test_client.index.call_args_list]
+
+    def test_sync_all_rows(self) -> None:
+        self._call_command("unittest", "auth.Group", "--watermark-field=id", "--chunk-size=2")
+
+        self.test_client.indices.create.assert_called_once()
+        self.assertListEqual(self._synced_ids(), [str(g.pk) for g in self.groups])
+
+        # A checkpoint is saved after each chunk, and at the end
+        checkpoints = self._checkpoints()
+        self.assertListEqual(
+            [c["watermark"] for c in checkpoints],
+            [str(self.groups[1].pk), str(self.groups[3].pk), str(self.groups[4].pk)],
+        )
+        self.assertListEqual([c["rows_synced"] for c in checkpoints], [2, 4, 5])
+        self.assertEqual(
+            self.test_client.index.call_args.kwargs["id"],
+            SyncCheckpoint.get_id("auth.Group", "id"),
+        )
+
+    def test_sync_resumes_from_checkpoint(self) -> None:
+        self.test_client.get.side_effect = None
+        self.test_client.get.return_value = {
+            "found": True,
+            "_index": SyncCheckpoint.Index.name,
+            "_id": SyncCheckpoint.get_id("auth.Group", "id"),
+            "_source": {
+                "model": "auth.Group",
+                "watermark_field": "id",
+                "watermark": str(self.groups[2].pk),
+                "rows_synced": 3,
+            },
+        }
+
+        self._call_command("unittest", "auth.Group", "--watermark-field=id")
+
+        self.assertListEqual(self._synced_ids(), [str(g.pk) for g in self.groups[2:]])
+        self.assertListEqual([c["rows_synced"] for c in self._checkpoints()], [6])
+
+    def test_sync_resumes_with_overlap(self) -> None:
+        self.test_client.get.side_effect = None
+        self.test_client.get.return_value = {
+            "found": True,
+            "_index": SyncCheckpoint.Index.name,
+            "_id": SyncCheckpoint.get_id("auth.Group", "id"),
+            "_source": {"watermark": str(self.groups[2].pk), "rows_synced": 3},
+        }
+
+        self._call_command("unittest", "auth.Group", "--watermark-field=id", "--overlap=1")
+        self.assertListEqual(self._synced_ids(), [str(g.pk) for g in self.groups[1:]])
+
+    def test_sync_failure(self) -> None:
+        self.test_client.bulk.side_effect = lambda body: {
+            "errors": True,
+            "items": [
+                {"index": {"status": 400, "error": {"type": "mapper_parsing_exception"}}}
+                for _ in range(len(_parse_body(body)) // 2)
+            ],
+        }
+        with self.assertRaises(CommandError) as cm:
+            self._call_command("unittest", "auth.Group", "--watermark-field=id", "--chunk-size=2")
+        self.assertIsInstance(cm.exception.__cause__, RuntimeError)  # not replaced when closing the writer
+        self.test_client.index.assert_not_called()  # no checkpoint is saved
+
+    def test_sync_reset_ignores_checkpoint(self) -> None:
+        self._call_command("unittest", "auth.Group", "--watermark-field=id", "--reset")
+        self.test_client.get.assert_not_called()
+        self.assertEqual(len(self._synced_ids()), 5)
+
+    def test_unregistered_model(self) -> None:
+        with self.assertRaises(CommandError) as cm:
+            self._call_command("unittest", "auth.Permission", "--watermark-field=id")
+        self.assertEqual(str(cm.exception), "Model 'auth.Permission' is not registered with model_sync")
+
+    def test_invalid_watermark_field(self) -> None:
+        with self.assertRaises(CommandError):
+            self._call_command("unittest", "auth.Group", "--watermark-field=updated")
+        with self.assertRaises(CommandError):  # an overlap can't be subtracted from a name
+            self._call_command("unittest", "auth.Group", "--watermark-field=name", "--overlap=10")
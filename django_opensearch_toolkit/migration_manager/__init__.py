@@ -8,4 +8,8 @@ These are analagous to Django migrations and this package aims to provide a
 lightweight version of what Django migrations provides for RDBMS databases.
 """
 
+from .alias_swap_migration import AliasSwapMigration
+from .create_index_migration import CreateIndexMigration
 from .opensearch_migration import OpenSearchMigration
+from .opensearch_task_migration import OpenSearchTaskMigration
+from .update_index_migration import UpdateIndexMigration
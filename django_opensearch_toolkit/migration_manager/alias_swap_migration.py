@@ -0,0 +1,219 @@
+"""Built-in migration to rebuild an index behind an alias without downtime."""
+
+import copy
+from logging import getLogger
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from opensearchpy.client import OpenSearch
+from opensearchpy.connection import connections
+from opensearchpy.exceptions import NotFoundError
+
+from django_opensearch_toolkit.indexing.reindexer import OpenSearchReindexer, Transform
+from django_opensearch_toolkit.signals import index_written
+
+from .opensearch_migration import OpenSearchMigration
+
+
+_logger = getLogger(__name__)
+
+
+class AliasSwapMigration(OpenSearchMigration):
+    """Build a new versioned index, load it, and atomically point an alias to it.
+
+    Searches should always go through the alias. While the new index
+    `{alias}_v{version}` is built, the alias keeps pointing to the current
+    (warm) index, so searches are never served from a half-built index:
+
+        1. Create the new index with refresh disabled and zero replicas.
+        2. Load it (by default, reindex the documents behind the alias).
+        3. Restore the refresh interval and replicas, and wait for the replicas.
+        4. Force-merge it, and refresh it.
+        5. Atomically move the alias from the old index(es) to the new one.
+
+    Override load() to populate the new index from another source (e.g.,
+    with an OpenSearchBulkWriter).
+
+    If `alias` is (still) the name of a concrete index, e.g., one created by an
+    earlier migration, the documents are reindexed from it, and it is deleted
+    by the swap (with a `remove_index` action), so the alias can take its name.
+
+    NOTE: documents written to the old index(es) after the load started are
+    not in the new index, and are lost at the swap. Pause writes during the
+    migration, or replay them afterwards (e.g., with `opensearch_sync`).
+    """
+
+    def __init__(
+        self,
+        key: str,
+        alias: str,
+        version: int,
+        index_body: Dict[str, Any],
+        transform: Optional[Transform] = None,
+        forcemerge: bool = True,
+        delete_old_indices: bool = False,
+        health_timeout: str = "5m",
+        dependencies: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Initialize the migration.
+
+        Args:
+            key: A globally unique identifier for this migration.
+            alias: The alias to (re)point to the new index.
+            version: The version of the new index, named `{alias}_v{version}`.
+            index_body: The body to create the new index with (settings, mappings).
+            transform: Optional function applied to each document when reindexing.
+            forcemerge: Whether to force-merge the new index to one segment before the swap.
+            delete_old_indices: Whether to delete the indices the alias pointed to after the swap.
+                A concrete index named `alias` is always deleted.
+            health_timeout: How long to wait for the new index's replicas before the swap.
+            dependencies: Keys of the migrations that must be applied before this one.
+        """
+        super().__init__(key=key, dependencies=dependencies)
+        self.alias = alias
+        self.version = version
+        self.index_name = f"{alias}_v{version}"
+        self.index_body = index_body
+        self.transform = transform
+        self.forcemerge = forcemerge
+        self.delete_old_indices = delete_old_indices
+        self.health_timeout = health_timeout
+
+    def serialize(self) -> str:
+        """Return a textual description of the migration run to store in the log."""
+        return f"Build index {self.index_name} and point alias {self.alias} to it"
+
+    def apply(self, connection_name: str) -> bool:
+        """Perform the migration."""
+        client = connections.get_connection(connection_name)
+
+        if client.indices.exists(index=self.index_name):
+            _logger.error(f"Found existing index with name: {self.index_name}")
+            return False
+        old_indices, replaces_index = self._get_current_indices(client)
+
+        load_body = copy.deepcopy(self.index_body)
+        load_settings = load_body.setdefault("settings", {})
+        refresh_interval = _pop_index_setting(load_settings, "refresh_interval")
+        number_of_replicas = _pop_index_setting(load_settings, "number_of_replicas")
+        final_settings = {
+            "refresh_interval": refresh_interval,  # None resets to the default
+            "number_of_replicas": "1" if number_of_replicas is None else number_of_replicas,
+        }
+        load_settings.setdefault("index", {}).update(refresh_interval="-1", number_of_replicas="0")
+        self._log(f"Creating index {self.index_name}")
+        client.indices.create(index=self.index_name, body=load_body)
+
+        # Until the alias is swapped, a failure deletes the new index, so the migration can be retried
+        try:
+            succeeded = self._load_and_swap(
+                connection_name, client, old_indices, replaces_index, final_settings
+            )
+        except Exception:
+            _logger.exception(f"[{self.__class__.__name__}] Failed to build {self.index_name}")
+            succeeded = False
+        if not succeeded:
+            self._log(f"Deleting partially built index {self.index_name}")
+            client.indices.delete(index=self.index_name)
+            return False
+        index_written.send(sender=self.__class__, connection_name=connection_name, index=self.alias)
+
+        if self.delete_old_indices and not replaces_index:  # a replaced index is deleted by the swap
+            for old_index in old_indices:
+                self._log(f"Deleting old index {old_index}")
+                client.indices.delete(index=old_index)
+        return True
+
+    def load(self, connection_name: str, index_name: str, old_indices: List[str]) -> bool:
+        """Populate the new index, while refreshes are disabled and there are no replicas.
+
+        By default, this copies (and optionally transforms) the documents behind the alias.
+
+        Args:
+            connection_name: The name of the OpenSearch connection to use.
+            index_name: The name of the new index.
+            old_indices: The indices the alias currently points to (may be empty).
+
+        Returns:
+            bool: True if the load was successful, False otherwise.
+        """
+        if not old_indices:
+            self._log(f"Alias {self.alias} does not exist yet. Nothing to load.")
+            return True
+        result = OpenSearchReindexer(connection_name).reindex(
+            source=",".join(old_indices),
+            dest=index_name,
+            transform=self.transform,
+        )
+        if not result.succeeded:
+            _logger.error(f"[{self.__class__.__name__}] Reindex failures: {result.failures[:5]}")
+        return result.succeeded
+
+    def _load_and_swap(
+        self,
+        connection_name: str,
+        client: OpenSearch,
+        old_indices: List[str],
+        replaces_index: bool,
+        final_settings: Dict[str, Any],
+    ) -> bool:
+        """Load the new index, restore its settings, and swap the alias to it."""
+        if not self.load(connection_name, self.index_name, old_indices):
+            return False
+
+        self._log(f"Restoring settings of {self.index_name}: {final_settings}")
+        client.indices.put_settings(index=self.index_name, body={"index": final_settings})
+        # A timeout is returned as a 408, which would otherwise raise
+        health = client.cluster.health(
+            index=self.index_name,
+            wait_for_status="green",
+            timeout=self.health_timeout,
+            ignore=408,
+        )
+        if health.get("timed_out"):
+            _logger.warning(
+                f"[{self.__class__.__name__}] {self.index_name} is {health.get('status')}, not green. "
+                "Swapping the alias anyway."
+            )
+
+        if self.forcemerge:
+            self._log(f"Force-merging {self.index_name}")
+            client.indices.forcemerge(index=self.index_name, max_num_segments=1)
+        client.indices.refresh(index=self.index_name)
+
+        actions: List[Dict[str, Any]]
+        if replaces_index:
+            actions = [{"remove_index": {"index": self.alias}}]
+        else:
+            actions = [{"remove": {"index": i, "alias": self.alias}} for i in old_indices]
+        actions.append({"add": {"index": self.index_name, "alias": self.alias}})
+        self._log(f"Pointing alias {self.alias} from {old_indices} to {self.index_name}")
+        client.indices.update_aliases(body={"actions": actions})
+        return True
+
+    def _get_current_indices(self, client: OpenSearch) -> Tuple[List[str], bool]:
+        """Return the (sorted) indices the alias currently points to, and whether it is an index instead."""
+        try:
+            return sorted(client.indices.get_alias(name=self.alias).keys()), False
+        except NotFoundError:
+            pass
+        if client.indices.exists(index=self.alias):
+            return [self.alias], True
+        return [], False
+
+    def _log(self, message: str) -> None:
+        """Log message with a custom prefix."""
+        _logger.info(f"[{self.__class__.__name__}] [{self.get_key()}] {message}")
+
+
+def _pop_index_setting(settings: Dict[str, Any], name: str) -> Any:
+    """Remove an index setting from settings in any of its forms, and return its value (or None).
+
+    Index settings can be nested (`{"index": {name: ...}}`), flat (`{name: ...}`,
+    as produced by `Document._index.to_dict()`), or dotted (`{"index.name": ...}`).
+    """
+    value = settings.pop(name, None)
+    value = settings.pop(f"index.{name}", value)
+    nested = settings.get("index")
+    if isinstance(nested, dict):
+        value = nested.pop(name, value)
+    return value
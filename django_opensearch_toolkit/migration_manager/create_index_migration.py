@@ -0,0 +1,54 @@
+"""Built-in migration to create an index."""
+
+from logging import getLogger
+from typing import Any, Dict, Optional, Sequence
+
+from opensearchpy.connection import connections
+
+from .opensearch_migration import OpenSearchMigration
+
+
+_logger = getLogger(__name__)
+
+
+class CreateIndexMigration(OpenSearchMigration):
+    """Create an index with the given body (settings, mappings, aliases).
+
+    The body is stored in the migration itself (e.g., copied from a Document's
+    `_index.to_dict()` by opensearch_makemigrations), so the migration stays
+    immutable when the Document changes.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        index: str,
+        body: Dict[str, Any],
+        dependencies: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Initialize the migration.
+
+        Args:
+            key: A globally unique identifier for this migration.
+            index: The name of the index to create.
+            body: The body to create the index with.
+            dependencies: Keys of the migrations that must be applied before this one.
+        """
+        super().__init__(key=key, dependencies=dependencies)
+        self.index = index
+        self.body = body
+
+    def serialize(self) -> str:
+        """Return a textual description of the migration run to store in the log."""
+        return f"Create index {self.index}"
+
+    def apply(self, connection_name: str) -> bool:
+        """Perform the migration."""
+        client = connections.get_connection(connection_name)
+        if client.indices.exists(index=self.index):
+            _logger.error(f"Found existing index with name: {self.index}")
+            return False
+
+        response = client.indices.create(index=self.index, body=self.body)
+        _logger.info(f"[{self.__class__.__name__}] [{self.get_key()}] {response}")
+        return True
@@ -0,0 +1,224 @@
+"""Diff the mappings and settings of an index, classifying each change by how it can be applied.
+
+OpenSearch can apply some changes to an existing index in place (new fields,
+new multi-fields, dynamic settings like `number_of_replicas`), with
+put_mapping and put_settings. Any other change (a new field type or analyzer,
+a removed field, static settings like `number_of_shards`) needs a new index
+and a reindex (see AliasSwapMigration).
+"""
+
+import copy
+import dataclasses
+import enum
+from typing import Any, Dict, List, Optional, Sequence
+
+from .alias_swap_migration import AliasSwapMigration
+from .create_index_migration import CreateIndexMigration
+from .opensearch_migration import OpenSearchMigration
+from .update_index_migration import UpdateIndexMigration
+
+
+# Field parameters that put_mapping can change on an existing field
+_UPDATABLE_FIELD_PARAMS = {"ignore_above", "search_analyzer", "search_quote_analyzer", "meta", "dynamic"}
+# Top-level mapping parameters that put_mapping can change
+_UPDATABLE_MAPPING_PARAMS = {"dynamic", "dynamic_templates", "_meta", "date_detection", "numeric_detection"}
+# Index settings (or prefixes of them) that can only be set when an index is created
+_STATIC_SETTINGS = {"number_of_shards", "number_of_routing_shards", "codec", "routing_partition_size", "knn"}
+_STATIC_SETTING_PREFIXES = ("analysis.", "sort.", "store.", "soft_deletes.")
+
+
+@enum.unique
+class ChangeKind(enum.Enum):
+    """How a change can be applied to an existing index."""
+
+    ADDITIVE = "ADDITIVE"  # in place, with put_mapping or put_settings
+    BREAKING = "BREAKING"  # only by building a new index
+
+
+@dataclasses.dataclass(frozen=True)
+class MappingChange:
+    """A single difference between the current and target index bodies."""
+
+    path: str  # e.g., "mappings.properties.name" or "settings.number_of_replicas"
+    kind: ChangeKind
+    description: str
+
+
+@dataclasses.dataclass
+class MappingDiff:
+    """The differences between the current and target index bodies."""
+
+    changes: List[MappingChange] = dataclasses.field(default_factory=list)
+    # Bodies to apply the additive changes with, if there are no breaking ones
+    put_mapping_body: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    put_settings_body: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the index is already up to date."""
+        return not self.changes
+
+    @property
+    def is_breaking(self) -> bool:
+        """Whether any change needs a new index."""
+        return any(c.kind == ChangeKind.BREAKING for c in self.changes)
+
+
+def diff_index_bodies(current: Dict[str, Any], target: Dict[str, Any]) -> MappingDiff:
+    """Diff the bodies (with `mappings` and `settings`) of the current and target versions of an index.
+
+    Only the settings in the target body are compared, since a live index reports
+    every setting, including defaults and read-only ones (e.g., `uuid`).
+    """
+    diff = MappingDiff()
+    current_mappings = current.get("mappings", {})
+    target_mappings = target.get("mappings", {})
+
+    for param in sorted(set(current_mappings) | set(target_mappings)):
+        if param == "properties" or current_mappings.get(param) == target_mappings.get(param):
+            continue
+        if param in _UPDATABLE_MAPPING_PARAMS and param in target_mappings:
+            diff.changes.append(MappingChange(f"mappings.{param}", ChangeKind.ADDITIVE, f"Changed {param}"))
+            diff.put_mapping_body[param] = target_mappings[param]
+        else:
+            diff.changes.append(MappingChange(f"mappings.{param}", ChangeKind.BREAKING, f"Changed {param}"))
+
+    new_properties = _diff_properties(
+        "mappings.properties",
+        current_mappings.get("properties", {}),
+        target_mappings.get("properties", {}),
+        diff.changes,
+    )
+    if new_properties:
+        diff.put_mapping_body["properties"] = new_properties
+
+    current_settings = normalize_settings(current.get("settings", {}))
+    for name, value in sorted(normalize_settings(target.get("settings", {})).items()):
+        if current_settings.get(name) == value:
+            continue
+        path = f"settings.{name}"
+        description = f"Changed {name} from {current_settings.get(name)} to {value}"
+        if name in _STATIC_SETTINGS or name.startswith(_STATIC_SETTING_PREFIXES):
+            diff.changes.append(MappingChange(path, ChangeKind.BREAKING, description))
+        else:
+            diff.changes.append(MappingChange(path, ChangeKind.ADDITIVE, description))
+            diff.put_settings_body[f"index.{name}"] = value
+
+    return diff
+
+
+def normalize_settings(settings: Dict[str, Any]) -> Dict[str, str]:
+    """Flatten index settings to dotted names without the `index.` prefix, with string values.
+
+    Index settings can be nested or dotted, with or without the `index` prefix,
+    and a live index reports them all as strings.
+    """
+    flat: Dict[str, str] = {}
+
+    def _flatten(prefix: str, value: Any) -> None:
+        if isinstance(value, dict):
+            for k, v in value.items():
+                _flatten(f"{prefix}.{k}" if prefix else str(k), v)
+        elif isinstance(value, bool):
+            flat[prefix] = str(value).lower()
+        elif isinstance(value, list):
+            flat[prefix] = ",".join(str(v) for v in value)
+        else:
+            flat[prefix] = str(value)
+
+    _flatten("", settings)
+    return {(name[len("index.") :] if name.startswith("index.") else name): v for name, v in flat.items()}
+
+
+def get_declared_index_bodies(migrations: Sequence[OpenSearchMigration]) -> Dict[str, Dict[str, Any]]:
+    """Return the index bodies described by the built-in migrations, by index (or alias) name.
+
+    Custom migrations are opaque, so they are ignored.
+    """
+    bodies: Dict[str, Dict[str, Any]] = {}
+    for m in migrations:
+        if isinstance(m, CreateIndexMigration):
+            bodies[m.index] = copy.deepcopy(m.body)
+        elif isinstance(m, AliasSwapMigration):
+            bodies[m.alias] = copy.deepcopy(m.index_body)
+        elif isinstance(m, UpdateIndexMigration) and m.index in bodies:
+            body = bodies[m.index]
+            _merge(body.setdefault("mappings", {}), m.mappings)
+            settings = normalize_settings(body.get("settings", {}))
+            settings.update(normalize_settings(m.settings))
+            body["settings"] = settings
+    return bodies
+
+
+def _diff_properties(
+    path: str,
+    current: Dict[str, Any],
+    target: Dict[str, Any],
+    changes: List[MappingChange],
+) -> Dict[str, Any]:
+    """Record the changes between two sets of field mappings, and return the new/updated ones."""
+    updated: Dict[str, Any] = {}
+    for name in sorted(set(current) | set(target)):
+        field_path = f"{path}.{name}"
+        if name not in target:
+            changes.append(MappingChange(field_path, ChangeKind.BREAKING, f"Removed field {name}"))
+        elif name not in current:
+            changes.append(MappingChange(field_path, ChangeKind.ADDITIVE, f"Added field {name}"))
+            updated[name] = target[name]
+        else:
+            field_update = _diff_field(field_path, current[name], target[name], changes)
+            if field_update is not None:
+                updated[name] = field_update
+    return updated
+
+
+def _diff_field(
+    path: str,
+    current: Dict[str, Any],
+    target: Dict[str, Any],
+    changes: List[MappingChange],
+) -> Optional[Dict[str, Any]]:
+    """Record the changes between two mappings of a field, and return its put_mapping body, if changed."""
+    current_type = current.get("type", "object" if "properties" in current else None)
+    target_type = target.get("type", "object" if "properties" in target else None)
+    if current_type != target_type:
+        changes.append(
+            MappingChange(path, ChangeKind.BREAKING, f"Changed type from {current_type} to {target_type}")
+        )
+        return None
+
+    update: Dict[str, Any] = {}
+    for param in sorted(set(current) | set(target)):
+        if param == "type" or current.get(param) == target.get(param):
+            continue
+        if param in ("properties", "fields"):
+            sub_update = _diff_properties(
+                f"{path}.{param}", current.get(param, {}), target.get(param, {}), changes
+            )
+            if sub_update:
+                update[param] = sub_update
+        elif param in _UPDATABLE_FIELD_PARAMS and param in target:
+            changes.append(MappingChange(f"{path}.{param}", ChangeKind.ADDITIVE, f"Changed {param}"))
+            update[param] = target[param]
+        else:
+            changes.append(
+                MappingChange(
+                    f"{path}.{param}",
+                    ChangeKind.BREAKING,
+                    f"Changed {param} from {current.get(param)} to {target.get(param)}",
+                )
+            )
+
+    if not update:
+        return None
+    # put_mapping needs the full definition of a leaf field, not just the changed parameters
+    return update if current_type == "object" else dict(target)
+
+
+def _merge(base: Dict[str, Any], update: Dict[str, Any]) -> None:
+    """Recursively merge update into base, like put_mapping does."""
+    for k, v in update.items():
+        if isinstance(v, dict) and isinstance(base.get(k), dict):
+            _merge(base[k], v)
+        else:
+            base[k] = copy.deepcopy(v)
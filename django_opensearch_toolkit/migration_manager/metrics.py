@@ -0,0 +1,85 @@
+"""Timing instrumentation for migration runs.
+
+Set OPENSEARCH_MIGRATION_METRICS_HOOK to the dotted path of a function that
+accepts a MigrationTiming, e.g. to forward the timings to statsd or Prometheus.
+"""
+
+import contextlib
+import dataclasses
+import enum
+from logging import getLogger
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from django_opensearch_toolkit.conf import get_migration_metrics_hook
+from django_opensearch_toolkit.migration_manager.migration_log import MigrationLogStatus
+
+
+_logger = getLogger(__name__)
+
+
+@enum.unique
+class MigrationPhase(enum.Enum):
+    """Timed phases of a migration run."""
+
+    # Per run
+    CHECK_LOGS = "check_logs"  # stream and check the existing migration logs
+    FLUSH_LOGS = "flush_logs"  # flush the migration logs index at the end of the run
+    # Per migration
+    CREATE_LOG = "create_log"  # create the IN_PROGRESS log (including its flush and read-back)
+    APPLY = "apply"  # apply the migration (or submit and watch its task)
+    UPDATE_LOG = "update_log"  # update the log with its terminal status
+
+
+@dataclasses.dataclass(frozen=True)
+class MigrationTiming:
+    """Duration of a phase of a migration run."""
+
+    connection_name: str
+    phase: MigrationPhase
+    duration_ms: int
+    key: Optional[str] = None  # None for per-run phases
+    status: Optional[str] = None  # terminal status of the migration, if known
+
+
+def emit_timing(timing: MigrationTiming) -> None:
+    """Send a timing to the configured metrics hook, if any. Errors in the hook are logged, not raised."""
+    hook = get_migration_metrics_hook()
+    if hook is None:
+        return
+    try:
+        hook(timing)
+    except Exception:
+        _logger.exception(f"Failed to emit migration timing: {timing}")
+
+
+@contextlib.contextmanager
+def timed(durations_ms: Dict[MigrationPhase, int], phase: MigrationPhase) -> Iterator[None]:
+    """Record the duration of the enclosed block in `durations_ms`, in milliseconds."""
+    started_at = time.monotonic()
+    try:
+        yield
+    finally:
+        durations_ms[phase] = int(1000 * (time.monotonic() - started_at))
+
+
+@dataclasses.dataclass
+class MigrationStats:
+    """Summary of the migration logs of a cluster."""
+
+    count_by_status: Dict[str, int] = dataclasses.field(default_factory=dict)
+    total_duration_ms: int = 0  # over completed migrations
+    phase_totals_ms: Dict[str, int] = dataclasses.field(default_factory=dict)
+    slowest: List[Tuple[int, str]] = dataclasses.field(default_factory=list)  # (duration_ms, key), descending
+
+    @property
+    def completed(self) -> int:
+        """Number of migrations that succeeded or failed."""
+        return sum(
+            n for status, n in self.count_by_status.items() if status != MigrationLogStatus.IN_PROGRESS.value
+        )
+
+    @property
+    def mean_duration_ms(self) -> float:
+        """Mean duration of completed migrations."""
+        return self.total_duration_ms / self.completed if self.completed > 0 else 0.0
@@ -9,7 +9,7 @@ migrations against that database, with each row being a separate migration.
 import enum
 
 from opensearchpy.helpers.document import Document
-from opensearchpy.helpers.field import Date, Keyword, Integer, Text
+from opensearchpy.helpers.field import Date, Keyword, Integer, Long, Object, Text
 
 
 @enum.unique
@@ -35,6 +35,14 @@ class MigrationLog(Document):
     status = Keyword(required=True)
     started_at = Date(required=True)
     ended_at = Date()  # Optional as it's not set until completion
+    task_id = Keyword()  # Optional, set for migrations running as an OpenSearch task
+    # Milliseconds spent in each phase before the terminal update (see metrics.MigrationPhase)
+    durations_ms = Object(
+        properties={
+            "create_log": Long(),
+            "apply": Long(),
+        }
+    )
 
     class Index:
         """Configuration for the index."""
@@ -52,4 +60,5 @@ class MigrationLog(Document):
         Sets the document ID to match the migration key for unique lookup capability.
         """
         super().__init__(*args, **kwargs)
-        self.__dict__["meta"]["id"] = self.key
+        if self.key is not None:  # not set yet when loaded from a search hit, which has the ID already
+            self.__dict__["meta"]["id"] = self.key
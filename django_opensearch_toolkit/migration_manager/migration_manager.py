@@ -1,35 +1,109 @@
 """Utility class for managing the state of migrations against an OpenSearch cluster."""
 
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import dataclasses
+from datetime import datetime
+import enum
+import heapq
 from logging import getLogger
 import time
-from typing import Final, List, Sequence
+from typing import Any, Dict, Final, Iterator, List, Optional, Sequence, Set, Tuple, cast
 
 from opensearchpy.client import OpenSearch
 from opensearchpy.connection import connections
 from opensearchpy.exceptions import ConflictError, NotFoundError
 from opensearchpy.helpers.index import Index
 
+from django_opensearch_toolkit.indexing.tasks import wait_for_task
+from django_opensearch_toolkit.migration_manager.metrics import (
+    MigrationPhase,
+    MigrationStats,
+    MigrationTiming,
+    emit_timing,
+    timed,
+)
 from django_opensearch_toolkit.migration_manager.migration_log import MigrationLog, MigrationLogStatus
+from django_opensearch_toolkit.migration_manager.migration_state import MigrationState
 from django_opensearch_toolkit.migration_manager.opensearch_migration import OpenSearchMigration
+from django_opensearch_toolkit.migration_manager.opensearch_task_migration import OpenSearchTaskMigration
 
 
 _logger = getLogger(__name__)
 
 
+@enum.unique
+class MigrationLogDurability(enum.Enum):
+    """How writes to the migration log are made durable and visible."""
+
+    # Each write waits for a refresh (the translog makes it durable), and the
+    # log index is flushed once at the end of a run.
+    REFRESH = "REFRESH"
+    # The log index is flushed (Lucene commit + fsync on every shard copy) after every write.
+    FLUSH = "FLUSH"
+
+
+@dataclasses.dataclass
+class MigrationsStatus:
+    """Status of each supplied migration against a cluster, by key."""
+
+    applied: List[str] = dataclasses.field(default_factory=list)
+    in_progress: List[str] = dataclasses.field(default_factory=list)
+    failed: List[str] = dataclasses.field(default_factory=list)
+    pending: List[str] = dataclasses.field(default_factory=list)
+
+    @property
+    def up_to_date(self) -> bool:
+        """Whether all supplied migrations were applied."""
+        return not (self.in_progress or self.failed or self.pending)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable summary."""
+        return {"up_to_date": self.up_to_date, **dataclasses.asdict(self)}
+
+
 class OpenSearchMigrationsManager:
     """Utility class for managing the state of migrations against an OpenSearch cluster."""
 
-    def __init__(self, connection_name: str, max_migrations_to_fetch: int = 5_000) -> None:
+    def __init__(
+        self,
+        connection_name: str,
+        page_size: int = 500,
+        durability: MigrationLogDurability = MigrationLogDurability.REFRESH,
+        max_workers: int = 1,
+        wait_for_tasks: bool = True,
+        use_fingerprint: bool = True,
+    ) -> None:
         """Initialize the manager.
 
-        NOTE: this implementation will fetch all migration logs in one shot and
-        load them into memory. This should be perfectly fine for a long time. If
-        the number of migration logs grows very large, we could batch load these.
-        The implementation here is correct only if the number of logs is less than
-        the `max_migrations_to_fetch` parameter.
+        Migration logs are streamed in pages of `page_size` (using search_after
+        on their order), so any number of logs can be checked with flat memory.
+
+        With the default REFRESH `durability`, log writes wait for a refresh
+        and the log index is flushed once per run, instead of after every write.
+
+        Up to `max_workers` migrations whose dependencies are all applied are
+        applied concurrently.
+
+        Task migrations (see OpenSearchTaskMigration) are watched until their
+        task completes, unless `wait_for_tasks` is False. In that case, they are
+        left IN_PROGRESS, and a later run resumes watching them. After a run,
+        `running_task_ids` and `blocked_migrations` tell which migrations are
+        still running, and which were not applied because they depend on them.
+
+        With `use_fingerprint`, a run first compares a fingerprint of the
+        supplied migrations with the one saved by the last complete run (see
+        MigrationState). If they match, there is nothing to migrate, and the
+        migration logs are not read.
         """
         self.connection_name: Final[str] = connection_name
-        self.max_migrations_to_fetch: Final[int] = max_migrations_to_fetch
+        self.page_size: Final[int] = page_size
+        self.durability: Final[MigrationLogDurability] = durability
+        self.max_workers: Final[int] = max(1, max_workers)
+        self.wait_for_tasks: Final[bool] = wait_for_tasks
+        self.use_fingerprint: Final[bool] = use_fingerprint
+        self.running_task_ids: Dict[str, str] = {}  # task ids of the migrations left running, by key
+        self.blocked_migrations: List[str] = []  # keys of the migrations waiting on them
+        self._has_unflushed_logs = False
         self.migration_log_index: Final[Index] = Index(
             name=MigrationLog.Index.name,
             using=self.connection_name,
@@ -43,65 +117,270 @@ class OpenSearchMigrationsManager:
         self._create_migration_logs_index_if_not_exists()
         self._get_and_display_all_migration_logs()
 
-    def run_migrations(self, migrations: Sequence[OpenSearchMigration], dry: bool = True) -> None:
+    def get_migration_stats(self, top: int = 10) -> MigrationStats:
+        """Summarize the durations of the logged migrations, streaming over the logs.
+
+        Args:
+            top: Number of slowest migrations to report.
+        """
+        self._create_migration_logs_index_if_not_exists()
+        stats = MigrationStats()
+        slowest: List[Tuple[int, str]] = []  # min-heap of the `top` slowest migrations
+        for log in self._iter_migration_logs():
+            status = str(log.status)
+            stats.count_by_status[status] = stats.count_by_status.get(status, 0) + 1
+            for phase, duration_ms in (log.durations_ms.to_dict() if log.durations_ms else {}).items():
+                stats.phase_totals_ms[phase] = stats.phase_totals_ms.get(phase, 0) + duration_ms
+            if log.ended_at is None:
+                continue
+            started_at = cast(datetime, log.started_at)
+            ended_at = cast(datetime, log.ended_at)
+            duration_ms = int((ended_at - started_at).total_seconds() * 1000)
+            stats.total_duration_ms += duration_ms
+            heapq.heappush(slowest, (duration_ms, str(log.key)))
+            if len(slowest) > top:
+                heapq.heappop(slowest)
+        stats.slowest = sorted(slowest, reverse=True)
+        return stats
+
+    def get_migrations_status(self, migrations: Sequence[OpenSearchMigration]) -> MigrationsStatus:
+        """Look up the status of the supplied migrations, without reading the whole migration history.
+
+        This takes a single GET if the fingerprint matches (see run_migrations), and
+        otherwise an mget of the supplied keys, `page_size` keys at a time. It is
+        read-only (the migration logs index is not created), so it is cheap enough
+        to be used as a readiness probe.
+        """
+        status = MigrationsStatus()
+        if self.use_fingerprint and self._is_fully_applied(migrations):
+            status.applied = [m.get_key() for m in migrations]
+            return status
+
+        keys = [m.get_key() for m in migrations]
+        for start in range(0, len(keys), self.page_size):
+            page = keys[start : start + self.page_size]
+            try:
+                docs = self.client.mget(index=MigrationLog.Index.name, body={"ids": page})["docs"]
+            except NotFoundError:  # the migration logs index does not exist yet
+                docs = [{"_id": key, "found": False} for key in page]
+            for doc in docs:
+                log_status = doc.get("_source", {}).get("status") if doc.get("found") else None
+                if log_status == MigrationLogStatus.SUCCEEDED.value:
+                    status.applied.append(doc["_id"])
+                elif log_status == MigrationLogStatus.IN_PROGRESS.value:
+                    status.in_progress.append(doc["_id"])
+                elif log_status == MigrationLogStatus.FAILED.value:
+                    status.failed.append(doc["_id"])
+                else:
+                    status.pending.append(doc["_id"])
+        return status
+
+    def run_migrations(self, migrations: Sequence[OpenSearchMigration], dry: bool = True) -> bool:
         """Apply all migrations, skipping those that were already applied.
 
-        Will abort on any faillure or any inconsistency in the migration log.
+        Will abort on any faillure or any inconsistency in the migration log. Logs of migrations
+        beyond the supplied ones (e.g., after rolling back a deploy) are only warned about.
+
+        Returns:
+            bool: True if all migrations were applied (or skipped in dry mode), False if aborted.
+                Without `wait_for_tasks`, True is also returned while task migrations are still
+                running (see `running_task_ids` and `blocked_migrations`).
         """
+        self.running_task_ids = {}
+        self.blocked_migrations = []
+        if self.use_fingerprint and self._is_fully_applied(migrations):
+            self._log(f"All {len(migrations)} migrations were already applied (fingerprint matches)")
+            return True
+
         self._create_migration_logs_index_if_not_exists()
+        if not dry:
+            self._add_missing_migration_log_fields()
         self._log(f"Running {len(migrations)} migrations in mode {dry=}")
+        try:
+            return self._check_and_apply_migrations(migrations, dry)
+        finally:
+            self._flush_migration_logs_if_needed()
 
-        # Retrieve the existing migrations
-        existing_migration_logs = self._get_and_display_all_migration_logs()
-
-        # Abort if any have failed or are in-progress
-        any_failed_or_in_progress = any(
-            log.status != MigrationLogStatus.SUCCEEDED.value for log in existing_migration_logs
-        )
-        if any_failed_or_in_progress:
-            self._log(
-                "Aborting because a failed or in-progress migration was found. "
-                "Cluster may be in an inconsistent or transient state. "
-                "Please fix before attempting to run this script again."
-            )
-            return
+    # Private Methods
 
-        # Apply migrations one-by-one
-        for i, m in enumerate(migrations):
-            # Check if the migration was already applied
-            if len(existing_migration_logs) > i:
-                if existing_migration_logs[i].order != i:
-                    self._log("Aborting because migration history order is incorrect")
-                    return
-
-                if existing_migration_logs[i].key != m.get_key():
-                    self._log(
-                        f"Aborting because migration history doesn't match supplied migrations: "
-                        f"Existing Migration at Position {i} = [{existing_migration_logs[i].key}] != "
-                        f"Supplied Migration at Position {i} [{m.get_key()}]"
-                    )
-                    return
+    def _check_and_apply_migrations(self, migrations: Sequence[OpenSearchMigration], dry: bool) -> bool:
+        """Check the existing migration logs and apply the remaining migrations (see run_migrations)."""
+        dependencies = self._resolve_dependencies(migrations)
+        if dependencies is None:
+            return False
 
-                else:
-                    self._log(f"[key={m.get_key()}] Migration already applied. Skipping.")
-                    continue
+        # Stream the existing migrations, checking each against the supplied ones.
+        # Only the keys of applied migrations are kept in memory.
+        check_started_at = time.monotonic()
+        position_by_key = {m.get_key(): i for i, m in enumerate(migrations)}
+        applied: Set[str] = set()
+        running_tasks: Dict[str, MigrationLog] = {}  # task migrations to resume watching
+        for log in self._iter_migration_logs():
+            self._print_migration_logs([log])
+            key = str(log.key)
+            if key not in position_by_key and int(log.order) >= len(migrations):
+                # e.g., after rolling back a deploy, logs of the newer migrations are beyond the supplied ones
+                _logger.warning(
+                    f"{self._log_prefix()} Existing Migration [{log.key}] at Position {log.order} "
+                    "is beyond the supplied migrations. Ignoring it."
+                )
+                if not self._check_migration_log_status(log):
+                    return False
+                continue
+            if key not in position_by_key:
+                self._log(
+                    f"Aborting because migration history doesn't match supplied migrations: "
+                    f"Existing Migration [{log.key}] at Position {log.order} is not supplied"
+                )
+                return False
+
+            if log.order != position_by_key[key]:
+                self._log(
+                    f"Aborting because migration history order is incorrect: Existing Migration [{log.key}] "
+                    f"at Position {log.order} is supplied at Position {position_by_key[key]}"
+                )
+                return False
+
+            if self._is_running_task(log, migrations[position_by_key[key]]):
+                running_tasks[key] = log
+                continue
+
+            if not self._check_migration_log_status(log):
+                return False
+
+            applied.add(key)
+        self._log(f"Found {len(applied) + len(running_tasks)} existing migrations")
+
+        # Abort if an applied (or running) migration has a dependency that was not applied
+        for key in applied | set(running_tasks):
+            missing = [dep for dep in dependencies[key] if dep not in applied]
+            if missing:
+                self._log(
+                    f"Aborting because migration history is inconsistent: "
+                    f"[{key}] was applied before its dependencies {missing}"
+                )
+                return False
+        self._emit_timing(MigrationPhase.CHECK_LOGS, int(1000 * (time.monotonic() - check_started_at)))
+
+        for m in migrations:
+            if m.get_key() in applied:
+                self._log(f"[key={m.get_key()}] Migration already applied. Skipping.")
+            elif m.get_key() in running_tasks:
+                task_id = running_tasks[m.get_key()].task_id
+                self._log(f"[key={m.get_key()}] Migration is running as task {task_id}")
+            elif dry:
+                self._log(f"[key={m.get_key()}] Skipping because in dry mode")
+        if dry:
+            return True
+
+        if len(applied) < len(migrations):
+            self._invalidate_fingerprint()
+        applied_after = self._apply_migrations_graph(migrations, dependencies, applied, running_tasks)
+        if applied_after is None:
+            return False
+        if len(applied_after) == len(migrations):
+            self._save_fingerprint(migrations)
+        return True
 
-            # Migration not applied. Apply it now
-            else:
-                if dry:
-                    self._log(f"[key={m.get_key()}] Skipping because in dry mode")
+    def _resolve_dependencies(
+        self, migrations: Sequence[OpenSearchMigration]
+    ) -> Optional[Dict[str, List[str]]]:
+        """Return the dependencies of each migration by key, or None if they are invalid.
 
-                else:
-                    success = self._run_migration(order=i, migration=m)
-                    if not success:
-                        self._log("Aborting because a migration failed to complete")
-                        return
+        Dependencies must appear earlier in the list, so the graph is acyclic by construction.
+        """
+        dependencies: Dict[str, List[str]] = {}
+        for i, m in enumerate(migrations):
+            key = m.get_key()
+            if key in dependencies:
+                self._log(f"Aborting because migration key [{key}] is duplicated")
+                return None
+
+            deps = m.get_dependencies()
+            if deps is None:  # depend on the previous entry
+                deps = [migrations[i - 1].get_key()] if i > 0 else []
+
+            unknown = [dep for dep in deps if dep not in dependencies]
+            if unknown:
+                self._log(
+                    f"Aborting because the dependencies {unknown} of [{key}] "
+                    "are not supplied before it in the migrations"
+                )
+                return None
+            dependencies[key] = deps
+        return dependencies
+
+    def _apply_migrations_graph(
+        self,
+        migrations: Sequence[OpenSearchMigration],
+        dependencies: Dict[str, List[str]],
+        applied: Set[str],
+        running_tasks: Dict[str, MigrationLog],
+    ) -> Optional[Set[str]]:
+        """Apply the pending migrations once their dependencies are applied, up to max_workers at a time.
+
+        Ready migrations are started in the order they are supplied, so with a
+        single worker, this is the same as applying them one-by-one. On a
+        failure, no new migrations are started, but running ones are awaited.
+        Task migrations in `running_tasks` are resumed, i.e., their task is watched.
+
+        Returns:
+            Optional[Set[str]]: The keys of all applied migrations, or None if a migration failed.
+        """
+        pending = [(i, m) for i, m in enumerate(migrations) if m.get_key() not in applied]
+        applied = set(applied)
+        running: Dict["Future[Optional[bool]]", OpenSearchMigration] = {}
+        failed = False
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=self.__class__.__name__
+        ) as pool:
+            while pending or running:
+                if not failed:
+                    for i, m in list(pending):
+                        if len(running) >= self.max_workers:
+                            break
+                        if all(dep in applied for dep in dependencies[m.get_key()]):
+                            pending.remove((i, m))
+                            if m.get_key() in running_tasks:
+                                log = running_tasks[m.get_key()]
+                                future = pool.submit(self._watch_task_migration, log, m)
+                            else:
+                                future = pool.submit(self._run_migration, order=i, migration=m)
+                            running[future] = m
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    m = running.pop(future)
+                    success = future.result()
+                    if success is None:  # still running as a task
+                        continue
+                    if success:
+                        applied.add(m.get_key())
+                    else:
+                        failed = True
+
+        if failed:
+            self._log("Aborting because a migration failed to complete")
+            return None
+        if pending:
+            self.blocked_migrations = [m.get_key() for _, m in pending]
+            self._log(
+                f"{len(pending)} migrations are waiting on running tasks "
+                f"{sorted(self.running_task_ids.values())}. "
+                "Run the migrations again to resume watching them."
+            )
+        return applied
 
-    # Private Methods
+    def _log_prefix(self) -> str:
+        """Return the prefix of log messages, to tell clusters apart when they run concurrently."""
+        return f"[{self.__class__.__name__}] [{self.connection_name}]"
 
     def _log(self, message: str) -> None:
         """Log message with a custom prefix."""
-        _logger.info(f"[{self.__class__.__name__}] {message}")
+        _logger.info(f"{self._log_prefix()} {message}")
 
     def _create_migration_logs_index_if_not_exists(self) -> None:
         """Create the index that tracks the migration logs."""
@@ -109,12 +388,82 @@ class OpenSearchMigrationsManager:
             self._log("Creating migration logs index")
             MigrationLog.init(using=self.connection_name)
 
+    def _add_missing_migration_log_fields(self) -> None:
+        """Add the MigrationLog fields missing from the mapping of the (existing) migration logs index.
+
+        Indices created by older versions lack the newer (optional) fields, e.g.,
+        task_id and durations_ms, and would map them dynamically. The mapping is
+        only written if fields are missing, and only before logs are written, so
+        read-only commands work with read-only credentials.
+        """
+        mapping = MigrationLog._doc_type.mapping.to_dict()
+        existing_fields: Set[str] = set()
+        for index_mapping in self.migration_log_index.get_mapping().values():
+            existing_fields.update(index_mapping.get("mappings", {}).get("properties", {}))
+        missing_fields = sorted(set(mapping.get("properties", {})) - existing_fields)
+        if missing_fields:
+            self._log(f"Adding fields {missing_fields} to the migration logs index")
+            self.migration_log_index.put_mapping(body=mapping)
+
     def _delete_migration_logs_index_if_exists(self) -> None:
         """Delete the index that tracks the migration logs."""
         if self.migration_log_index.exists():
             self._log("Deleting migration logs index")
             self.migration_log_index.delete()
 
+    def _flush_migration_logs_if_needed(self) -> None:
+        """Flush the migration logs index once, if logs were written without flushing it."""
+        if self._has_unflushed_logs:
+            durations: Dict[MigrationPhase, int] = {}
+            with timed(durations, MigrationPhase.FLUSH_LOGS):
+                self.migration_log_index.flush()
+            self._has_unflushed_logs = False
+            self._emit_timing(MigrationPhase.FLUSH_LOGS, durations[MigrationPhase.FLUSH_LOGS])
+
+    def _emit_timing(
+        self,
+        phase: MigrationPhase,
+        duration_ms: int,
+        key: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> None:
+        """Send the duration of a phase to the metrics hook."""
+        emit_timing(MigrationTiming(self.connection_name, phase, duration_ms, key=key, status=status))
+
+    def _is_fully_applied(self, migrations: Sequence[OpenSearchMigration]) -> bool:
+        """Return whether the last complete run applied exactly these migrations, with a single GET.
+
+        The fingerprint is deleted before any log is written (see _invalidate_fingerprint),
+        so it also implies there are no FAILED or IN_PROGRESS logs.
+        """
+        try:
+            response = self.client.get(index=MigrationState.Index.name, id=MigrationState.STATE_ID)
+        except NotFoundError:
+            return False
+        return response.get("_source", {}).get("fingerprint") == MigrationState.get_fingerprint(migrations)
+
+    def _invalidate_fingerprint(self) -> None:
+        """Delete the saved fingerprint, before writing logs that may end up FAILED or IN_PROGRESS.
+
+        The full check aborts on such logs, even beyond the supplied migrations
+        (e.g., those of a failed deploy, after rolling it back). Deleting the
+        fingerprint first ensures a saved fingerprint implies there are none, so
+        the fast path never accepts a history the full check would reject.
+        """
+        self.client.delete(index=MigrationState.Index.name, id=MigrationState.STATE_ID, ignore=404)
+
+    def _save_fingerprint(self, migrations: Sequence[OpenSearchMigration]) -> None:
+        """Save the fingerprint of the migrations, once they have all been applied."""
+        if not Index(name=MigrationState.Index.name, using=self.connection_name).exists():
+            MigrationState.init(using=self.connection_name)
+        state = MigrationState(
+            meta={"id": MigrationState.STATE_ID},
+            fingerprint=MigrationState.get_fingerprint(migrations),
+            num_migrations=len(migrations),
+            updated_at=int(1000 * time.time()),
+        )
+        state.save(using=self.connection_name)
+
     def _print_migration_logs(self, migration_logs: List[MigrationLog]) -> None:
         """Pretty-print the provided migration logs."""
         for log in migration_logs:
@@ -123,13 +472,44 @@ class OpenSearchMigrationsManager:
                 f"(started_at={log.started_at}, ended_at={log.ended_at})"
             )
 
+    @staticmethod
+    def _is_running_task(log: MigrationLog, migration: OpenSearchMigration) -> bool:
+        """Return whether the log is for a task migration whose task may still be running."""
+        return (
+            log.status == MigrationLogStatus.IN_PROGRESS.value
+            and bool(log.task_id)
+            and isinstance(migration, OpenSearchTaskMigration)
+        )
+
+    def _check_migration_log_status(self, log: MigrationLog) -> bool:
+        """Return whether the log succeeded, and log why we abort if it did not."""
+        if log.status != MigrationLogStatus.SUCCEEDED.value:
+            self._log(
+                "Aborting because a failed or in-progress migration was found. "
+                "Cluster may be in an inconsistent or transient state. "
+                "Please fix before attempting to run this script again."
+            )
+            return False
+        return True
+
+    def _iter_migration_logs(self) -> Iterator[MigrationLog]:
+        """Stream all migration logs in their applied order, one page at a time."""
+        last_order: Optional[int] = None
+        while True:
+            search = MigrationLog.search(using=self.connection_name)
+            search = search.extra(size=self.page_size)
+            search = search.sort("order")
+            if last_order is not None:
+                search = search.extra(search_after=[last_order])
+            hits = list(search.execute().hits)
+            yield from hits
+            if len(hits) < self.page_size:  # last page, skip the extra round-trip
+                return
+            last_order = hits[-1].order
+
     def _get_all_migration_logs(self) -> List[MigrationLog]:
         """Fetch all migration logs in their applied order."""
-        search = MigrationLog.search(using=self.connection_name)
-        search = search.extra(size=self.max_migrations_to_fetch)
-        search = search.sort("order")
-        existing_migration_logs = list(search.execute().hits)
-        return existing_migration_logs
+        return list(self._iter_migration_logs())
 
     def _get_and_display_all_migration_logs(self) -> List[MigrationLog]:
         """Fetch all migration logs in their applied order, and print them."""
@@ -138,6 +518,19 @@ class OpenSearchMigrationsManager:
         self._print_migration_logs(existing_migration_logs)
         return existing_migration_logs
 
+    def _write_params(self) -> Dict[str, Any]:
+        """Return extra parameters for writes to the migration logs index."""
+        if self.durability == MigrationLogDurability.REFRESH:
+            return {"refresh": "wait_for"}
+        return {}
+
+    def _after_write(self) -> None:
+        """Make a write to the migration logs index durable, according to the durability mode."""
+        if self.durability == MigrationLogDurability.FLUSH:
+            self.migration_log_index.flush()
+        else:
+            self._has_unflushed_logs = True
+
     def _create_migration_log_atomic(self, log: MigrationLog) -> bool:
         """Try to create the log as a document in the migration_log_index, and fail if it exists.
 
@@ -151,10 +544,12 @@ class OpenSearchMigrationsManager:
                 index=MigrationLog.Index.name,
                 id=log.meta.id,
                 body=log.to_dict(include_meta=False),
+                **self._write_params(),
             )
         except ConflictError:
             _logger.exception(
-                "Migraton log already exists. There might be a concurrent script running these migrations."
+                f"{self._log_prefix()} Migraton log already exists. "
+                "There might be a concurrent script running these migrations."
             )
             return False
 
@@ -163,12 +558,12 @@ class OpenSearchMigrationsManager:
             self._log("Failed to create initial migration log")
             return False
 
-        # Flush the index to ensure the document is persisted and check a search will find it
-        self.migration_log_index.flush()
+        # Ensure the document is persisted, and check we can find it
+        self._after_write()
         try:
             log2 = MigrationLog.get(id=log.meta.id, using=self.connection_name)
         except NotFoundError:
-            _logger.exception("Failed to find the migration log in the index")
+            _logger.exception(f"{self._log_prefix()} Failed to find the migration log in the index")
             return False
 
         # Confirm the commited log is marked IN_PROGRESS
@@ -178,14 +573,16 @@ class OpenSearchMigrationsManager:
 
         return True
 
-    def _run_migration(self, order: int, migration: OpenSearchMigration) -> bool:
-        """Apply a migration using write-ahead logging and terminal log updates."""
-        started_at = int(1000 * time.time())
+    def _run_migration(self, order: int, migration: OpenSearchMigration) -> Optional[bool]:
+        """Apply a migration using write-ahead logging and terminal log updates.
 
-        def _print_progress(message: str) -> None:
-            self._log(f"[key={migration.get_key()}] {message}")
+        Returns:
+            Optional[bool]: Whether the migration succeeded, or None if it is still running as a task.
+        """
+        started_at = int(1000 * time.time())
+        durations: Dict[MigrationPhase, int] = {}
 
-        _print_progress("[1/4] Creating migration log")
+        self._log_migration_progress(migration, "[1/4] Creating migration log")
         log = MigrationLog(
             order=order,
             key=migration.get_key(),
@@ -194,31 +591,132 @@ class OpenSearchMigrationsManager:
             started_at=started_at,
             ended_at=None,
         )
-        was_created = self._create_migration_log_atomic(log)
+        with timed(durations, MigrationPhase.CREATE_LOG):
+            was_created = self._create_migration_log_atomic(log)
         if not was_created:
             self._log("Failed to create migration log")
+            self._emit_timings(migration, durations, status=None)
             return False
 
-        _print_progress("[2/4] Applying migration operation")
+        if isinstance(migration, OpenSearchTaskMigration):
+            return self._run_task_migration(log, migration, durations)
+
+        self._log_migration_progress(migration, "[2/4] Applying migration operation")
         success = False
-        try:
-            success = migration.apply(self.connection_name)
-        except Exception:
-            _logger.exception("Failed to apply migration")
+        with timed(durations, MigrationPhase.APPLY):
+            try:
+                success = migration.apply(self.connection_name)
+            except Exception:
+                _logger.exception(f"{self._log_prefix()} Failed to apply migration")
+        return self._complete_migration_log(log, migration, success, durations)
+
+    def _run_task_migration(
+        self,
+        log: MigrationLog,
+        migration: OpenSearchTaskMigration,
+        durations: Dict[MigrationPhase, int],
+    ) -> Optional[bool]:
+        """Submit the task of a migration, record its id in the log, and watch it."""
+        self._log_migration_progress(migration, "[2/4] Submitting migration task")
+        with timed(durations, MigrationPhase.APPLY):
+            try:
+                task_id = migration.submit(self.connection_name)
+            except Exception:
+                _logger.exception(f"{self._log_prefix()} Failed to submit migration task")
+                task_id = None
+        if task_id is None:
+            return self._complete_migration_log(log, migration, False, durations)
+
+        result = log.update(using=self.connection_name, task_id=task_id, **self._write_params())
+        if result != "updated":
+            self._log("Failed to update migration log")
+            self._emit_timings(migration, durations, status=None)
+            return False
+        self._after_write()
+        return self._watch_task_migration(log, migration, durations)
+
+    def _watch_task_migration(
+        self,
+        log: MigrationLog,
+        migration: OpenSearchMigration,
+        durations: Optional[Dict[MigrationPhase, int]] = None,
+    ) -> Optional[bool]:
+        """Poll the task of a migration until it completes, and complete its log."""
+        assert isinstance(migration, OpenSearchTaskMigration)
+        durations = durations if durations is not None else {}
+        if not self.wait_for_tasks:
+            self.running_task_ids[migration.get_key()] = str(log.task_id)
+            self._log_migration_progress(
+                migration, f"Task {log.task_id} is running. Run the migrations again to resume watching it."
+            )
+            self._emit_timings(migration, durations, status=MigrationLogStatus.IN_PROGRESS.value)
+            return None
+
+        self._log_migration_progress(migration, f"[2/4] Watching migration task {log.task_id}")
+        success = False
+        submit_ms = durations.get(MigrationPhase.APPLY, 0)
+        with timed(durations, MigrationPhase.APPLY):
+            try:
+                task_result = wait_for_task(
+                    self.client,
+                    str(log.task_id),
+                    poll_interval=migration.poll_interval,
+                    on_progress=lambda progress: self._log_migration_progress(migration, progress.describe()),
+                )
+                success = migration.check_result(task_result)
+                if not success:
+                    self._log_migration_progress(
+                        migration,
+                        f"Task failed: error={task_result.error}, failures={task_result.failures[:5]}",
+                    )
+            except Exception:
+                _logger.exception(f"{self._log_prefix()} Failed to watch migration task")
+        durations[MigrationPhase.APPLY] += submit_ms
+        return self._complete_migration_log(log, migration, success, durations)
+
+    def _complete_migration_log(
+        self,
+        log: MigrationLog,
+        migration: OpenSearchMigration,
+        success: bool,
+        durations: Dict[MigrationPhase, int],
+    ) -> bool:
+        """Update the log of a migration with its terminal status and phase durations."""
         ended_at = int(1000 * time.time())
         new_status = MigrationLogStatus.SUCCEEDED.value if success else MigrationLogStatus.FAILED.value
 
-        _print_progress(f"[3/4] Migration {new_status.lower()}; updating migration log")
-        result = log.update(
-            using=self.connection_name,
-            # updated fields:
-            status=new_status,
-            ended_at=ended_at,
+        self._log_migration_progress(
+            migration, f"[3/4] Migration {new_status.lower()}; updating migration log"
         )
+        with timed(durations, MigrationPhase.UPDATE_LOG):
+            result = log.update(
+                using=self.connection_name,
+                # updated fields:
+                status=new_status,
+                ended_at=ended_at,
+                durations_ms={phase.value: ms for phase, ms in durations.items()},
+                **self._write_params(),
+            )
+            if result == "updated":
+                self._after_write()
+        self._emit_timings(migration, durations, status=new_status)
         if result != "updated":
             self._log("Failed to update migration log")
             return False
-        self.migration_log_index.flush()
 
-        _print_progress("[4/4] Done")
+        self._log_migration_progress(migration, "[4/4] Done")
         return success
+
+    def _emit_timings(
+        self,
+        migration: OpenSearchMigration,
+        durations: Dict[MigrationPhase, int],
+        status: Optional[str],
+    ) -> None:
+        """Send the durations of the phases of a migration to the metrics hook."""
+        for phase, duration_ms in durations.items():
+            self._emit_timing(phase, duration_ms, key=migration.get_key(), status=status)
+
+    def _log_migration_progress(self, migration: OpenSearchMigration, message: str) -> None:
+        """Log the progress of a migration."""
+        self._log(f"[key={migration.get_key()}] {message}")
@@ -0,0 +1,45 @@
+"""Document model for a summary of the migrations applied to a cluster.
+
+A single document stores a fingerprint of the migrations that were all
+applied by the last complete run. When the supplied migrations have the same
+fingerprint, there is nothing to migrate, and the migration logs don't need
+to be read at all.
+"""
+
+import hashlib
+from typing import Sequence
+
+from opensearchpy.helpers.document import Document
+from opensearchpy.helpers.field import Date, Integer, Keyword
+
+from .opensearch_migration import OpenSearchMigration
+
+
+class MigrationState(Document):
+    """Fingerprint of the migrations applied to an OpenSearch cluster."""
+
+    fingerprint = Keyword(required=True)  # see get_fingerprint()
+    num_migrations = Integer(required=True)
+    updated_at = Date(required=True)
+
+    # The ID of the single document in the index
+    STATE_ID = "state"
+
+    class Index:
+        """Configuration for the index."""
+
+        name = ".django_opensearch_toolkit.migration_state"
+        settings = {
+            "number_of_shards": 1,
+            "number_of_replicas": 1,
+            "hidden": True,
+        }
+
+    @staticmethod
+    def get_fingerprint(migrations: Sequence[OpenSearchMigration]) -> str:
+        """Return a rolling sha256 hash of the sequence of migration keys."""
+        fingerprint = hashlib.sha256()
+        for migration in migrations:
+            fingerprint.update(migration.get_key().encode("utf-8"))
+            fingerprint.update(b"\n")
+        return fingerprint.hexdigest()
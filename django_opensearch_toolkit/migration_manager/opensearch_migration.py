@@ -1,7 +1,7 @@
 """Convention for specifying a migration to run against an OpenSearch cluster."""
 
 import abc
-from typing import Final
+from typing import Final, List, Optional, Sequence
 
 
 class OpenSearchMigration(abc.ABC):
@@ -10,22 +10,37 @@ class OpenSearchMigration(abc.ABC):
     Migrations are specified by implementing a derived class and implementing
     the abstract methods. Stateful operations against the cluster should be
     performed in the apply() method using the supplied connection_name.
+
+    Like Django migrations, a migration can declare the keys of the migrations
+    it depends on. Migrations whose dependencies are all applied may be applied
+    concurrently. By default, a migration depends on the previous one in the
+    MIGRATIONS list, i.e., they form a chain.
     """
 
-    def __init__(self, key: str) -> None:
+    def __init__(self, key: str, dependencies: Optional[Sequence[str]] = None) -> None:
         """Initialize the migration with a unique identifier.
 
         Args:
             key: A globally unique identifier for this migration.
+            dependencies: Keys of the migrations that must be applied before this one.
+                These must appear earlier in the MIGRATIONS list. If None, the
+                migration depends on the previous entry in the list.
         """
         if not key.strip():
             raise ValueError("Migration key cannot be empty")
         self._key: Final[str] = key
+        self._dependencies: Final[Optional[List[str]]] = (
+            list(dependencies) if dependencies is not None else None
+        )
 
     def get_key(self) -> str:
         """Return a globally unique key among all migrations for a given cluster."""
         return self._key
 
+    def get_dependencies(self) -> Optional[List[str]]:
+        """Return the keys of the migrations this one depends on, or None for the previous one in the list."""
+        return self._dependencies
+
     @abc.abstractmethod
     def serialize(self) -> str:
         """Return a textual description of the migration run to store in the log."""
@@ -0,0 +1,73 @@
+"""Convention for specifying a long-running migration driven by an OpenSearch task."""
+
+import abc
+from logging import getLogger
+from typing import Optional, Sequence
+
+from opensearchpy.connection import connections
+
+from django_opensearch_toolkit.indexing.tasks import TaskResult, wait_for_task
+
+from .opensearch_migration import OpenSearchMigration
+
+
+_logger = getLogger(__name__)
+
+
+class OpenSearchTaskMigration(OpenSearchMigration):
+    """Base class for migrations that run as an OpenSearch task (e.g., _reindex, _update_by_query).
+
+    Implement submit() to start the task with `wait_for_completion=False` and
+    return its id. The migrations manager stores the task id in the migration
+    log and polls the task until it completes. If the process exits before
+    then, the next run resumes watching the task instead of aborting.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        dependencies: Optional[Sequence[str]] = None,
+        poll_interval: float = 10.0,
+    ) -> None:
+        """Initialize the migration.
+
+        Args:
+            key: A globally unique identifier for this migration.
+            dependencies: Keys of the migrations that must be applied before this one.
+            poll_interval: Seconds between polls of the task's status.
+        """
+        super().__init__(key=key, dependencies=dependencies)
+        self.poll_interval = poll_interval
+
+    @abc.abstractmethod
+    def submit(self, connection_name: str) -> str:
+        """Start the task against the specified connection, without waiting for it.
+
+        Args:
+            connection_name: The name of the OpenSearch connection to use.
+
+        Returns:
+            str: The id of the task.
+        """
+        pass
+
+    def check_result(self, result: TaskResult) -> bool:
+        """Return whether the completed task succeeded.
+
+        Override this to tolerate some failures, e.g., version conflicts.
+        """
+        return result.succeeded
+
+    def apply(self, connection_name: str) -> bool:
+        """Submit the task and block until it completes.
+
+        The migrations manager does not call this. It submits and watches the task itself.
+        """
+        task_id = self.submit(connection_name)
+        result = wait_for_task(
+            connections.get_connection(connection_name),
+            task_id,
+            poll_interval=self.poll_interval,
+            on_progress=lambda progress: _logger.info(f"[{self.get_key()}] {progress.describe()}"),
+        )
+        return self.check_result(result)
@@ -0,0 +1,175 @@
+"""Unit tests for AliasSwapMigration."""
+
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+from opensearchpy.exceptions import ConnectionError, NotFoundError
+from parameterized import parameterized
+
+from django_opensearch_toolkit.indexing.reindexer import ReindexResult
+from django_opensearch_toolkit.migration_manager import AliasSwapMigration
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+INDEX_BODY: Dict[str, Any] = {
+    "settings": {"index": {"number_of_shards": "2", "number_of_replicas": "2"}},
+    "mappings": {"properties": {"name": {"type": "keyword"}}},
+}
+
+
+class AliasSwapMigrationTest(MagicMockOpenSearchTestCase):
+    """Unit tests for AliasSwapMigration."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.indices.exists.return_value = False
+        self.test_client.indices.get_alias.return_value = {"products_v1": {"aliases": {"products": {}}}}
+        self.test_client.cluster.health.return_value = {"status": "green", "timed_out": False}
+
+        self.reindex = MagicMock(return_value=ReindexResult(docs=10, failures=[], elapsed_seconds=1))
+        reindexer_patcher = patch(
+            "django_opensearch_toolkit.migration_manager.alias_swap_migration.OpenSearchReindexer"
+        )
+        self.reindexer_cls = reindexer_patcher.start()
+        self.reindexer_cls.return_value.reindex = self.reindex
+        self.addCleanup(reindexer_patcher.stop)
+
+    def _migration(self, **kwargs: Any) -> AliasSwapMigration:
+        return AliasSwapMigration(
+            "0003_products_v2", alias="products", version=2, index_body=INDEX_BODY, **kwargs
+        )
+
+    def _call_names(self) -> List[str]:
+        return [name for name, _, _ in self.test_client.mock_calls if name.startswith("indices.")]
+
+    def test_apply(self) -> None:
+        migration = self._migration()
+        self.assertEqual(migration.serialize(), "Build index products_v2 and point alias products to it")
+        self.assertTrue(migration.apply(self.unittest_connection))
+
+        # The index is loaded without refreshes and replicas, which are restored afterwards
+        create_body = self.test_client.indices.create.call_args.kwargs["body"]
+        self.assertDictEqual(
+            create_body["settings"]["index"],
+            {"number_of_shards": "2", "number_of_replicas": "0", "refresh_interval": "-1"},
+        )
+        self.assertEqual(INDEX_BODY["settings"]["index"]["number_of_replicas"], "2")  # not mutated
+        self.test_client.indices.put_settings.assert_called_once_with(
+            index="products_v2",
+            body={"index": {"refresh_interval": None, "number_of_replicas": "2"}},
+        )
+        self.reindex.assert_called_once_with(source="products_v1", dest="products_v2", transform=None)
+        self.test_client.indices.forcemerge.assert_called_once_with(index="products_v2", max_num_segments=1)
+
+        # The alias is swapped atomically, last
+        self.test_client.indices.update_aliases.assert_called_once_with(
+            body={
+                "actions": [
+                    {"remove": {"index": "products_v1", "alias": "products"}},
+                    {"add": {"index": "products_v2", "alias": "products"}},
+                ]
+            }
+        )
+        self.assertEqual(self._call_names()[-1], "indices.update_aliases")
+        self.test_client.indices.delete.assert_not_called()
+
+    @parameterized.expand(
+        [
+            ("flat", {"number_of_shards": 2, "number_of_replicas": 2, "refresh_interval": "5s"}),
+            (
+                "dotted",
+                {"index.number_of_shards": 2, "index.number_of_replicas": 2, "index.refresh_interval": "5s"},
+            ),
+        ]
+    )
+    def test_apply_with_settings(self, _name: str, settings: Dict[str, Any]) -> None:
+        index_body = {"settings": settings, "mappings": INDEX_BODY["mappings"]}
+        migration = AliasSwapMigration("0003_products_v2", alias="products", version=2, index_body=index_body)
+        self.assertTrue(migration.apply(self.unittest_connection))
+
+        # The user's replicas and refresh interval are replaced (not duplicated) during the load
+        create_settings = self.test_client.indices.create.call_args.kwargs["body"]["settings"]
+        shards_key = next(iter(settings))
+        self.assertDictEqual(
+            create_settings,
+            {shards_key: 2, "index": {"number_of_replicas": "0", "refresh_interval": "-1"}},
+        )
+        self.test_client.indices.put_settings.assert_called_once_with(
+            index="products_v2",
+            body={"index": {"refresh_interval": "5s", "number_of_replicas": 2}},
+        )
+
+    def test_apply_without_existing_alias(self) -> None:
+        self.test_client.indices.get_alias.side_effect = NotFoundError(404, "not found")
+        self.assertTrue(self._migration(forcemerge=False).apply(self.unittest_connection))
+
+        self.reindex.assert_not_called()
+        self.test_client.indices.forcemerge.assert_not_called()
+        self.test_client.indices.update_aliases.assert_called_once_with(
+            body={"actions": [{"add": {"index": "products_v2", "alias": "products"}}]}
+        )
+
+    def test_apply_replaces_index(self) -> None:
+        self.test_client.indices.get_alias.side_effect = NotFoundError(404, "not found")
+        self.test_client.indices.exists.side_effect = lambda index: index == "products"
+        self.assertTrue(self._migration(delete_old_indices=True).apply(self.unittest_connection))
+
+        # The documents are copied from the index, which is replaced by the alias in the same request
+        self.reindex.assert_called_once_with(source="products", dest="products_v2", transform=None)
+        self.test_client.indices.update_aliases.assert_called_once_with(
+            body={
+                "actions": [
+                    {"remove_index": {"index": "products"}},
+                    {"add": {"index": "products_v2", "alias": "products"}},
+                ]
+            }
+        )
+        self.test_client.indices.delete.assert_not_called()
+
+    def test_apply_when_not_green(self) -> None:
+        self.test_client.cluster.health.return_value = {"status": "yellow", "timed_out": True}
+        with self.assertLogs("django_opensearch_toolkit.migration_manager.alias_swap_migration", "WARNING"):
+            self.assertTrue(self._migration().apply(self.unittest_connection))
+        self.assertEqual(self.test_client.cluster.health.call_args.kwargs["ignore"], 408)
+        self.test_client.indices.update_aliases.assert_called_once()
+
+    def test_apply_deletes_old_indices(self) -> None:
+        self.assertTrue(self._migration(delete_old_indices=True).apply(self.unittest_connection))
+        self.test_client.indices.delete.assert_called_once_with(index="products_v1")
+
+    def test_existing_index(self) -> None:
+        self.test_client.indices.exists.return_value = True
+        self.assertFalse(self._migration().apply(self.unittest_connection))
+        self.test_client.indices.create.assert_not_called()
+
+    def test_failed_load(self) -> None:
+        self.reindex.return_value = ReindexResult(docs=10, failures=[{"id": "1"}], elapsed_seconds=1)
+        self.assertFalse(self._migration().apply(self.unittest_connection))
+
+        # The partially loaded index is deleted, and the alias is untouched
+        self.test_client.indices.delete.assert_called_once_with(index="products_v2")
+        self.test_client.indices.update_aliases.assert_not_called()
+
+    def test_failure_after_load(self) -> None:
+        self.test_client.indices.forcemerge.side_effect = ConnectionError("N/A", "Simulate error", None)
+        self.assertFalse(self._migration().apply(self.unittest_connection))
+
+        # The new index is deleted, so the migration can be retried
+        self.test_client.indices.delete.assert_called_once_with(index="products_v2")
+        self.test_client.indices.update_aliases.assert_not_called()
+
+    def test_custom_load(self) -> None:
+        class CustomLoadMigration(AliasSwapMigration):
+            """Migration that loads the new index from another source."""
+
+            def load(self, connection_name: str, index_name: str, old_indices: List[str]) -> bool:
+                """Fail to load the index."""
+                raise ValueError("Simulate failed load")
+
+        migration = CustomLoadMigration(
+            "0003_products_v2", alias="products", version=2, index_body=INDEX_BODY
+        )
+        self.assertFalse(migration.apply(self.unittest_connection))
+        self.reindex.assert_not_called()
+        self.test_client.indices.update_aliases.assert_not_called()
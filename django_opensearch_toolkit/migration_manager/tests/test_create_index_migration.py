@@ -0,0 +1,29 @@
+"""Unit tests for CreateIndexMigration."""
+
+from typing import Any, Dict
+
+from django_opensearch_toolkit.migration_manager import CreateIndexMigration
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+INDEX_BODY: Dict[str, Any] = {"mappings": {"properties": {"name": {"type": "keyword"}}}}
+
+
+class CreateIndexMigrationTest(MagicMockOpenSearchTestCase):
+    """Unit tests for CreateIndexMigration."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.migration = CreateIndexMigration("0001_create_products", index="products", body=INDEX_BODY)
+
+    def test_apply(self) -> None:
+        self.test_client.indices.exists.return_value = False
+        self.assertEqual(self.migration.serialize(), "Create index products")
+        self.assertTrue(self.migration.apply(self.unittest_connection))
+        self.test_client.indices.create.assert_called_once_with(index="products", body=INDEX_BODY)
+
+    def test_existing_index(self) -> None:
+        self.test_client.indices.exists.return_value = True
+        self.assertFalse(self.migration.apply(self.unittest_connection))
+        self.test_client.indices.create.assert_not_called()
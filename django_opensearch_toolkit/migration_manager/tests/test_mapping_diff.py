@@ -0,0 +1,140 @@
+"""Unit tests for the mapping_diff module."""
+
+from typing import Any, Dict
+
+from django.test import TestCase
+
+from django_opensearch_toolkit.migration_manager import (
+    AliasSwapMigration,
+    CreateIndexMigration,
+    UpdateIndexMigration,
+)
+from django_opensearch_toolkit.migration_manager.mapping_diff import (
+    ChangeKind,
+    diff_index_bodies,
+    get_declared_index_bodies,
+    normalize_settings,
+)
+
+
+CURRENT: Dict[str, Any] = {
+    "settings": {
+        "index": {
+            "number_of_shards": "2",
+            "number_of_replicas": "1",
+            "uuid": "abc",  # only reported by a live index
+        }
+    },
+    "mappings": {
+        "dynamic": "strict",
+        "properties": {
+            "name": {"type": "text", "analyzer": "english"},
+            "merchant": {"properties": {"id": {"type": "keyword"}}},
+        },
+    },
+}
+
+
+class MappingDiffTest(TestCase):
+    """Unit tests for the mapping_diff module."""
+
+    databases = set()
+
+    def _target(self, **changes: Any) -> Dict[str, Any]:
+        return {
+            "settings": changes.get("settings", {"number_of_shards": 2}),
+            "mappings": {
+                "dynamic": "strict",
+                "properties": changes.get("properties", CURRENT["mappings"]["properties"]),
+            },
+        }
+
+    def test_no_changes(self) -> None:
+        diff = diff_index_bodies(CURRENT, self._target())
+        self.assertTrue(diff.is_empty)
+        self.assertFalse(diff.is_breaking)
+
+    def test_additive_changes(self) -> None:
+        properties = {
+            "name": {"type": "text", "analyzer": "english", "fields": {"raw": {"type": "keyword"}}},
+            "merchant": {"properties": {"id": {"type": "keyword"}, "name": {"type": "keyword"}}},
+            "price": {"type": "long"},
+        }
+        diff = diff_index_bodies(
+            CURRENT,
+            self._target(properties=properties, settings={"index": {"number_of_replicas": 2}}),
+        )
+        self.assertFalse(diff.is_breaking)
+        self.assertListEqual(
+            [(c.path, c.kind) for c in diff.changes],
+            [
+                ("mappings.properties.merchant.properties.name", ChangeKind.ADDITIVE),
+                ("mappings.properties.name.fields.raw", ChangeKind.ADDITIVE),
+                ("mappings.properties.price", ChangeKind.ADDITIVE),
+                ("settings.number_of_replicas", ChangeKind.ADDITIVE),
+            ],
+        )
+        self.assertDictEqual(
+            diff.put_mapping_body,
+            {
+                "properties": {
+                    "merchant": {"properties": {"name": {"type": "keyword"}}},
+                    "name": properties["name"],
+                    "price": {"type": "long"},
+                }
+            },
+        )
+        self.assertDictEqual(diff.put_settings_body, {"index.number_of_replicas": "2"})
+
+    def test_breaking_changes(self) -> None:
+        properties = {
+            "name": {"type": "text", "analyzer": "standard"},
+            "merchant": {"type": "nested", "properties": {"id": {"type": "keyword"}}},
+        }
+        diff = diff_index_bodies(
+            CURRENT, self._target(properties=properties, settings={"number_of_shards": 4})
+        )
+        self.assertTrue(diff.is_breaking)
+        self.assertListEqual(
+            [(c.path, c.kind) for c in diff.changes],
+            [
+                ("mappings.properties.merchant", ChangeKind.BREAKING),
+                ("mappings.properties.name.analyzer", ChangeKind.BREAKING),
+                ("settings.number_of_shards", ChangeKind.BREAKING),
+            ],
+        )
+
+    def test_removed_field_is_breaking(self) -> None:
+        diff = diff_index_bodies(
+            CURRENT, self._target(properties={"name": CURRENT["mappings"]["properties"]["name"]})
+        )
+        self.assertTrue(diff.is_breaking)
+        self.assertEqual(diff.changes[0].description, "Removed field merchant")
+
+    def test_normalize_settings(self) -> None:
+        self.assertDictEqual(
+            normalize_settings(
+                {"index": {"number_of_shards": 2, "blocks": {"write": True}}, "index.codec": "zstd"}
+            ),
+            {"number_of_shards": "2", "blocks.write": "true", "codec": "zstd"},
+        )
+
+    def test_get_declared_index_bodies(self) -> None:
+        migrations = [
+            CreateIndexMigration("0001", index="merchants", body=CURRENT),
+            UpdateIndexMigration(
+                "0002",
+                index="merchants",
+                mappings={"properties": {"price": {"type": "long"}}},
+                settings={"index.number_of_replicas": "2"},
+            ),
+            AliasSwapMigration("0003", alias="products", version=2, index_body={"mappings": {}}),
+        ]
+        bodies = get_declared_index_bodies(migrations)
+        self.assertListEqual(sorted(bodies), ["merchants", "products"])
+        self.assertListEqual(
+            sorted(bodies["merchants"]["mappings"]["properties"]),
+            ["merchant", "name", "price"],
+        )
+        self.assertEqual(bodies["merchants"]["settings"]["number_of_replicas"], "2")
+        self.assertNotIn("price", CURRENT["mappings"]["properties"])  # not mutated
@@ -1,14 +1,25 @@
 """Unit tests for OpenSearchMigrationsManager."""
 
-from typing import Optional
-from unittest.mock import MagicMock
-
-from opensearchpy.exceptions import ConflictError
+import copy
+import threading
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock, patch
+
+from django.test import override_settings
+from openmock.fake_indices import FakeIndicesClient
+from opensearchpy.connection import connections
+from opensearchpy.exceptions import ConflictError, NotFoundError
 import parameterized as paramt
 
+from django_opensearch_toolkit.migration_manager.metrics import MigrationPhase, MigrationTiming
 from django_opensearch_toolkit.migration_manager.migration_log import MigrationLog, MigrationLogStatus
-from django_opensearch_toolkit.migration_manager.migration_manager import OpenSearchMigrationsManager
+from django_opensearch_toolkit.migration_manager.migration_manager import (
+    MigrationLogDurability,
+    OpenSearchMigrationsManager,
+)
+from django_opensearch_toolkit.migration_manager.migration_state import MigrationState
 from django_opensearch_toolkit.migration_manager.opensearch_migration import OpenSearchMigration
+from django_opensearch_toolkit.migration_manager.opensearch_task_migration import OpenSearchTaskMigration
 from django_opensearch_toolkit.unittest import FakeOpenSearchTestCase, MagicMockOpenSearchTestCase
 
 
@@ -18,9 +29,15 @@ class SampleMigration(OpenSearchMigration):
     _KEY = "0001_test_migration"
     _DESCRIPTION = "This is a test migration"
 
-    def __init__(self, return_value: bool, should_raise: bool, key: str = _KEY) -> None:
+    def __init__(
+        self,
+        return_value: bool,
+        should_raise: bool,
+        key: str = _KEY,
+        dependencies: Optional[List[str]] = None,
+    ) -> None:
         """Initialize the migration."""
-        super().__init__(key=key)
+        super().__init__(key=key, dependencies=dependencies)
         self.return_value = return_value
         self.should_raise = should_raise
         self.apply_was_run_with: Optional[str] = None
@@ -48,6 +65,15 @@ class OpenSearchMigrationsManagerTest01(FakeOpenSearchTestCase):
         self.manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection)
         self.test_client = self.get_test_client(self.unittest_connection)
         self.assertEqual(self.manager.client, self.test_client)
+        put_mapping_patcher = patch.object(FakeIndicesClient, "put_mapping")  # not implemented by openmock
+        self.put_mapping = put_mapping_patcher.start()
+        self.addCleanup(put_mapping_patcher.stop)
+        get_mapping_patcher = patch.object(FakeIndicesClient, "get_mapping")
+        self.get_mapping = get_mapping_patcher.start()
+        self.get_mapping.return_value = {
+            MigrationLog.Index.name: {"mappings": MigrationLog._doc_type.mapping.to_dict()}
+        }
+        self.addCleanup(get_mapping_patcher.stop)
 
     def test_index_management(self) -> None:
         """Test the methods that create and delete the migration log index."""
@@ -57,6 +83,25 @@ class OpenSearchMigrationsManagerTest01(FakeOpenSearchTestCase):
             self.manager._create_migration_logs_index_if_not_exists()  # idempodent
             self.assertTrue(self.test_client.indices.exists(MigrationLog.Index.name))
 
+        # Reading the migration logs never writes the mapping
+        self.manager.display_migrations()
+        self.manager.get_migration_stats()
+        self.manager.get_migrations_status([])
+        self.put_mapping.assert_not_called()
+
+        # The mapping of an existing index is only updated if fields were added since it was created
+        self.manager._add_missing_migration_log_fields()
+        self.put_mapping.assert_not_called()
+        old_mapping = copy.deepcopy(MigrationLog._doc_type.mapping.to_dict())
+        del old_mapping["properties"]["task_id"]
+        del old_mapping["properties"]["durations_ms"]
+        self.get_mapping.return_value = {MigrationLog.Index.name: {"mappings": old_mapping}}
+        self.manager._add_missing_migration_log_fields()
+        self.put_mapping.assert_called_once()
+        properties = self.put_mapping.call_args.kwargs["body"]["properties"]
+        self.assertIn("task_id", properties)
+        self.assertIn("durations_ms", properties)
+
         for _ in range(3):
             self.manager._delete_migration_logs_index_if_exists()  # idempodent
             self.assertFalse(self.test_client.indices.exists(MigrationLog.Index.name))
@@ -209,8 +254,75 @@ class OpenSearchMigrationsManagerTest02(MagicMockOpenSearchTestCase):
         self.assertEqual(self.manager.client, self.test_client)
         self.test_client.reset_mock()
 
-    def test_create_migration_log_atomic_success(self) -> None:
+    def _search_response(self, orders: List[int], status: str = MigrationLogStatus.SUCCEEDED.value) -> Dict:
+        hits = [
+            {
+                "_index": MigrationLog.Index.name,
+                "_id": f"id_{order:04}",
+                "_source": {"order": order, "key": f"id_{order:04}", "status": status},
+            }
+            for order in orders
+        ]
+        return {"hits": {"total": {"value": len(hits), "relation": "eq"}, "hits": hits}}
+
+    def test_iter_migration_logs_paginates(self) -> None:
+        """Test that _iter_migration_logs() pages through the logs with search_after."""
+        manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection, page_size=2)
+        self.test_client.search.side_effect = [
+            self._search_response([0, 1]),
+            self._search_response([2, 3]),
+            self._search_response([4]),
+        ]
+
+        logs = manager._iter_migration_logs()
+        self.assertListEqual([log.order for log in logs], [0, 1, 2, 3, 4])
+
+        bodies = [c.kwargs["body"] for c in self.test_client.search.call_args_list]
+        self.assertListEqual([b.get("search_after") for b in bodies], [None, [1], [3]])
+        self.assertTrue(all(b["size"] == 2 and b["sort"] == ["order"] for b in bodies))
+
+    def test_run_migrations_streams_logs(self) -> None:
+        """Test that run_migrations() checks the logs in lockstep with the migrations."""
+        manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection, page_size=2)
+        manager._run_migration = MagicMock(return_value=True)  # type: ignore[method-assign]
+        self.test_client.indices.exists.return_value = True
+        self.test_client.search.side_effect = [
+            self._search_response([0, 1]),
+            self._search_response([2]),
+        ]
+
+        migrations = [SampleMigration(True, False, key=f"id_{i:04}") for i in range(4)]
+        manager.run_migrations(migrations, dry=False)
+
+        self.assertEqual(self.test_client.search.call_count, 2)
+        manager._run_migration.assert_called_once_with(order=3, migration=migrations[3])
+
+    def test_run_migrations_streams_failed_log(self) -> None:
+        """Test that run_migrations() aborts on a failed log beyond the first page."""
+        manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection, page_size=2)
+        manager._run_migration = MagicMock()  # type: ignore[method-assign]
+        self.test_client.indices.exists.return_value = True
+        self.test_client.search.side_effect = [
+            self._search_response([0, 1]),
+            self._search_response([2], status=MigrationLogStatus.FAILED.value),
+        ]
+
+        migrations = [SampleMigration(True, False, key=f"id_{i:04}") for i in range(4)]
+        manager.run_migrations(migrations, dry=False)
+
+        manager._run_migration.assert_not_called()
+
+    @paramt.parameterized.expand(
+        [
+            (MigrationLogDurability.REFRESH,),
+            (MigrationLogDurability.FLUSH,),
+        ]
+    )
+    def test_create_migration_log_atomic_success(self, durability: MigrationLogDurability) -> None:
         """Test for _create_migration_log_atomic() that succeeds."""
+        self.manager = OpenSearchMigrationsManager(
+            connection_name=self.unittest_connection, durability=durability
+        )
         log = MigrationLog(order=13, key="id_0013")
 
         # Mock the resposes of the OpenSearch Client
@@ -230,17 +342,28 @@ class OpenSearchMigrationsManagerTest02(MagicMockOpenSearchTestCase):
 
         # Confirm the calls that were issued against the OpenSearch client
         #  1. Create the document: should have correct index, id, and body
-        #  2. Flush the correct index
+        #     (and wait for a refresh, in REFRESH mode)
+        #  2. Flush the correct index (only in FLUSH mode)
         #  3. Get the correct document to ensure it exists
-        self.assertEqual(len(self.test_client.mock_calls), 3)
-        self.test_client.create.assert_called_once_with(
-            index=MigrationLog.Index.name,
-            id="id_0013",
-            body=log.to_dict(include_meta=False),
-        )
-        self.test_client.indices.flush.assert_called_once_with(
-            index=MigrationLog.Index.name,
-        )
+        if durability == MigrationLogDurability.REFRESH:
+            self.assertEqual(len(self.test_client.mock_calls), 2)
+            self.test_client.create.assert_called_once_with(
+                index=MigrationLog.Index.name,
+                id="id_0013",
+                body=log.to_dict(include_meta=False),
+                refresh="wait_for",
+            )
+            self.test_client.indices.flush.assert_not_called()
+        else:
+            self.assertEqual(len(self.test_client.mock_calls), 3)
+            self.test_client.create.assert_called_once_with(
+                index=MigrationLog.Index.name,
+                id="id_0013",
+                body=log.to_dict(include_meta=False),
+            )
+            self.test_client.indices.flush.assert_called_once_with(
+                index=MigrationLog.Index.name,
+            )
         self.test_client.get.assert_called_once_with(
             index=MigrationLog.Index.name,
             id="id_0013",
@@ -265,18 +388,25 @@ class OpenSearchMigrationsManagerTest02(MagicMockOpenSearchTestCase):
             index=MigrationLog.Index.name,
             id="id_0013",
             body=log.to_dict(include_meta=False),
+            refresh="wait_for",
         )
 
     @paramt.parameterized.expand(
         [
-            (True, False),
-            (False, False),
-            (True, True),
-            (False, True),
+            (return_value, should_raise, durability)
+            for return_value in (True, False)
+            for should_raise in (False, True)
+            for durability in MigrationLogDurability
         ]
     )
-    def test_run_migration(self, return_value: bool, should_raise: bool) -> None:
+    def test_run_migration(
+        self, return_value: bool, should_raise: bool, durability: MigrationLogDurability
+    ) -> None:
         """Test the _run_migration() method."""
+        self.manager = OpenSearchMigrationsManager(
+            connection_name=self.unittest_connection, durability=durability
+        )
+        refresh_kwargs = {"refresh": "wait_for"} if durability == MigrationLogDurability.REFRESH else {}
         order = 12
         migration = SampleMigration(return_value=return_value, should_raise=should_raise)
 
@@ -316,12 +446,15 @@ class OpenSearchMigrationsManagerTest02(MagicMockOpenSearchTestCase):
                     "started_at": create_kwargs_start_at,
                     "status": MigrationLogStatus.IN_PROGRESS.value,  # created with IN_PROGRESS
                 },
+                **refresh_kwargs,
             },
         )
 
         # Check that the migration log was updated
         update_kwargs = self.test_client.update.mock_calls[0].kwargs
         update_kwargs_end_at = update_kwargs["body"]["doc"]["ended_at"]
+        update_kwargs_durations = update_kwargs["body"]["doc"]["durations_ms"]
+        self.assertSetEqual(set(update_kwargs_durations), {"create_log", "apply"})
         self.assertDictEqual(
             update_kwargs,
             {
@@ -333,11 +466,506 @@ class OpenSearchMigrationsManagerTest02(MagicMockOpenSearchTestCase):
                     "doc": {
                         "ended_at": update_kwargs_end_at,
                         "status": expected_final_status,  # correct terminal status
+                        "durations_ms": update_kwargs_durations,
                     },
                 },
-                "refresh": False,
+                "refresh": refresh_kwargs.get("refresh", False),
                 "retry_on_conflict": 0,
             },
         )
 
         self.assertLessEqual(create_kwargs_start_at, update_kwargs_end_at)
+
+        # Each write is flushed in FLUSH mode. In REFRESH mode, the flush is deferred to the end of the run
+        expected_flushes = 2 if durability == MigrationLogDurability.FLUSH else 0
+        self.assertEqual(self.test_client.indices.flush.call_count, expected_flushes)
+        self.assertEqual(self.manager._has_unflushed_logs, durability == MigrationLogDurability.REFRESH)
+
+    def test_run_migrations_flushes_once(self) -> None:
+        """Test that run_migrations() flushes the log index once at the end, in REFRESH mode."""
+        self.test_client.indices.exists.return_value = True
+        self.test_client.search.return_value = self._search_response([])
+        self.test_client.create.return_value = {"result": "created"}
+        self.test_client.get.side_effect = lambda index, id: {
+            "found": True,
+            "_index": index,
+            "_id": id,
+            "_source": {"status": MigrationLogStatus.IN_PROGRESS.value},
+        }
+        self.test_client.update.return_value = {"result": "updated"}
+
+        migrations = [SampleMigration(True, False, key=f"id_{i:04}") for i in range(3)]
+        self.manager.run_migrations(migrations, dry=False)
+
+        self.assertEqual(self.test_client.create.call_count, 3)
+        self.assertEqual(self.test_client.update.call_count, 3)
+        self.test_client.indices.flush.assert_called_once_with(index=MigrationLog.Index.name)
+
+
+class OpenSearchMigrationsManagerGraphTest(MagicMockOpenSearchTestCase):
+    """Unit tests for applying a dependency graph of migrations with OpenSearchMigrationsManager."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.indices.exists.return_value = True
+        self.set_existing_logs([])
+
+        # A diamond: a -> (b, c) -> d, and an independent e
+        self.migrations = [
+            SampleMigration(True, False, key="a"),
+            SampleMigration(True, False, key="b"),  # depends on the previous one by default
+            SampleMigration(True, False, key="c", dependencies=["a"]),
+            SampleMigration(True, False, key="d", dependencies=["b", "c"]),
+            SampleMigration(True, False, key="e", dependencies=[]),
+        ]
+
+    def set_existing_logs(self, keys: List[str], orders: Optional[List[int]] = None) -> None:
+        hits = [
+            {
+                "_index": MigrationLog.Index.name,
+                "_id": key,
+                "_source": {"order": order, "key": key, "status": MigrationLogStatus.SUCCEEDED.value},
+            }
+            for key, order in zip(keys, orders if orders is not None else range(len(keys)))
+        ]
+        self.test_client.search.return_value = {"hits": {"total": {"value": len(hits)}, "hits": hits}}
+
+    def manager(self, max_workers: int, run_migration: Any) -> OpenSearchMigrationsManager:
+        manager = OpenSearchMigrationsManager(
+            connection_name=self.unittest_connection, max_workers=max_workers
+        )
+        manager._run_migration = MagicMock(side_effect=run_migration)  # type: ignore[method-assign]
+        return manager
+
+    def test_serial_order(self) -> None:
+        """Test that, with one worker, migrations are applied one-by-one in the supplied order."""
+        manager = self.manager(max_workers=1, run_migration=lambda order, migration: True)
+        self.assertTrue(manager.run_migrations(self.migrations, dry=False))
+        self.assertListEqual(
+            [c.kwargs["order"] for c in manager._run_migration.call_args_list],  # type: ignore[attr-defined]
+            [0, 1, 2, 3, 4],
+        )
+
+    def test_independent_migrations_run_concurrently(self) -> None:
+        """Test that migrations run concurrently once their dependencies are applied."""
+        barrier = threading.Barrier(3, timeout=5)
+        lock = threading.Lock()
+        finished: List[str] = []
+
+        def _run_migration(order: int, migration: OpenSearchMigration) -> bool:
+            key = migration.get_key()
+            if key in ("b", "c", "e"):
+                barrier.wait()  # b, c and e must all be running at the same time
+            with lock:
+                if key == "d":
+                    self.assertTrue({"b", "c"} <= set(finished))
+                finished.append(key)
+            return True
+
+        manager = self.manager(max_workers=3, run_migration=_run_migration)
+        self.assertTrue(manager.run_migrations(self.migrations, dry=False))
+        self.assertEqual(finished[0], "a")
+        self.assertCountEqual(finished, ["a", "b", "c", "d", "e"])
+
+    def test_failure_stops_dependents(self) -> None:
+        """Test that a failed migration's dependents are not applied."""
+        manager = self.manager(
+            max_workers=2, run_migration=lambda order, migration: migration.get_key() != "c"
+        )
+        self.assertFalse(manager.run_migrations(self.migrations, dry=False))
+        calls = manager._run_migration.call_args_list  # type: ignore[attr-defined]
+        applied = {c.kwargs["migration"].get_key() for c in calls}
+        self.assertNotIn("d", applied)
+
+    def test_partially_applied(self) -> None:
+        """Test that only the pending migrations are applied."""
+        self.set_existing_logs(["a", "c", "e"], orders=[0, 2, 4])
+        manager = self.manager(max_workers=2, run_migration=lambda order, migration: True)
+        self.assertTrue(manager.run_migrations(self.migrations, dry=False))
+        self.assertCountEqual(
+            [c.kwargs["order"] for c in manager._run_migration.call_args_list],  # type: ignore[attr-defined]
+            [1, 3],
+        )
+
+    def test_rollback(self) -> None:
+        """Test that logs of migrations beyond the supplied ones (e.g., after a rollback) are tolerated."""
+        self.set_existing_logs(["a", "b", "c", "d", "e", "f"])
+        manager = self.manager(max_workers=2, run_migration=lambda order, migration: True)
+        with self.assertLogs("django_opensearch_toolkit.migration_manager.migration_manager", "WARNING"):
+            self.assertTrue(manager.run_migrations(self.migrations, dry=False))
+        manager._run_migration.assert_not_called()  # type: ignore[attr-defined]
+
+    @paramt.parameterized.expand(
+        [
+            ("missing_dependency", ["a", "d"], [0, 3]),
+            ("wrong_order", ["a", "b"], [0, 2]),
+            ("unknown_key", ["a", "z"], [0, 1]),
+        ]
+    )
+    def test_inconsistent_history(self, _: str, keys: List[str], orders: List[int]) -> None:
+        """Test that nothing is applied when the history is inconsistent with the graph."""
+        self.set_existing_logs(keys, orders)
+        manager = self.manager(max_workers=2, run_migration=lambda order, migration: True)
+        self.assertFalse(manager.run_migrations(self.migrations, dry=False))
+        manager._run_migration.assert_not_called()  # type: ignore[attr-defined]
+
+    @paramt.parameterized.expand(
+        [
+            ("later_dependency", [SampleMigration(True, False, key="a", dependencies=["b"])]),
+            ("duplicate_key", [SampleMigration(True, False, key="a") for _ in range(2)]),
+        ]
+    )
+    def test_invalid_graph(self, _: str, migrations: List[OpenSearchMigration]) -> None:
+        """Test that nothing is applied when the dependencies are invalid."""
+        manager = self.manager(max_workers=2, run_migration=lambda order, migration: True)
+        self.assertFalse(manager.run_migrations(migrations, dry=False))
+        manager._run_migration.assert_not_called()  # type: ignore[attr-defined]
+
+
+class SampleTaskMigration(OpenSearchTaskMigration):
+    """Task migration for unit tests."""
+
+    def __init__(self, key: str) -> None:
+        """Initialize the migration."""
+        super().__init__(key=key, poll_interval=0)
+
+    def serialize(self) -> str:
+        """Return a textual description of the migration run to store in the log."""
+        return "Update all documents"
+
+    def submit(self, connection_name: str) -> str:
+        """Start the task."""
+        client = connections.get_connection(connection_name)
+        return client.update_by_query(index="products", wait_for_completion=False)["task"]
+
+
+class OpenSearchMigrationsManagerTaskTest(MagicMockOpenSearchTestCase):
+    """Unit tests for applying task migrations with OpenSearchMigrationsManager."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.indices.exists.return_value = True
+        self.set_existing_logs([])
+        self.test_client.create.return_value = {"result": "created"}
+        self.test_client.get.side_effect = lambda index, id: {
+            "found": True,
+            "_index": index,
+            "_id": id,
+            "_source": {"status": MigrationLogStatus.IN_PROGRESS.value},
+        }
+        self.test_client.update.return_value = {"result": "updated"}
+        self.test_client.update_by_query.return_value = {"task": "node:1"}
+        self.set_task_status(completed=True)
+
+        self.migrations = [
+            SampleTaskMigration(key="task"),
+            SampleMigration(True, False, key="after_task"),  # depends on the task migration
+        ]
+
+    def set_existing_logs(self, sources: List[Dict[str, Any]]) -> None:
+        hits = [{"_index": MigrationLog.Index.name, "_id": s["key"], "_source": s} for s in sources]
+        self.test_client.search.return_value = {"hits": {"total": {"value": len(hits)}, "hits": hits}}
+
+    def set_task_status(self, completed: bool, failures: Optional[List[Any]] = None) -> None:
+        self.test_client.tasks.get.return_value = {
+            "completed": completed,
+            "task": {"status": {"total": 10, "updated": 10}, "running_time_in_nanos": 10**9},
+            "response": {"failures": failures or []},
+        }
+
+    def updated_docs(self) -> List[Dict[str, Any]]:
+        return [c.kwargs["body"]["doc"] for c in self.test_client.update.call_args_list]
+
+    def test_run_task_migration(self) -> None:
+        """Test that the task id is logged, and the task is watched until it completes."""
+        manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection)
+        self.assertTrue(manager.run_migrations(self.migrations, dry=False))
+
+        self.test_client.tasks.get.assert_called_once_with(task_id="node:1")
+        updated_docs = self.updated_docs()
+        self.assertDictEqual(updated_docs[0], {"task_id": "node:1"})
+        self.assertEqual(updated_docs[1]["status"], MigrationLogStatus.SUCCEEDED.value)
+        self.assertEqual(self.test_client.create.call_count, 2)  # the next migration was applied
+
+    def test_run_task_migration_fails(self) -> None:
+        """Test that a task with failures fails the migration."""
+        self.set_task_status(completed=True, failures=[{"id": "1"}])
+        manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection)
+        self.assertFalse(manager.run_migrations(self.migrations, dry=False))
+
+        self.assertEqual(self.updated_docs()[-1]["status"], MigrationLogStatus.FAILED.value)
+        self.assertEqual(self.test_client.create.call_count, 1)
+
+    def test_run_task_migration_nowait(self) -> None:
+        """Test that, without waiting, the task is left running and its dependents are not applied."""
+        manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection, wait_for_tasks=False)
+        self.assertTrue(manager.run_migrations(self.migrations, dry=False))
+
+        self.test_client.tasks.get.assert_not_called()
+        self.assertListEqual(self.updated_docs(), [{"task_id": "node:1"}])
+        self.assertEqual(self.test_client.create.call_count, 1)
+        self.assertDictEqual(manager.running_task_ids, {"task": "node:1"})
+        self.assertListEqual(manager.blocked_migrations, ["after_task"])
+
+    def test_resume_task_migration(self) -> None:
+        """Test that a later run resumes watching an in-progress task, instead of aborting."""
+        self.set_existing_logs(
+            [{"order": 0, "key": "task", "status": MigrationLogStatus.IN_PROGRESS.value, "task_id": "node:1"}]
+        )
+        manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection)
+        self.assertTrue(manager.run_migrations(self.migrations, dry=False))
+
+        self.test_client.update_by_query.assert_not_called()
+        self.test_client.tasks.get.assert_called_once_with(task_id="node:1")
+        self.assertEqual(self.updated_docs()[0]["status"], MigrationLogStatus.SUCCEEDED.value)
+        self.assertEqual(self.test_client.update.call_args_list[0].kwargs["id"], "task")
+        self.test_client.create.assert_called_once()  # the next migration was applied
+        self.assertDictEqual(manager.running_task_ids, {})
+        self.assertListEqual(manager.blocked_migrations, [])
+
+    def test_in_progress_without_task_aborts(self) -> None:
+        """Test that an in-progress log without a task id still aborts the run."""
+        self.set_existing_logs([{"order": 0, "key": "task", "status": MigrationLogStatus.IN_PROGRESS.value}])
+        manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection)
+        self.assertFalse(manager.run_migrations(self.migrations, dry=False))
+
+        self.test_client.tasks.get.assert_not_called()
+        self.test_client.create.assert_not_called()
+
+
+_TIMINGS: List[MigrationTiming] = []
+
+
+def record_timing(timing: MigrationTiming) -> None:
+    """Metrics hook for unit tests."""
+    _TIMINGS.append(timing)
+
+
+class OpenSearchMigrationsManagerMetricsTest(MagicMockOpenSearchTestCase):
+    """Unit tests for the timing instrumentation and stats of OpenSearchMigrationsManager."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection)
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.indices.exists.return_value = True
+        _TIMINGS.clear()
+
+    def set_existing_logs(self, sources: List[Dict[str, Any]]) -> None:
+        hits = [{"_index": MigrationLog.Index.name, "_id": s["key"], "_source": s} for s in sources]
+        self.test_client.search.return_value = {"hits": {"total": {"value": len(hits)}, "hits": hits}}
+
+    @override_settings(
+        OPENSEARCH_MIGRATION_METRICS_HOOK=(
+            "django_opensearch_toolkit.migration_manager.tests.test_migration_manager.record_timing"
+        )
+    )
+    def test_timings_are_emitted(self) -> None:
+        """Test that each phase of a run is timed and sent to the metrics hook."""
+        self.set_existing_logs([])
+        self.test_client.create.return_value = {"result": "created"}
+        self.test_client.get.side_effect = lambda index, id: {
+            "found": True,
+            "_index": index,
+            "_id": id,
+            "_source": {"status": MigrationLogStatus.IN_PROGRESS.value},
+        }
+        self.test_client.update.return_value = {"result": "updated"}
+
+        self.assertTrue(self.manager.run_migrations([SampleMigration(True, False)], dry=False))
+
+        self.assertListEqual(
+            [(t.phase, t.key, t.status) for t in _TIMINGS],
+            [
+                (MigrationPhase.CHECK_LOGS, None, None),
+                (MigrationPhase.CREATE_LOG, SampleMigration._KEY, "SUCCEEDED"),
+                (MigrationPhase.APPLY, SampleMigration._KEY, "SUCCEEDED"),
+                (MigrationPhase.UPDATE_LOG, SampleMigration._KEY, "SUCCEEDED"),
+                (MigrationPhase.FLUSH_LOGS, None, None),
+            ],
+        )
+        self.assertTrue(all(t.connection_name == self.unittest_connection for t in _TIMINGS))
+        self.assertTrue(all(t.duration_ms >= 0 for t in _TIMINGS))
+
+    @override_settings(OPENSEARCH_MIGRATION_METRICS_HOOK="builtins.len")
+    def test_hook_errors_are_not_raised(self) -> None:
+        """Test that a broken metrics hook does not fail the run."""
+        self.set_existing_logs([])
+        with self.assertLogs("django_opensearch_toolkit.migration_manager.metrics", level="ERROR"):
+            self.assertTrue(self.manager.run_migrations([], dry=False))
+
+    def test_get_migration_stats(self) -> None:
+        """Test the summary of the migration logs."""
+        self.set_existing_logs(
+            [
+                {
+                    "order": i,
+                    "key": f"id_{i:04}",
+                    "status": MigrationLogStatus.SUCCEEDED.value,
+                    "started_at": 1_000_000,
+                    "ended_at": 1_000_000 + duration_ms,
+                    "durations_ms": {"create_log": 10, "apply": duration_ms - 10},
+                }
+                for i, duration_ms in enumerate([100, 3_000, 500])
+            ]
+            + [
+                {
+                    "order": 3,
+                    "key": "id_0003",
+                    "status": MigrationLogStatus.IN_PROGRESS.value,
+                    "started_at": 1_000_000,
+                }
+            ]
+        )
+
+        stats = self.manager.get_migration_stats(top=2)
+
+        self.assertDictEqual(stats.count_by_status, {"SUCCEEDED": 3, "IN_PROGRESS": 1})
+        self.assertEqual(stats.completed, 3)
+        self.assertEqual(stats.total_duration_ms, 3_600)
+        self.assertEqual(stats.mean_duration_ms, 1_200)
+        self.assertDictEqual(stats.phase_totals_ms, {"create_log": 30, "apply": 3_570})
+        self.assertListEqual(stats.slowest, [(3_000, "id_0001"), (500, "id_0002")])
+
+
+class OpenSearchMigrationsManagerFingerprintTest(MagicMockOpenSearchTestCase):
+    """Unit tests for the fingerprint fast path of OpenSearchMigrationsManager."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.indices.exists.return_value = True
+        self.migrations = [SampleMigration(True, False, key=f"id_{i:04}") for i in range(3)]
+        self.hits = [
+            {
+                "_index": MigrationLog.Index.name,
+                "_id": m.get_key(),
+                "_source": {"order": i, "key": m.get_key(), "status": MigrationLogStatus.SUCCEEDED.value},
+            }
+            for i, m in enumerate(self.migrations)
+        ]
+        self.test_client.search.return_value = {"hits": {"total": {"value": 3}, "hits": self.hits}}
+
+    def set_state(self, fingerprint: Optional[str]) -> None:
+        if fingerprint is None:
+            self.test_client.get.side_effect = NotFoundError(404, "not found")
+        else:
+            self.test_client.get.return_value = {
+                "found": True,
+                "_index": MigrationState.Index.name,
+                "_id": MigrationState.STATE_ID,
+                "_source": {"fingerprint": fingerprint},
+            }
+
+    def test_fingerprint(self) -> None:
+        """Test that the fingerprint depends on the keys and their order."""
+        fingerprint = MigrationState.get_fingerprint(self.migrations)
+        self.assertEqual(fingerprint, MigrationState.get_fingerprint(list(self.migrations)))
+        self.assertNotEqual(fingerprint, MigrationState.get_fingerprint(self.migrations[::-1]))
+        self.assertNotEqual(fingerprint, MigrationState.get_fingerprint(self.migrations[:2]))
+
+    def test_fast_path(self) -> None:
+        """Test that a matching fingerprint takes a single GET."""
+        self.set_state(MigrationState.get_fingerprint(self.migrations))
+        manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection)
+        self.test_client.reset_mock()
+
+        self.assertTrue(manager.run_migrations(self.migrations, dry=False))
+        self.assertListEqual([c[0] for c in self.test_client.mock_calls], ["get"])
+        self.test_client.get.assert_called_once_with(
+            index=MigrationState.Index.name,
+            id=MigrationState.STATE_ID,
+        )
+
+    def test_full_check(self) -> None:
+        """Test that the fast path can be disabled."""
+        self.set_state(MigrationState.get_fingerprint(self.migrations))
+        manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection, use_fingerprint=False)
+        self.assertTrue(manager.run_migrations(self.migrations, dry=False))
+        self.test_client.get.assert_not_called()
+        self.test_client.search.assert_called_once()
+
+    @paramt.parameterized.expand([("no_state", None), ("different_fingerprint", "abc")])
+    def test_fingerprint_is_saved(self, _: str, fingerprint: Optional[str]) -> None:
+        """Test that the history is checked, and the fingerprint saved once all migrations are applied."""
+        self.set_state(fingerprint)
+        manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection)
+        self.assertTrue(manager.run_migrations(self.migrations, dry=False))
+
+        self.test_client.search.assert_called_once()
+        self.test_client.index.assert_called_once()
+        self.assertEqual(self.test_client.index.call_args.kwargs["index"], MigrationState.Index.name)
+        self.assertEqual(self.test_client.index.call_args.kwargs["id"], MigrationState.STATE_ID)
+        self.assertEqual(
+            self.test_client.index.call_args.kwargs["body"]["fingerprint"],
+            MigrationState.get_fingerprint(self.migrations),
+        )
+
+    def test_get_migrations_status(self) -> None:
+        """Test that the status of each migration is looked up with an mget of the supplied keys."""
+        self.set_state(None)
+        self.test_client.mget.side_effect = lambda index, body: {
+            "docs": [
+                (
+                    {"_id": key, "found": True, "_source": {"status": MigrationLogStatus.SUCCEEDED.value}}
+                    if key == "id_0000"
+                    else {"_id": key, "found": False}
+                )
+                for key in body["ids"]
+            ]
+        }
+        manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection, page_size=2)
+        status = manager.get_migrations_status(self.migrations)
+
+        self.assertListEqual(status.applied, ["id_0000"])
+        self.assertListEqual(status.pending, ["id_0001", "id_0002"])
+        self.assertFalse(status.up_to_date)
+        self.assertEqual(self.test_client.mget.call_count, 2)
+        self.test_client.search.assert_not_called()
+
+    def test_get_migrations_status_fingerprint(self) -> None:
+        """Test that no migration is looked up if the fingerprint matches."""
+        self.set_state(MigrationState.get_fingerprint(self.migrations))
+        manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection)
+        status = manager.get_migrations_status(self.migrations)
+
+        self.assertTrue(status.up_to_date)
+        self.assertListEqual(status.applied, ["id_0000", "id_0001", "id_0002"])
+        self.test_client.mget.assert_not_called()
+
+    def test_fingerprint_not_saved_in_dry_mode_or_on_failure(self) -> None:
+        """Test that the fingerprint is only saved after a complete, non-dry run."""
+        self.set_state(None)
+        self.test_client.search.return_value = {"hits": {"total": {"value": 2}, "hits": self.hits[:2]}}
+        manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection)
+        self.assertTrue(manager.run_migrations(self.migrations, dry=True))
+
+        manager._run_migration = MagicMock(return_value=False)  # type: ignore[method-assign]
+        self.assertFalse(manager.run_migrations(self.migrations, dry=False))
+        self.test_client.index.assert_not_called()
+
+    def test_fingerprint_invalidated_before_writing_logs(self) -> None:
+        """Test that the fingerprint is deleted before a migration is run, so a failure invalidates it."""
+        self.set_state(MigrationState.get_fingerprint(self.migrations))
+        manager = OpenSearchMigrationsManager(connection_name=self.unittest_connection)
+        migrations = self.migrations + [SampleMigration(True, False, key="id_0003")]
+
+        def _run_migration(order: int, migration: Any) -> bool:
+            self.test_client.delete.assert_called_once_with(
+                index=MigrationState.Index.name, id=MigrationState.STATE_ID, ignore=404
+            )
+            return False
+
+        manager._run_migration = MagicMock(side_effect=_run_migration)  # type: ignore[method-assign]
+        self.assertFalse(manager.run_migrations(migrations, dry=False))
+        manager._run_migration.assert_called_once()
+        self.test_client.index.assert_not_called()
+
+        # Nothing to apply, so nothing is invalidated
+        self.set_state(None)
+        self.test_client.delete.reset_mock()
+        self.assertTrue(manager.run_migrations(self.migrations, dry=False))
+        self.test_client.delete.assert_not_called()
+        self.test_client.index.assert_called_once()  # the fingerprint is saved again
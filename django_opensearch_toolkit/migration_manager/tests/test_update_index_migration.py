@@ -0,0 +1,49 @@
+"""Unit tests for UpdateIndexMigration."""
+
+from django_opensearch_toolkit.migration_manager import UpdateIndexMigration
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+class UpdateIndexMigrationTest(MagicMockOpenSearchTestCase):
+    """Unit tests for UpdateIndexMigration."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.indices.exists.return_value = True
+
+    def test_apply(self) -> None:
+        migration = UpdateIndexMigration(
+            "0002_update_products",
+            index="products",
+            mappings={"properties": {"price": {"type": "long"}}},
+            settings={"index.number_of_replicas": "2"},
+        )
+        self.assertEqual(migration.serialize(), "Update mappings and settings of index products")
+        self.assertTrue(migration.apply(self.unittest_connection))
+        self.test_client.indices.put_mapping.assert_called_once_with(
+            index="products", body={"properties": {"price": {"type": "long"}}}
+        )
+        self.test_client.indices.put_settings.assert_called_once_with(
+            index="products", body={"index.number_of_replicas": "2"}
+        )
+
+    def test_apply_mappings_only(self) -> None:
+        migration = UpdateIndexMigration(
+            "0002_update_products", index="products", mappings={"dynamic": "strict"}
+        )
+        self.assertEqual(migration.serialize(), "Update mappings of index products")
+        self.assertTrue(migration.apply(self.unittest_connection))
+        self.test_client.indices.put_settings.assert_not_called()
+
+    def test_missing_index(self) -> None:
+        self.test_client.indices.exists.return_value = False
+        migration = UpdateIndexMigration(
+            "0002_update_products", index="products", mappings={"dynamic": "strict"}
+        )
+        self.assertFalse(migration.apply(self.unittest_connection))
+        self.test_client.indices.put_mapping.assert_not_called()
+
+    def test_no_changes(self) -> None:
+        with self.assertRaises(ValueError):
+            UpdateIndexMigration("0002_update_products", index="products")
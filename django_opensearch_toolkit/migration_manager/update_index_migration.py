@@ -0,0 +1,65 @@
+"""Built-in migration to change the mappings and dynamic settings of an index in place."""
+
+from logging import getLogger
+from typing import Any, Dict, Optional, Sequence
+
+from opensearchpy.connection import connections
+
+from .opensearch_migration import OpenSearchMigration
+
+
+_logger = getLogger(__name__)
+
+
+class UpdateIndexMigration(OpenSearchMigration):
+    """Add to the mappings and update the dynamic settings of an existing index (or alias).
+
+    Only changes that OpenSearch can apply in place are allowed here, e.g., new
+    fields, new multi-fields, or a new `number_of_replicas`. Other changes need
+    a new index (see AliasSwapMigration). opensearch_makemigrations picks the
+    right one from the diff of the mappings (see mapping_diff).
+    """
+
+    def __init__(
+        self,
+        key: str,
+        index: str,
+        mappings: Optional[Dict[str, Any]] = None,
+        settings: Optional[Dict[str, Any]] = None,
+        dependencies: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Initialize the migration.
+
+        Args:
+            key: A globally unique identifier for this migration.
+            index: The name of the index (or alias) to update.
+            mappings: The mappings to merge into the existing ones (put_mapping body).
+            settings: The dynamic settings to update (put_settings body).
+            dependencies: Keys of the migrations that must be applied before this one.
+        """
+        super().__init__(key=key, dependencies=dependencies)
+        if not mappings and not settings:
+            raise ValueError("At least one of mappings or settings must be provided")
+        self.index = index
+        self.mappings = mappings or {}
+        self.settings = settings or {}
+
+    def serialize(self) -> str:
+        """Return a textual description of the migration run to store in the log."""
+        changes = [name for name, body in [("mappings", self.mappings), ("settings", self.settings)] if body]
+        return f"Update {' and '.join(changes)} of index {self.index}"
+
+    def apply(self, connection_name: str) -> bool:
+        """Perform the migration."""
+        client = connections.get_connection(connection_name)
+        if not client.indices.exists(index=self.index):
+            _logger.error(f"Index {self.index} does not exist")
+            return False
+
+        if self.mappings:
+            _logger.info(f"[{self.__class__.__name__}] [{self.get_key()}] Updating mappings of {self.index}")
+            client.indices.put_mapping(index=self.index, body=self.mappings)
+        if self.settings:
+            _logger.info(f"[{self.__class__.__name__}] [{self.get_key()}] Updating settings of {self.index}")
+            client.indices.put_settings(index=self.index, body=self.settings)
+        return True
@@ -0,0 +1,9 @@
+"""Keep OpenSearch documents in sync with the Django models they mirror.
+
+A Django model is registered with the Document class that mirrors it. Changes
+to instances of the model are then collected via signals and written to
+OpenSearch in a single bulk request when the database transaction commits.
+"""
+
+from .registry import ModelDocumentRegistration, get_registration, get_registrations, register, unregister
+from .signal_processor import flush_pending_changes
@@ -0,0 +1,181 @@
+"""Incremental, resumable sync of the rows of a Django model into OpenSearch."""
+
+import datetime
+import decimal
+import json
+from logging import getLogger
+import time
+from typing import Any, Final, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from opensearchpy.exceptions import NotFoundError
+from opensearchpy.helpers.index import Index
+
+from django_opensearch_toolkit.indexing import OpenSearchBulkWriter
+from django_opensearch_toolkit.model_sync.registry import ModelDocumentRegistration
+from django_opensearch_toolkit.model_sync.sync_checkpoint import SyncCheckpoint
+
+
+_logger = getLogger(__name__)
+
+_OVERLAP_FIELD_TYPES = (models.DateField, models.IntegerField, models.FloatField, models.DecimalField)
+
+
+class ModelSyncer:
+    """Sync the rows of a registered model that changed since the last checkpoint.
+
+    Rows are streamed in order of a watermark field (e.g., an `updated`
+    timestamp that changes on every save), converted into Documents and
+    bulk-loaded. Every `chunk_size` rows, the writer is drained and the
+    watermark of the last row is saved as a checkpoint in the cluster. The
+    next run resumes from the checkpoint instead of scanning the whole table.
+
+    Rows with a watermark equal to the checkpoint are synced again on resume,
+    since rows sharing a watermark value may have been split across chunks.
+    Indexing is idempotent, so this is safe. Rows saved by transactions that
+    were still open when the checkpoint was saved may have a lower watermark,
+    and would be missed: set `overlap` to resume from further back (e.g., a bit
+    longer than the longest transaction, for a timestamp watermark).
+
+    NOTE: deleted rows cannot be detected from a watermark, so they are not
+    removed from the index. Use model_sync signals for deletions.
+    """
+
+    def __init__(
+        self,
+        connection_name: str,
+        registration: ModelDocumentRegistration,
+        watermark_field: str = "updated",
+        chunk_size: int = 2_000,
+        max_workers: int = 4,
+        overlap: float = 0,
+    ) -> None:
+        """Initialize the syncer.
+
+        Args:
+            connection_name: The name of the OpenSearch connection to write to.
+            registration: The registration of the model to sync.
+            watermark_field: Model field that increases whenever a row changes.
+            chunk_size: Number of rows fetched per database round-trip, and written between checkpoints.
+            max_workers: Maximum number of concurrent bulk requests.
+            overlap: Subtracted from the checkpoint when resuming: in seconds for date and datetime
+                watermark fields, or in the field's units for numeric ones.
+
+        Raises:
+            FieldDoesNotExist: if the watermark field does not exist.
+            ValueError: if an overlap is set, and the watermark field is neither a date nor a number.
+        """
+        self.connection_name: Final[str] = connection_name
+        self.registration: Final[ModelDocumentRegistration] = registration
+        self.watermark_field: Final[str] = watermark_field
+        self.chunk_size: Final[int] = chunk_size
+        self.max_workers: Final[int] = max_workers
+        self.overlap: Final[float] = overlap
+        self.model_label: Final[str] = registration.model._meta.label
+        self.checkpoint_index: Final[Index] = Index(name=SyncCheckpoint.Index.name, using=connection_name)
+
+        # Fail early if the watermark field does not exist
+        self._field: Any = registration.model._meta.get_field(watermark_field)
+        if overlap and not isinstance(self._field, _OVERLAP_FIELD_TYPES):
+            raise ValueError(
+                f"An overlap requires a date or numeric watermark field, got {self._field.__class__.__name__}"
+            )
+
+    # Public Methods
+
+    def sync(self, reset: bool = False) -> int:
+        """Sync the rows changed since the last checkpoint (or all rows, if reset), and return their count."""
+        self._create_checkpoint_index_if_not_exists()
+        checkpoint = None if reset else self._get_checkpoint()
+
+        queryset = self.registration.model._default_manager.order_by(self.watermark_field, "pk")
+        if checkpoint is not None:
+            watermark = self._subtract_overlap(self._field.to_python(json.loads(str(checkpoint.watermark))))
+            self._log(f"Resuming from checkpoint {self.watermark_field}={watermark}")
+            queryset = queryset.filter(**{f"{self.watermark_field}__gte": watermark})
+        else:
+            self._log("No checkpoint found, syncing all rows")
+
+        rows_synced_before = int(checkpoint.rows_synced) if checkpoint is not None else 0
+        rows_synced = 0
+        started_at = time.monotonic()
+        # Failures are checked (and raised) when saving checkpoints. Not raising them again on close
+        # also keeps any exception raised while syncing from being replaced by a BulkIndexError.
+        with OpenSearchBulkWriter(
+            self.connection_name,
+            max_actions=self.chunk_size,
+            max_workers=self.max_workers,
+            raise_on_error=False,
+        ) as writer:
+            last_row = None
+            for row in queryset.iterator(chunk_size=self.chunk_size):
+                writer.index(
+                    self.registration.to_document(row), index=self.registration.index_name, id=str(row.pk)
+                )
+                rows_synced += 1
+                last_row = row
+
+                if rows_synced % self.chunk_size == 0:
+                    self._save_checkpoint_when_written(writer, last_row, rows_synced_before + rows_synced)
+                    elapsed = time.monotonic() - started_at
+                    self._log(f"Synced {rows_synced} rows ({rows_synced / elapsed:.0f} rows/s)")
+
+            if last_row is not None:
+                self._save_checkpoint_when_written(writer, last_row, rows_synced_before + rows_synced)
+
+        self._log(f"Done. Synced {rows_synced} rows in {time.monotonic() - started_at:.1f}s")
+        return rows_synced
+
+    # Private Methods
+
+    def _log(self, message: str) -> None:
+        """Log message with a custom prefix."""
+        _logger.info(f"[{self.__class__.__name__}] [{self.model_label}] {message}")
+
+    def _subtract_overlap(self, watermark: Any) -> Any:
+        """Return the watermark to resume from, i.e., the checkpoint minus the overlap."""
+        if not self.overlap:
+            return watermark
+        if isinstance(watermark, datetime.date):  # also datetimes. Dates ignore the sub-day part.
+            return watermark - datetime.timedelta(seconds=self.overlap)
+        if isinstance(watermark, decimal.Decimal):
+            return watermark - decimal.Decimal(str(self.overlap))
+        return watermark - type(watermark)(self.overlap)
+
+    def _create_checkpoint_index_if_not_exists(self) -> None:
+        """Create the index that stores the checkpoints."""
+        if not self.checkpoint_index.exists():
+            self._log("Creating sync checkpoints index")
+            SyncCheckpoint.init(using=self.connection_name)
+
+    def _get_checkpoint(self) -> Optional[SyncCheckpoint]:
+        """Fetch the checkpoint of the last run, if any."""
+        try:
+            return SyncCheckpoint.get(
+                id=SyncCheckpoint.get_id(self.model_label, self.watermark_field),
+                using=self.connection_name,
+            )
+        except NotFoundError:
+            return None
+
+    def _save_checkpoint_when_written(
+        self, writer: OpenSearchBulkWriter, last_row: Any, rows_synced: int
+    ) -> None:
+        """Wait for all buffered rows to be written, then save the watermark of the last row as checkpoint.
+
+        Raises:
+            RuntimeError: if any row failed to be written, in which case the checkpoint is not saved.
+        """
+        writer.flush(wait=True)
+        if writer.stats().actions_failed > 0:
+            raise RuntimeError(f"Failed to write rows: {writer.errors()[:10]}")
+
+        SyncCheckpoint(
+            meta={"id": SyncCheckpoint.get_id(self.model_label, self.watermark_field)},
+            model=self.model_label,
+            watermark_field=self.watermark_field,
+            watermark=json.dumps(getattr(last_row, self.watermark_field), cls=DjangoJSONEncoder),
+            rows_synced=rows_synced,
+            updated_at=int(1000 * time.time()),
+        ).save(using=self.connection_name)
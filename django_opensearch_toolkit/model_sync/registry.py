@@ -0,0 +1,98 @@
+"""Registry of Django models and the Document classes that mirror them."""
+
+import dataclasses
+from typing import Callable, Dict, List, Optional, Type
+
+from django.db import models
+from django.db.models.signals import post_delete, post_save
+from opensearchpy.helpers.document import Document
+
+from django_opensearch_toolkit.model_sync import signal_processor
+
+
+ToDocument = Callable[[models.Model], Document]
+
+
+@dataclasses.dataclass(frozen=True)
+class ModelDocumentRegistration:
+    """A Django model and the Document class that mirrors it."""
+
+    model: Type[models.Model]
+    document_cls: Type[Document]
+    to_document: ToDocument
+
+    @property
+    def connection_name(self) -> str:
+        """The name of the OpenSearch connection the documents are written to."""
+        return self.document_cls._get_using()  # type: ignore[no-any-return]
+
+    @property
+    def index_name(self) -> str:
+        """The name of the index the documents are written to."""
+        return self.document_cls._default_index()  # type: ignore[no-any-return]
+
+
+_registrations: Dict[Type[models.Model], ModelDocumentRegistration] = {}
+
+
+def register(
+    model: Type[models.Model],
+    document_cls: Type[Document],
+    to_document: Optional[ToDocument] = None,
+) -> ModelDocumentRegistration:
+    """Mirror instances of a Django model as documents of the given Document class.
+
+    Call this from the ready() method of an app's AppConfig. The documents use
+    the primary keys of the model instances as ids.
+
+    Args:
+        model: The Django model class.
+        document_cls: The Document class that mirrors it.
+        to_document: Converts a model instance into a Document. By default, the model
+            attributes with the same names as the Document's fields are copied over.
+    """
+    if model in _registrations:
+        raise ValueError(f"Model {model._meta.label} is already registered")
+
+    registration = ModelDocumentRegistration(
+        model=model,
+        document_cls=document_cls,
+        to_document=to_document or _default_to_document(document_cls),
+    )
+    _registrations[model] = registration
+
+    dispatch_uid = f"django_opensearch_toolkit.model_sync.{model._meta.label}"
+    post_save.connect(signal_processor.handle_post_save, sender=model, dispatch_uid=dispatch_uid)
+    post_delete.connect(signal_processor.handle_post_delete, sender=model, dispatch_uid=dispatch_uid)
+    return registration
+
+
+def unregister(model: Type[models.Model]) -> None:
+    """Stop mirroring instances of a Django model."""
+    del _registrations[model]
+
+    dispatch_uid = f"django_opensearch_toolkit.model_sync.{model._meta.label}"
+    post_save.disconnect(sender=model, dispatch_uid=dispatch_uid)
+    post_delete.disconnect(sender=model, dispatch_uid=dispatch_uid)
+
+
+def get_registration(model: Type[models.Model]) -> Optional[ModelDocumentRegistration]:
+    """Return the registration for a Django model, if it is registered."""
+    return _registrations.get(model)
+
+
+def get_registrations() -> List[ModelDocumentRegistration]:
+    """Return all registrations."""
+    return list(_registrations.values())
+
+
+def _default_to_document(document_cls: Type[Document]) -> ToDocument:
+    """Return a converter that copies the model attributes named like the Document's fields."""
+    field_names = list(document_cls._doc_type.mapping)
+
+    def _to_document(instance: models.Model) -> Document:
+        return document_cls(
+            **{name: getattr(instance, name) for name in field_names if hasattr(instance, name)}
+        )
+
+    return _to_document
@@ -0,0 +1,149 @@
+"""Collect changes to registered models and write them to OpenSearch when transactions commit.
+
+Changes are only recorded as (model, primary key) pairs, deduplicated per
+transaction. When the transaction commits, the current rows are loaded
+in one query per model, and written to OpenSearch in one bulk request per
+cluster: rows that still exist are indexed, and missing rows are deleted.
+
+Reading the rows at commit time (instead of capturing them when they're saved)
+means rows saved in a savepoint that was later rolled back are still mirrored
+correctly, and multiple saves of the same row result in a single action.
+"""
+
+from collections import defaultdict
+from logging import getLogger
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Type
+import weakref
+
+from django.db import models, transaction
+
+from django_opensearch_toolkit.indexing import OpenSearchBulkWriter
+
+
+_logger = getLogger(__name__)
+
+_PendingChanges = Dict[Tuple[Type[models.Model], Any], None]  # ordered set of (model, pk)
+
+_local = threading.local()
+
+
+def handle_post_save(sender: Type[models.Model], instance: models.Model, using: str, **kwargs: Any) -> None:
+    """Receive the post_save signal of registered models."""
+    _record_change(sender, instance.pk, using)
+
+
+def handle_post_delete(sender: Type[models.Model], instance: models.Model, using: str, **kwargs: Any) -> None:
+    """Receive the post_delete signal of registered models."""
+    _record_change(sender, instance.pk, using)
+
+
+class _PendingBatch:
+    """The changes recorded in a transaction, written by its (single) on_commit callback."""
+
+    def __init__(self, using: str) -> None:
+        self.using = using
+        self.changes: _PendingChanges = {}
+        self.flushed = False
+
+    def flush(self) -> None:
+        """Write the changes, unless they were already written."""
+        if self.flushed:
+            return
+        self.flushed = True
+        _write_changes(self.using, self.changes)
+
+
+def _get_pending_batch(using: str) -> Optional[_PendingBatch]:
+    """Return the batch of the current transaction of the thread, or None if there is none yet.
+
+    Only the on_commit callback (batch.flush) references the batch strongly. A
+    rollback (of the transaction, or of a savepoint the callback was registered
+    in) discards the callback, and so the batch along with the changes recorded
+    since. Outside of a transaction, any remaining batch is stale.
+    """
+    if not hasattr(_local, "batches"):
+        _local.batches = {}
+    batch_ref: Optional["weakref.ReferenceType[_PendingBatch]"] = _local.batches.get(using)
+    batch = batch_ref() if batch_ref is not None else None
+    if batch is None or batch.flushed or transaction.get_autocommit(using):
+        return None
+    return batch
+
+
+def _record_change(model: Type[models.Model], pk: Any, using: str) -> None:
+    """Record a change, and schedule the batch to be written when the transaction commits.
+
+    A single flush is scheduled per batch. A new batch (and flush) is started if
+    the previous one was already written, or was discarded by a rollback.
+    """
+    batch = _get_pending_batch(using)
+    if batch is not None:
+        batch.changes[(model, pk)] = None
+        return
+
+    batch = _PendingBatch(using)
+    batch.changes[(model, pk)] = None
+    _local.batches[using] = weakref.ref(batch)
+    transaction.on_commit(batch.flush, using=using)
+
+
+def flush_pending_changes(using: str = "default") -> None:
+    """Write the pending changes of the current transaction for a database connection to OpenSearch now.
+
+    Failures are logged, but not raised.
+    """
+    batch = _get_pending_batch(using)
+    if batch is not None:
+        batch.flush()
+
+
+def _write_changes(using: str, pending_changes: _PendingChanges) -> None:
+    """Write changes to OpenSearch, reading the current rows from a database connection.
+
+    Failures are logged, but not raised, since the transaction was already committed.
+    """
+    # Imported here to avoid a circular import
+    from django_opensearch_toolkit.model_sync.registry import get_registration
+
+    if not pending_changes:
+        return
+
+    pks_by_model: Dict[Type[models.Model], List[Any]] = defaultdict(list)
+    for model, pk in pending_changes:
+        pks_by_model[model].append(pk)
+
+    writers: Dict[str, OpenSearchBulkWriter] = {}
+    try:
+        for model, pks in pks_by_model.items():
+            registration = get_registration(model)
+            if registration is None:
+                continue
+
+            connection_name = registration.connection_name
+            if connection_name not in writers:
+                writers[connection_name] = OpenSearchBulkWriter(
+                    connection_name,
+                    max_actions=10_000,
+                    max_workers=1,
+                    raise_on_error=False,
+                )
+            writer = writers[connection_name]
+
+            instances = model._default_manager.using(using).in_bulk(pks)
+            for pk in pks:
+                if pk in instances:
+                    writer.index(registration.to_document(instances[pk]), id=str(pk))
+                else:
+                    writer.delete(id=str(pk), index=registration.index_name)
+    except Exception:
+        _logger.exception("Failed to write pending changes to OpenSearch")
+    finally:
+        for connection_name, writer in writers.items():
+            try:
+                writer.close()
+            except Exception:
+                _logger.exception(f"[{connection_name}] Failed to write pending changes to OpenSearch")
+                continue
+            for error in writer.errors():
+                _logger.error(f"[{connection_name}] Failed to write a pending change to OpenSearch: {error}")
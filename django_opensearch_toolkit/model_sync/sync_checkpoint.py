@@ -0,0 +1,34 @@
+"""Document model for tracking the progress of incremental model syncs.
+
+Each document records, for a single model, the watermark (e.g., the `updated`
+timestamp) up to which rows were synced to the cluster. The documents are kept
+in a dedicated hidden index in the cluster, next to the migration logs.
+"""
+
+from opensearchpy.helpers.document import Document
+from opensearchpy.helpers.field import Date, Keyword, Long
+
+
+class SyncCheckpoint(Document):
+    """The progress of the incremental sync of a single model."""
+
+    model = Keyword(required=True)  # label of the Django model, e.g. "sample_app.Merchant"
+    watermark_field = Keyword(required=True)  # name of the model field used as the watermark
+    watermark = Keyword(required=True)  # serialized value of the watermark field
+    rows_synced = Long(required=True)  # total number of rows synced by runs using this checkpoint
+    updated_at = Date(required=True)
+
+    class Index:
+        """Configuration for the index."""
+
+        name = ".django_opensearch_toolkit.sync_checkpoint"
+        settings = {
+            "number_of_shards": 1,
+            "number_of_replicas": 1,
+            "hidden": True,
+        }
+
+    @staticmethod
+    def get_id(model: str, watermark_field: str) -> str:
+        """Return the document id of the checkpoint for a model and watermark field."""
+        return f"{model}.{watermark_field}"
@@ -0,0 +1,146 @@
+"""Unit tests for the model_sync package."""
+
+import json
+from typing import Any, Dict, List
+
+from django.contrib.auth.models import Group
+from django.db import transaction
+from opensearchpy.helpers.document import Document
+from opensearchpy.helpers.field import Keyword
+
+from django_opensearch_toolkit.model_sync import flush_pending_changes, get_registration, register, unregister
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+class GroupDocument(Document):
+    """Document mirroring the Group model for unit tests."""
+
+    name = Keyword()
+
+    class Index:
+        using = "unittest"
+        name = "groups"
+
+
+def _parse_body(body: bytes) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in body.decode("utf-8").splitlines()]
+
+
+class ModelSyncTest(MagicMockOpenSearchTestCase):
+    """Unit tests for the model_sync package."""
+
+    databases = {"default"}
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.bulk.side_effect = lambda body: {
+            "items": [{"index": {"status": 200}} for _ in range(len(_parse_body(body)))]
+        }
+        register(Group, GroupDocument)
+
+    def tearDown(self) -> None:
+        unregister(Group)
+        super().tearDown()
+
+    def test_registration(self) -> None:
+        registration = get_registration(Group)
+        assert registration is not None
+        self.assertEqual(registration.connection_name, "unittest")
+        self.assertEqual(registration.index_name, "groups")
+        with self.assertRaises(ValueError):
+            register(Group, GroupDocument)
+
+    def test_changes_are_batched_per_transaction(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                groups = [Group.objects.create(name=f"group{i}") for i in range(5)]
+                groups[0].name = "renamed"
+                groups[0].save()
+                deleted_pk = groups[1].pk
+                groups[1].delete()
+                self.test_client.bulk.assert_not_called()
+
+        # One bulk request, with a single action per row
+        self.test_client.bulk.assert_called_once()
+        body = _parse_body(self.test_client.bulk.call_args.kwargs["body"])
+        self.assertListEqual(
+            body,
+            [
+                {"index": {"_index": "groups", "_id": str(groups[0].pk)}},
+                {"name": "renamed"},
+                {"delete": {"_index": "groups", "_id": str(deleted_pk)}},
+            ]
+            + [
+                line
+                for group in groups[2:]
+                for line in ({"index": {"_index": "groups", "_id": str(group.pk)}}, {"name": group.name})
+            ],
+        )
+
+    def test_rolled_back_savepoint(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                kept = Group.objects.create(name="kept")
+                try:
+                    with transaction.atomic():
+                        Group.objects.create(name="rolled_back")
+                        raise ValueError("roll back the savepoint")
+                except ValueError:
+                    pass
+
+        body = _parse_body(self.test_client.bulk.call_args.kwargs["body"])
+        self.assertEqual(body[0], {"index": {"_index": "groups", "_id": str(kept.pk)}})
+        self.assertEqual(body[1], {"name": "kept"})
+        # The rolled back row does not exist, so its document is deleted (if it was ever indexed)
+        self.assertEqual(list(body[2]), ["delete"])
+
+    def test_single_flush_per_transaction(self) -> None:
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                for i in range(3):
+                    Group.objects.create(name=f"group{i}")
+        self.assertEqual(len(callbacks), 1)
+
+    def test_rolled_back_savepoint_with_the_first_change(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                try:
+                    with transaction.atomic():
+                        Group.objects.create(name="rolled_back")
+                        raise ValueError("roll back the savepoint")
+                except ValueError:
+                    pass
+                kept = Group.objects.create(name="kept")
+
+        body = _parse_body(self.test_client.bulk.call_args.kwargs["body"])
+        self.assertListEqual(body, [{"index": {"_index": "groups", "_id": str(kept.pk)}}, {"name": "kept"}])
+
+    def test_rolled_back_transaction(self) -> None:
+        try:
+            with transaction.atomic():
+                Group.objects.create(name="rolled_back1")
+                Group.objects.create(name="rolled_back2")
+                raise ValueError("roll back the transaction")
+        except ValueError:
+            pass
+        with self.captureOnCommitCallbacks(execute=True):
+            kept = Group.objects.create(name="kept")
+
+        # The change of the rolled back transaction doesn't leak into the next flush
+        body = _parse_body(self.test_client.bulk.call_args.kwargs["body"])
+        self.assertListEqual(body, [{"index": {"_index": "groups", "_id": str(kept.pk)}}, {"name": "kept"}])
+
+    def test_flush_pending_changes(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                Group.objects.create(name="group")
+                flush_pending_changes()
+                self.test_client.bulk.assert_called_once()
+        self.test_client.bulk.assert_called_once()  # not written again on commit
+
+    def test_failures_are_not_raised(self) -> None:
+        self.test_client.bulk.side_effect = ValueError("cluster is down")
+        with self.assertLogs("django_opensearch_toolkit.model_sync", level="ERROR"):
+            with self.captureOnCommitCallbacks(execute=True):
+                Group.objects.create(name="group")
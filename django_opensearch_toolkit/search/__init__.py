@@ -0,0 +1,26 @@
+"""Tools to serve searches and document lookups efficiently, e.g., by caching, coalescing or batching them."""
+
+from .batcher import BatchedSearch, SearchBatcher, enqueue_search, get_search_batcher, search_batching
+from .cache import cached_execute, cached_execute_raw, invalidate_index
+from .loader import DeferredDocument, DocumentLoader, document_loading, get_document_loader
+from .pagination import CursorPage, CursorPaginator
+from .raw import async_execute_raw, execute_raw, hit_dicts, hit_rows, iter_hits
+from .single_flight import (
+    SingleFlight,
+    SingleFlightStats,
+    async_coalesced_execute,
+    async_coalesced_execute_raw,
+    coalesced_execute,
+    coalesced_execute_raw,
+    search_flight,
+)
+from .streaming import (
+    async_iter_csv,
+    async_iter_ndjson,
+    async_iter_pit_pages,
+    async_streaming_search_response,
+    iter_csv,
+    iter_ndjson,
+    iter_pit_pages,
+    streaming_search_response,
+)
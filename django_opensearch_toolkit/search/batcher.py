@@ -0,0 +1,230 @@
+"""Batch the independent searches of a request into a single multi-search (_msearch) per cluster.
+
+Code that needs the results of several searches enqueues them first, and then
+asks for their results. The first result requested (or an explicit flush)
+sends all the searches enqueued so far in one _msearch request per cluster, so
+the latency is one round-trip instead of one per search:
+
+    merchants = enqueue_search(Merchant.search().query("match_all"))
+    products = enqueue_search(Product.search().query("match", name="shoe"))
+    merchants.result()  # sends both searches
+    products.result()  # already available
+
+Searches enqueued while handling a request (see SearchBatchingMiddleware), or in
+a search_batching() block, share a batcher, so searches enqueued by different
+parts of the code (e.g., template tags, serializers) are batched together.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+from logging import getLogger
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+from opensearchpy.client import OpenSearch
+from opensearchpy.connection import connections
+from opensearchpy.exceptions import TransportError
+from opensearchpy.helpers.response import Response
+from opensearchpy.helpers.search import MultiSearch, Search
+
+from django_opensearch_toolkit.async_client.connections import get_async_connection
+from django_opensearch_toolkit.search.keys import get_connection_name
+
+
+_logger = getLogger(__name__)
+
+_current_batcher: contextvars.ContextVar[Optional["SearchBatcher"]] = contextvars.ContextVar(
+    "django_opensearch_toolkit_search_batcher", default=None
+)
+
+
+class BatchedSearch:
+    """A search enqueued in a SearchBatcher, whose response is available once the batch is sent."""
+
+    def __init__(self, batcher: "SearchBatcher", search: Search) -> None:
+        """Initialize the batched search. Use SearchBatcher.add() (or enqueue_search()) instead."""
+        self.search = search
+        self._batcher = batcher
+        self._done = False
+        self._raw_response: Optional[Dict[str, Any]] = None
+        self._error: Optional[Exception] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the search was sent, and its response (or error) is available."""
+        return self._done
+
+    def result(self) -> Response:
+        """Return the response, sending the pending searches of the batcher first if needed.
+
+        Raises:
+            TransportError: if the search (or the whole _msearch request) failed.
+        """
+        if not self._done:
+            self._batcher.flush()
+        return self._get_response()
+
+    async def async_result(self) -> Response:
+        """Return the response, sending the pending searches with the async clients if needed."""
+        if not self._done:
+            await self._batcher.async_flush()
+        return self._get_response()
+
+    def _set_result(self, raw_response: Optional[Dict[str, Any]], error: Optional[Exception]) -> None:
+        self._raw_response = raw_response
+        self._error = error
+        self._done = True
+
+    def _get_response(self) -> Response:
+        if self._error is not None:
+            raise self._error
+        return self.search._response_class(self.search, self._raw_response)
+
+
+class SearchBatcher:
+    """Collects searches and sends them as one _msearch request per cluster."""
+
+    def __init__(self, msearch_kwargs: Optional[Dict[str, Any]] = None) -> None:
+        """Initialize the batcher.
+
+        Args:
+            msearch_kwargs: Additional keyword arguments for each call to OpenSearch.msearch()
+                (e.g., max_concurrent_searches).
+        """
+        self.msearch_kwargs = dict(msearch_kwargs or {})
+        self._pending: List[BatchedSearch] = []
+        self._pending_lock = threading.Lock()
+        self._lock = threading.Lock()  # held while flushing, so a flush in progress is waited for
+        self._async_lock: Optional[asyncio.Lock] = None
+        self._num_requests = 0
+
+    @property
+    def num_requests(self) -> int:
+        """Number of _msearch requests sent so far."""
+        return self._num_requests
+
+    def add(self, search: Search) -> BatchedSearch:
+        """Enqueue a search, to be sent with the next flush."""
+        batched = BatchedSearch(self, search)
+        with self._pending_lock:
+            self._pending.append(batched)
+        return batched
+
+    def flush(self) -> None:
+        """Send all pending searches. Errors are raised by the result() of each search."""
+        with self._lock:
+            for connection_name, batch in self._take_pending().items():
+                try:
+                    client = connections.get_connection(batch[0].search._using or "default")
+                    responses = client.msearch(body=self._get_body(batch), **self.msearch_kwargs)
+                except Exception as e:
+                    self._fail(connection_name, batch, e)
+                else:
+                    self._dispatch(batch, responses)
+
+    async def async_flush(self) -> None:
+        """Send all pending searches with the async clients. Errors are raised by async_result()."""
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            for connection_name, batch in self._take_pending().items():
+                try:
+                    client = self._get_async_client(batch[0].search._using or "default")
+                    responses = await client.msearch(body=self._get_body(batch), **self.msearch_kwargs)
+                except Exception as e:
+                    self._fail(connection_name, batch, e)
+                else:
+                    self._dispatch(batch, responses)
+
+    def _take_pending(self) -> Dict[str, List[BatchedSearch]]:
+        """Empty the queue, and return its searches by cluster."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        by_connection: Dict[str, List[BatchedSearch]] = {}
+        for batched in pending:
+            by_connection.setdefault(get_connection_name(batched.search), []).append(batched)
+        if by_connection:
+            self._num_requests += len(by_connection)
+        return by_connection
+
+    @staticmethod
+    def _get_body(batch: List[BatchedSearch]) -> List[Dict[str, Any]]:
+        """Return the _msearch body (header and body lines) of the searches."""
+        multi_search = MultiSearch()
+        for batched in batch:
+            multi_search = multi_search.add(batched.search)
+        return multi_search.to_dict()  # type: ignore[no-any-return]
+
+    @staticmethod
+    def _get_async_client(using: Any) -> Any:
+        """Return the async client of a connection name, or the (async) client object a search uses."""
+        if isinstance(using, str):
+            return get_async_connection(using)
+        if isinstance(using, OpenSearch):
+            raise TypeError(
+                "Searches using a (synchronous) OpenSearch client object can't be sent with async_flush(). "
+                "Use a connection name or an AsyncOpenSearch client instead."
+            )
+        return using
+
+    @staticmethod
+    def _dispatch(batch: List[BatchedSearch], responses: Dict[str, Any]) -> None:
+        """Set the response (or error) of each search."""
+        raw_responses = responses.get("responses", [])
+        if len(raw_responses) < len(batch):
+            error = TransportError(
+                "N/A",
+                "missing_response",
+                f"_msearch returned {len(raw_responses)} responses for {len(batch)} searches",
+            )
+            _logger.warning(f"[SearchBatcher] {error.info}")
+            for batched in batch[len(raw_responses) :]:
+                batched._set_result(None, error)
+
+        for batched, raw_response in zip(batch, raw_responses):
+            if raw_response.get("error"):
+                error = raw_response["error"]
+                error_type = error.get("type", "N/A") if isinstance(error, dict) else str(error)
+                batched._set_result(
+                    None, TransportError(raw_response.get("status", "N/A"), error_type, error)
+                )
+            else:
+                batched._set_result(raw_response, None)
+
+    @staticmethod
+    def _fail(connection_name: str, batch: List[BatchedSearch], error: Exception) -> None:
+        """Set the error of every search of a failed _msearch request."""
+        _logger.warning(
+            f"[SearchBatcher] [{connection_name}] _msearch of {len(batch)} searches failed: {error}"
+        )
+        for batched in batch:
+            batched._set_result(None, error)
+
+
+def get_search_batcher() -> Optional[SearchBatcher]:
+    """Return the batcher of the current request (or search_batching() block), if any."""
+    return _current_batcher.get()
+
+
+def enqueue_search(search: Search) -> BatchedSearch:
+    """Enqueue a search in the current batcher.
+
+    Outside of a request handled by SearchBatchingMiddleware (or a search_batching()
+    block), the search is batched alone, i.e., sent when its result is requested.
+    """
+    batcher = _current_batcher.get()
+    if batcher is None:
+        batcher = SearchBatcher()
+    return batcher.add(search)
+
+
+@contextlib.contextmanager
+def search_batching(msearch_kwargs: Optional[Dict[str, Any]] = None) -> Iterator[SearchBatcher]:
+    """Batch the searches enqueued within the block. Searches whose result is never requested are dropped."""
+    batcher = SearchBatcher(msearch_kwargs=msearch_kwargs)
+    token = _current_batcher.set(batcher)
+    try:
+        yield batcher
+    finally:
+        _current_batcher.reset(token)
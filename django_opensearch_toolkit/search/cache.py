@@ -0,0 +1,188 @@
+"""Cache the responses of searches in a Django cache, invalidated when the toolkit writes to their indices.
+
+Each (cluster, index) pair has a version counter in the cache, which is bumped
+whenever the toolkit's write paths change the index (see signals.index_written).
+The version of each searched index is part of the key of a cached response, so
+a write makes the cached responses for its index unreachable (they then expire
+with their timeout). Writes that bypass the toolkit (e.g., Document.save() or
+other services) are not seen, so the timeout bounds how stale a response can be.
+
+A write only becomes visible to searches after the next refresh of its index,
+so a search that misses the cache right after the versions are bumped may
+still get (and cache) the old results. The versions are bumped again after the
+`refresh_interval` option (counted from the last of consecutive writes to the
+index), so those responses are only served until then.
+
+NOTE: versions are kept in the cache itself, so invalidations only reach the
+processes sharing that cache. With a per-process cache (e.g., LocMemCache),
+writes made by other processes are not seen.
+"""
+
+from logging import getLogger
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.core.cache import BaseCache, caches
+from opensearchpy.helpers.response import Response
+from opensearchpy.helpers.search import Search
+
+from django_opensearch_toolkit.conf import get_search_cache_options
+from django_opensearch_toolkit.search.keys import get_connection_name, get_request_digest
+from django_opensearch_toolkit.search.single_flight import coalesced_execute_raw
+
+
+_logger = getLogger(__name__)
+
+_KEY_PREFIX = "django_opensearch_toolkit:search"
+
+# Version of the searches that target all indices, or index patterns, which any write invalidates
+_ALL_INDICES = "*"
+
+# Deadlines of the pending bumps after a refresh, by (cache alias, connection name, index)
+_BumpTarget = Tuple[str, str, str]
+_pending_bumps: Dict[_BumpTarget, float] = {}
+_pending_bumps_lock = threading.Lock()
+
+
+def cached_execute(search: Search, timeout: Optional[int] = None) -> Response:
+    """Execute the search, or return its cached response.
+
+    Identical searches that miss the cache at the same time are coalesced into a
+    single request (see single_flight). Falls back to coalesced_execute() when
+    OPENSEARCH_SEARCH_CACHE is not set.
+
+    Args:
+        search: The search to execute.
+        timeout: Seconds to cache the response for. Defaults to the configured timeout.
+    """
+    return search._response_class(search, cached_execute_raw(search, timeout=timeout))
+
+
+def cached_execute_raw(search: Search, timeout: Optional[int] = None) -> Dict[str, Any]:
+    """Like cached_execute(), but return the decoded response, without wrapping its hits (see raw)."""
+    options = get_search_cache_options()
+    if options is None:
+        return coalesced_execute_raw(search)
+
+    cache = caches[options["cache"]]
+    connection_name = get_connection_name(search)
+    indices = _get_indices(search)
+    key = _get_response_key(cache, search, connection_name, indices)
+
+    raw_response = cache.get(key)
+    if raw_response is not None:
+        return raw_response  # type: ignore[no-any-return]
+
+    # Keyed on the versions too, so a search that started before a write isn't shared with later ones
+    raw_response = coalesced_execute_raw(search, key=key)
+    if not raw_response.get("timed_out") and not raw_response.get("_shards", {}).get("failed"):  # complete
+        cache.set(key, raw_response, timeout if timeout is not None else options["timeout"])
+    return raw_response
+
+
+def invalidate_index(connection_name: str, index: str) -> None:
+    """Invalidate the cached responses of searches over the index (including searches over all indices).
+
+    The responses are invalidated now, and again after the `refresh_interval` option, once the write is
+    visible to searches.
+    """
+    options = get_search_cache_options()
+    if options is None:
+        return
+
+    _bump_versions(caches[options["cache"]], connection_name, index)
+    if options["refresh_interval"] > 0:
+        _schedule_bump_after_refresh((options["cache"], connection_name, index), options["refresh_interval"])
+
+
+def handle_index_written(sender: Any, connection_name: str, index: str, **kwargs: Any) -> None:
+    """Invalidate the cached responses for an index when the toolkit writes to it."""
+    try:
+        invalidate_index(connection_name, index)
+    except Exception:
+        # A cache outage must not fail writes. The cached responses expire with their timeout.
+        _logger.exception(f"Failed to invalidate cached searches of [{connection_name}] [{index}]")
+
+
+def _bump_versions(cache: BaseCache, connection_name: str, index: str) -> None:
+    """Bump the versions of the index and of all indices."""
+    for name in [index, _ALL_INDICES]:
+        key = _get_version_key(connection_name, name)
+        try:
+            cache.incr(key)
+        except ValueError:  # no version yet (or it was evicted)
+            cache.set(key, _new_version(), timeout=None)
+
+
+def _schedule_bump_after_refresh(target: _BumpTarget, delay: float) -> None:
+    """Bump the versions again after the delay, with at most one pending timer per index.
+
+    A write while a timer is pending postpones it instead. This is enough, since
+    each write also bumps the versions immediately, and the postponed bump then
+    invalidates anything cached before all the writes are visible.
+    """
+    with _pending_bumps_lock:
+        pending = target in _pending_bumps
+        _pending_bumps[target] = time.monotonic() + delay
+    if not pending:
+        _start_bump_timer(target, delay)
+
+
+def _start_bump_timer(target: _BumpTarget, delay: float) -> None:
+    """Start a timer thread that runs _bump_versions_after_refresh() after the delay."""
+    timer = threading.Timer(delay, _bump_versions_after_refresh, args=(target,))
+    timer.daemon = True
+    timer.start()
+
+
+def _bump_versions_after_refresh(target: _BumpTarget) -> None:
+    """Bump the versions again (from a timer thread), once the writes are visible to searches."""
+    with _pending_bumps_lock:
+        deadline = _pending_bumps.get(target)
+        if deadline is None:
+            return
+        remaining = deadline - time.monotonic()
+        if remaining > 0:  # postponed by a later write
+            _start_bump_timer(target, remaining)
+            return
+        del _pending_bumps[target]
+
+    cache_alias, connection_name, index = target
+    try:
+        _bump_versions(caches[cache_alias], connection_name, index)
+    except Exception:
+        _logger.exception(f"Failed to invalidate cached searches of [{connection_name}] [{index}]")
+
+
+def _get_indices(search: Search) -> List[str]:
+    """Return the names of the indices the search targets, or the name for all indices."""
+    names = [name for index in (search._index or []) for name in index.split(",")]
+    if not names or any(c in name for name in names for c in "*?"):
+        return [_ALL_INDICES]
+    return sorted(set(names))
+
+
+def _get_response_key(cache: BaseCache, search: Search, connection_name: str, indices: List[str]) -> str:
+    """Return the cache key of the response of the search, for the current versions of its indices."""
+    version_keys = {name: _get_version_key(connection_name, name) for name in indices}
+    versions = cache.get_many(list(version_keys.values()))
+    for name, version_key in version_keys.items():
+        if version_key not in versions:
+            # Starting from a fresh version (rather than 0) means responses cached before the version
+            # was evicted from the cache can't be served again.
+            cache.add(version_key, _new_version(), timeout=None)
+            versions[version_key] = cache.get(version_key)
+
+    digest = get_request_digest(search, versions=[versions[version_keys[name]] for name in indices])
+    return f"{_KEY_PREFIX}:response:{digest}"
+
+
+def _get_version_key(connection_name: str, index: str) -> str:
+    """Return the cache key of the version counter of an index."""
+    return f"{_KEY_PREFIX}:version:{connection_name}:{index}"
+
+
+def _new_version() -> int:
+    """Return an initial version, unique across evictions of the version counter."""
+    return time.time_ns()
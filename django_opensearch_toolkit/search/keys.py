@@ -0,0 +1,30 @@
+"""Keys that identify the request of a search, to share its response among identical searches."""
+
+import hashlib
+import json
+from typing import Any, Union
+
+from opensearchpy.helpers.search import Search
+
+from django_opensearch_toolkit.async_client._compat import AsyncSearch
+
+
+def get_connection_name(search: Union[Search, AsyncSearch]) -> str:
+    """Return the name of the connection the search uses (or an identifier of its client)."""
+    if isinstance(search._using, str):
+        return search._using
+    if search._using is None:
+        return "default"
+    return f"client-{id(search._using)}"
+
+
+def get_request_digest(search: Union[Search, AsyncSearch], **extra: Any) -> str:
+    """Return a digest of the cluster, indices, body and parameters of the search, and any extra values."""
+    request = {
+        "connection_name": get_connection_name(search),
+        "indices": search._index,
+        "body": search.to_dict(),
+        "params": search._params,
+        **extra,
+    }
+    return hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode("utf-8")).hexdigest()
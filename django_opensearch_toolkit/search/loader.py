@@ -0,0 +1,257 @@
+"""Batch the id lookups of a Document class into a single multi-get (_mget), with an identity map.
+
+Resolving references one document at a time (e.g., `Merchant.get(id=product.merchant_id)`
+for each product) costs one round-trip per document. A DocumentLoader collects
+the ids first, and fetches all of them with one _mget request when the first
+document is needed:
+
+    loader = get_document_loader(Merchant)
+    merchants = [loader.add(product.merchant_id) for product in products]
+    merchants[0].result()  # fetches every merchant
+    merchants[1].result()  # already available
+
+Fetched documents (and ids that were not found) are kept in the loader's
+identity map, so each id is fetched at most once, and every caller gets the same
+Document instance. With asyncio, the ids of all the async_load() calls made in the
+same tick of the event loop (e.g., by asyncio.gather) are fetched together.
+
+While handling a request (see SearchBatchingMiddleware), or in a document_loading()
+block, get_document_loader() returns the same loader for a Document class, so
+lookups from different parts of the code share one identity map. It is discarded
+at the end of the request, so documents are never served across requests.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+from logging import getLogger
+import threading
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar
+
+from opensearchpy.connection import connections
+from opensearchpy.exceptions import TransportError
+from opensearchpy.helpers.document import Document
+
+from django_opensearch_toolkit.async_client.connections import get_async_connection
+
+
+_logger = getLogger(__name__)
+
+_DocumentT = TypeVar("_DocumentT", bound=Document)
+
+_LoaderKey = Tuple[Type[Document], str, str]  # (document class, connection name, index)
+
+_current_loaders: contextvars.ContextVar[Optional[Dict[_LoaderKey, "DocumentLoader[Any]"]]] = (
+    contextvars.ContextVar("django_opensearch_toolkit_document_loaders", default=None)
+)
+
+
+class DeferredDocument(Generic[_DocumentT]):
+    """An id added to a DocumentLoader, whose document is available once the pending ids are fetched."""
+
+    def __init__(self, loader: "DocumentLoader[_DocumentT]", id: str) -> None:
+        """Initialize the deferred document. Use DocumentLoader.add() instead."""
+        self.id = id
+        self._loader = loader
+
+    @property
+    def done(self) -> bool:
+        """Whether the document was fetched (or its lookup failed)."""
+        return self._loader._is_done(self.id)
+
+    def result(self) -> Optional[_DocumentT]:
+        """Return the document (None if not found), fetching the pending ids of the loader first if needed.
+
+        Raises:
+            TransportError: if the lookup of the document (or the whole _mget request) failed.
+        """
+        if not self.done:
+            self._loader.flush()
+        return self._loader._get(self.id)
+
+    async def async_result(self) -> Optional[_DocumentT]:
+        """Return the document, fetching the pending ids with the async client if needed."""
+        if not self.done:
+            await self._loader.async_flush()
+        return self._loader._get(self.id)
+
+
+class DocumentLoader(Generic[_DocumentT]):
+    """Collects ids of documents of one class and index, and fetches them with _mget requests."""
+
+    def __init__(
+        self,
+        document_cls: Type[_DocumentT],
+        using: Optional[str] = None,
+        index: Optional[str] = None,
+        max_batch_size: int = 1000,
+    ) -> None:
+        """Initialize the loader.
+
+        Args:
+            document_cls: The class of the documents.
+            using: The connection (cluster) name. Defaults to the one of the Document class.
+            index: The index (or alias) name. Defaults to the one of the Document class.
+            max_batch_size: Maximum number of ids per _mget request.
+        """
+        if max_batch_size <= 0:
+            raise ValueError(f"max_batch_size must be positive, got {max_batch_size}")
+        self.document_cls = document_cls
+        self.using: str = document_cls._get_using(using)
+        self.index: str = document_cls._default_index(index)
+        self.max_batch_size = max_batch_size
+        self._documents: Dict[str, Optional[_DocumentT]] = {}  # the identity map
+        self._errors: Dict[str, Exception] = {}
+        self._pending: Dict[str, None] = {}  # ordered set of ids
+        self._pending_lock = threading.Lock()
+        self._lock = threading.Lock()  # held while flushing, so a flush in progress is waited for
+        self._async_lock: Optional[asyncio.Lock] = None
+        self._num_requests = 0
+
+    @property
+    def num_requests(self) -> int:
+        """Number of _mget requests sent so far."""
+        return self._num_requests
+
+    def add(self, id: Any) -> DeferredDocument[_DocumentT]:
+        """Add an id to fetch with the next flush, unless its document is already known."""
+        self._queue([str(id)])
+        return DeferredDocument(self, str(id))
+
+    def load(self, id: Any) -> Optional[_DocumentT]:
+        """Return the document with the id (None if not found), fetching it with the pending ids."""
+        return self.add(id).result()
+
+    def load_many(self, ids: Iterable[Any]) -> List[Optional[_DocumentT]]:
+        """Return the documents with the ids (None for each id not found), fetching them together."""
+        deferred = [self.add(id) for id in ids]
+        return [d.result() for d in deferred]
+
+    async def async_load(self, id: Any) -> Optional[_DocumentT]:
+        """Return the document with the id, fetching it with the ids loaded in the same tick of the loop."""
+        deferred = self.add(id)
+        if not deferred.done:
+            await asyncio.sleep(0)  # let the other lookups scheduled in this tick add their ids
+        return await deferred.async_result()
+
+    async def async_load_many(self, ids: Iterable[Any]) -> List[Optional[_DocumentT]]:
+        """Return the documents with the ids, fetching them with the async client."""
+        deferred = [self.add(id) for id in ids]
+        if not all(d.done for d in deferred):
+            await asyncio.sleep(0)
+        return [await d.async_result() for d in deferred]
+
+    def prime(self, document: _DocumentT) -> None:
+        """Add a document obtained otherwise (e.g., from a search) to the identity map."""
+        with self._pending_lock:
+            id = str(document.meta.id)
+            self._documents[id] = document
+            self._errors.pop(id, None)
+            self._pending.pop(id, None)
+
+    def clear(self, id: Any) -> None:
+        """Remove an id from the identity map, so it is fetched again."""
+        with self._pending_lock:
+            self._documents.pop(str(id), None)
+            self._errors.pop(str(id), None)
+
+    def flush(self) -> None:
+        """Fetch all pending ids. Errors are raised by the result() of each deferred document."""
+        with self._lock:
+            for ids in self._take_pending():
+                try:
+                    client = connections.get_connection(self.using)
+                    response = client.mget(index=self.index, body={"ids": ids})
+                except Exception as e:
+                    self._fail(ids, e)
+                else:
+                    self._dispatch(ids, response)
+
+    async def async_flush(self) -> None:
+        """Fetch all pending ids with the async client. Errors are raised by async_result()."""
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            for ids in self._take_pending():
+                try:
+                    client = get_async_connection(self.using)
+                    response = await client.mget(index=self.index, body={"ids": ids})
+                except Exception as e:
+                    self._fail(ids, e)
+                else:
+                    self._dispatch(ids, response)
+
+    def _queue(self, ids: List[str]) -> None:
+        """Add the ids that are not known (or whose lookup failed) to the queue."""
+        with self._pending_lock:
+            for id in ids:
+                if id not in self._documents:
+                    self._errors.pop(id, None)  # retry failed lookups
+                    self._pending[id] = None
+
+    def _take_pending(self) -> List[List[str]]:
+        """Empty the queue, and return its ids in batches of at most max_batch_size."""
+        with self._pending_lock:
+            pending, self._pending = list(self._pending), {}
+        batches = [pending[i : i + self.max_batch_size] for i in range(0, len(pending), self.max_batch_size)]
+        self._num_requests += len(batches)
+        return batches
+
+    def _is_done(self, id: str) -> bool:
+        with self._pending_lock:
+            return id in self._documents or id in self._errors
+
+    def _get(self, id: str) -> Optional[_DocumentT]:
+        with self._pending_lock:
+            if id in self._errors:
+                raise self._errors[id]
+            return self._documents[id]
+
+    def _dispatch(self, ids: List[str], response: Dict[str, Any]) -> None:
+        """Add the documents of an _mget response to the identity map, or record their errors."""
+        with self._pending_lock:
+            for id, doc in zip(ids, response["docs"]):
+                if doc.get("error"):
+                    error = doc["error"]
+                    error_type = error.get("type", "N/A") if isinstance(error, dict) else str(error)
+                    self._errors[id] = TransportError("N/A", error_type, error)
+                elif doc.get("found"):
+                    self._documents[id] = self.document_cls.from_opensearch(doc)
+                else:
+                    self._documents[id] = None
+
+    def _fail(self, ids: List[str], error: Exception) -> None:
+        """Record the error of every id of a failed _mget request."""
+        _logger.warning(
+            f"[DocumentLoader] [{self.using}] [{self.index}] _mget of {len(ids)} ids failed: {error}"
+        )
+        with self._pending_lock:
+            for id in ids:
+                self._errors[id] = error
+
+
+def get_document_loader(
+    document_cls: Type[_DocumentT],
+    using: Optional[str] = None,
+    index: Optional[str] = None,
+) -> DocumentLoader[_DocumentT]:
+    """Return the loader of the current request (or document_loading() block) for the Document class.
+
+    Outside of a request handled by SearchBatchingMiddleware (or a document_loading()
+    block), a new loader is returned, i.e., its identity map is not shared.
+    """
+    loader: DocumentLoader[_DocumentT] = DocumentLoader(document_cls, using=using, index=index)
+    loaders = _current_loaders.get()
+    if loaders is None:
+        return loader
+    return loaders.setdefault((document_cls, loader.using, loader.index), loader)
+
+
+@contextlib.contextmanager
+def document_loading() -> Iterator[None]:
+    """Share the loaders (and their identity maps) returned by get_document_loader() within the block."""
+    token = _current_loaders.set({})
+    try:
+        yield
+    finally:
+        _current_loaders.reset(token)
@@ -0,0 +1,41 @@
+"""Django middleware to batch the searches and document lookups of each request (see batcher and loader)."""
+
+from typing import Any, Callable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpRequest, HttpResponse
+
+from django_opensearch_toolkit.search.batcher import search_batching
+from django_opensearch_toolkit.search.loader import document_loading
+
+
+class SearchBatchingMiddleware:
+    """Give each request its own SearchBatcher and DocumentLoaders.
+
+    enqueue_search() then batches the searches of the request, and get_document_loader()
+    shares one identity map (per Document class) among its lookups.
+
+    Add "django_opensearch_toolkit.search.middleware.SearchBatchingMiddleware" to MIDDLEWARE.
+    Works under both WSGI and ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        """Initialize the middleware."""
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        """Handle the request within search_batching() and document_loading() blocks."""
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with search_batching(), document_loading():
+            return self.get_response(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """Handle the request within search_batching() and document_loading() blocks, asynchronously."""
+        with search_batching(), document_loading():
+            return await self.get_response(request)  # type: ignore[no-any-return]
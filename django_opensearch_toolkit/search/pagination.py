@@ -0,0 +1,170 @@
+"""Paginate searches with search_after and opaque cursors, so every page costs the same.
+
+Paginating with from/size makes each cluster shard collect (and sort) all the
+hits before the page, so deep pages get linearly more expensive, and stop at
+`index.max_result_window`. A CursorPaginator instead sorts the search with a
+tiebreaker (so the sort is total), and returns, with each page, a cursor holding
+the sort values of its last hit, from which the next page starts (search_after):
+
+    paginator = CursorPaginator(Merchant.search().sort("name"), page_size=10, tiebreaker="website")
+    page = paginator.get_page(request.GET.get("cursor"))
+    ... hit_dicts(page.response) ..., page.next_cursor
+
+Cursors are signed (with django.core.signing, i.e., the SECRET_KEY), so clients
+can't forge them, and are only valid for the search they were made for. With
+pit_keep_alive, the pages are read from a point in time (PIT) of the indices, so
+they stay consistent while the indices change, as long as each page is requested
+within keep_alive of the previous one. The PIT then expires after keep_alive.
+"""
+
+import dataclasses
+from logging import getLogger
+from typing import Any, Callable, Dict, List, Optional
+
+from django.core import signing
+from opensearchpy.connection import connections
+from opensearchpy.helpers.search import Search
+
+from django_opensearch_toolkit.search.keys import get_request_digest
+from django_opensearch_toolkit.search.raw import execute_raw
+
+
+_logger = getLogger(__name__)
+
+_SALT = "django_opensearch_toolkit.search.pagination"
+
+
+def add_tiebreaker(sort: List[Any], tiebreaker: str) -> List[Any]:
+    """Return the sort (as in a search body) with the tiebreaker field last, unless already sorted on."""
+    fields = {item if isinstance(item, str) else next(iter(item)) for item in sort}
+    return list(sort) if tiebreaker in fields else [*sort, tiebreaker]
+
+
+@dataclasses.dataclass
+class CursorPage:
+    """A page of hits, with the cursor of the next page."""
+
+    response: Dict[str, Any]  # the decoded response, holding only the hits of the page
+    next_cursor: Optional[str]  # None on the last page
+
+    @property
+    def hits(self) -> List[Dict[str, Any]]:
+        """The (raw) hits of the page."""
+        return self.response.get("hits", {}).get("hits", [])  # type: ignore[no-any-return]
+
+    @property
+    def has_next(self) -> bool:
+        """Whether there is a next page."""
+        return self.next_cursor is not None
+
+
+class CursorPaginator:
+    """Paginates a search with search_after, returning signed cursors for the next pages."""
+
+    def __init__(
+        self,
+        search: Search,
+        page_size: int,
+        tiebreaker: Optional[str] = None,
+        pit_keep_alive: Optional[str] = None,
+        delete_pit: bool = False,
+        max_age: Optional[int] = None,
+        execute: Callable[[Search], Dict[str, Any]] = execute_raw,
+    ) -> None:
+        """Initialize the paginator.
+
+        Args:
+            search: The search (with its query and sort) to paginate. Its size and from are ignored.
+            page_size: Number of hits per page.
+            tiebreaker: A field with a unique value per document, appended to the sort of the
+                search (unless already there) so that pages never skip or repeat hits. Defaults to
+                `_shard_doc` with a point in time, and is required without one: use a keyword (or
+                numeric) field with doc values. Avoid `_id`, whose fielddata would be loaded on the heap.
+            pit_keep_alive: If set (e.g., "5m"), read the pages from a point in time, kept alive
+                for this long after each page.
+            delete_pit: Whether to delete the point in time once the last page is read. By default,
+                it expires after pit_keep_alive instead, so the last page can still be requested
+                again (e.g., when a client retries).
+            max_age: If set, cursors expire after this many seconds.
+            execute: Runs the search of a page and returns its decoded response, e.g., cached_execute_raw.
+        """
+        if page_size <= 0:
+            raise ValueError(f"page_size must be positive, got {page_size}")
+        if pit_keep_alive is not None and not search._index:
+            raise ValueError("The search must target explicit indices to read them from a point in time")
+        if tiebreaker is None:
+            if pit_keep_alive is None:
+                raise ValueError(
+                    "A tiebreaker is required without a point in time: "
+                    "a keyword (or numeric) field with doc values and a unique value per document"
+                )
+            tiebreaker = "_shard_doc"  # the position of the document in the PIT
+        self.search = search.sort(*add_tiebreaker(search.to_dict().get("sort", []), tiebreaker))
+        self.search._extra.pop("from", None)
+        self.page_size = page_size
+        self.pit_keep_alive = pit_keep_alive
+        self.delete_pit = delete_pit
+        self.max_age = max_age
+        self.execute = execute
+        self._search_digest = get_request_digest(self.search)[:16]
+
+    def get_page(self, cursor: Optional[str] = None) -> CursorPage:
+        """Return the first page, or the page a cursor (returned with the previous page) points to.
+
+        Raises:
+            ValueError: if the cursor is invalid, expired, or was made for another search.
+        """
+        search_after: Optional[List[Any]] = None
+        pit_id: Optional[str] = None
+        if cursor is not None:
+            search_after, pit_id = self._decode(cursor)
+        elif self.pit_keep_alive is not None:
+            pit_id = self._create_pit()
+
+        search = self.search.extra(size=self.page_size + 1)  # one more hit tells if there is a next page
+        if search_after is not None:
+            search = search.extra(search_after=search_after)
+        if pit_id is not None:
+            search = search.index().extra(pit={"id": pit_id, "keep_alive": self.pit_keep_alive})
+
+        response = self.execute(search)
+        pit_id = response.get("pit_id", pit_id)  # the id may change between pages
+        hits: List[Dict[str, Any]] = response.get("hits", {}).get("hits", [])
+        if len(hits) <= self.page_size:
+            if pit_id is not None and self.delete_pit:
+                self._delete_pit(pit_id)
+            return CursorPage(response=response, next_cursor=None)
+
+        page_response = {**response, "hits": {**response["hits"], "hits": hits[: self.page_size]}}
+        return CursorPage(response=page_response, next_cursor=self._encode(hits[self.page_size - 1], pit_id))
+
+    def _encode(self, last_hit: Dict[str, Any], pit_id: Optional[str]) -> str:
+        """Return the cursor of the page after the hit."""
+        payload: Dict[str, Any] = {"d": self._search_digest, "a": last_hit["sort"]}
+        if pit_id is not None:
+            payload["p"] = pit_id
+        return signing.dumps(payload, salt=_SALT, compress=True)
+
+    def _decode(self, cursor: str) -> Any:
+        """Return the search_after values and PIT id of a cursor."""
+        try:
+            payload = signing.loads(cursor, salt=_SALT, max_age=self.max_age)
+        except signing.BadSignature as e:  # also raised for expired cursors
+            raise ValueError(f"Invalid cursor: {e}") from e
+        if not isinstance(payload, dict) or payload.get("d") != self._search_digest:
+            raise ValueError("Invalid cursor: it was made for another search")
+        if (payload.get("p") is None) != (self.pit_keep_alive is None):
+            raise ValueError("Invalid cursor: the point in time doesn't match the paginator")
+        return payload["a"], payload.get("p")
+
+    def _create_pit(self) -> str:
+        client = connections.get_connection(self.search._using)
+        response = client.create_pit(index=",".join(self.search._index), keep_alive=self.pit_keep_alive)
+        return response["pit_id"]  # type: ignore[no-any-return]
+
+    def _delete_pit(self, pit_id: str) -> None:
+        try:
+            connections.get_connection(self.search._using).delete_pit(body={"pit_id": [pit_id]})
+        except Exception as e:
+            # The PIT expires after keep_alive anyway
+            _logger.warning(f"[CursorPaginator] Failed to delete point in time: {e}")
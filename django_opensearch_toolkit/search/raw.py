@@ -0,0 +1,100 @@
+"""Execute searches without wrapping their responses, and extract plain rows from the hits.
+
+Search.execute() wraps the response, and every hit, in Response/Hit/Document
+objects (AttrDict), which a view serializing hundreds of hits mostly unwraps
+again. The functions here return the decoded response as-is, and build plain
+dicts (or compact tuples) holding only the requested `_source` fields:
+
+    response = execute_raw(Merchant.search().source(["name", "website"]))
+    hit_dicts(response, ["name", "website"])  # [{"id": "1", "name": ..., "website": ...}, ...]
+
+Fields are looked up at the top level of `_source` (use dotted names for object
+fields, e.g., "address.city"). Missing fields are None.
+"""
+
+import collections
+import functools
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from opensearchpy.connection import connections
+from opensearchpy.helpers.search import Search
+
+from django_opensearch_toolkit.async_client._compat import AsyncSearch
+from django_opensearch_toolkit.async_client.connections import get_async_connection
+
+
+def execute_raw(search: Search) -> Dict[str, Any]:
+    """Execute the search, and return its decoded response without wrapping it (or its hits)."""
+    client = connections.get_connection(search._using)
+    response: Dict[str, Any] = client.search(index=search._index, body=search.to_dict(), **search._params)
+    return response
+
+
+async def async_execute_raw(search: AsyncSearch) -> Dict[str, Any]:
+    """Execute the async search, and return its decoded response without wrapping it (or its hits)."""
+    client = get_async_connection(search._using) if isinstance(search._using, str) else search._using
+    return await client.search(  # type: ignore[no-any-return]
+        index=search._index, body=search.to_dict(), **search._params
+    )
+
+
+def iter_hits(response: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Iterate over the (raw) hits of a decoded response."""
+    return iter(response.get("hits", {}).get("hits", []))
+
+
+def hit_dicts(
+    response: Dict[str, Any],
+    fields: Optional[Sequence[str]] = None,
+    id_key: Optional[str] = "id",
+) -> List[Dict[str, Any]]:
+    """Return a dict per hit, with its id (under id_key, unless None) and `_source` fields.
+
+    Args:
+        response: The decoded response, e.g., from execute_raw().
+        fields: The fields to include. Defaults to the whole `_source` of each hit.
+        id_key: The key to hold the `_id` of each hit, or None to leave it out.
+    """
+    rows: List[Dict[str, Any]] = []
+    for hit in iter_hits(response):
+        source = hit.get("_source", {})
+        row = {id_key: hit.get("_id")} if id_key is not None else {}
+        if fields is None:
+            row.update(source)
+        else:
+            for field in fields:
+                row[field] = source[field] if field in source else _get_field(source, field)
+        rows.append(row)
+    return rows
+
+
+def hit_rows(response: Dict[str, Any], fields: Sequence[str]) -> List[Tuple[Any, ...]]:
+    """Return a named tuple per hit, with its `id` followed by the `_source` fields.
+
+    Fields that aren't valid identifiers (e.g., dotted names) are renamed to _1, _2, etc.
+    """
+    make_row = _get_row_type(tuple(fields))._make
+    rows: List[Tuple[Any, ...]] = []
+    for hit in iter_hits(response):
+        source = hit.get("_source", {})
+        values = [hit.get("_id")]
+        for field in fields:
+            values.append(source[field] if field in source else _get_field(source, field))
+        rows.append(make_row(values))
+    return rows
+
+
+@functools.lru_cache(maxsize=128)
+def _get_row_type(fields: Tuple[str, ...]) -> Any:
+    """Return the named tuple type of the rows with the fields (shared by all the calls with them)."""
+    return collections.namedtuple("Row", ("id",) + fields, rename=True)  # type: ignore[misc]
+
+
+def _get_field(source: Dict[str, Any], field: str) -> Any:
+    """Return a (possibly dotted) field of a `_source`, or None if it is missing."""
+    value: Any = source
+    for part in field.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
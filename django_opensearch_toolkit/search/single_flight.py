@@ -0,0 +1,145 @@
+"""Coalesce identical concurrent searches into a single request to the cluster.
+
+When many callers issue the same search at the same time (e.g., after the
+cached response of a hot search expires), only the first one (the leader)
+sends it. The others wait for, and share, its response (or exception).
+Searches are identical if they have the same cluster, indices, body and
+parameters (see keys.get_request_digest).
+"""
+
+import asyncio
+import dataclasses
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from opensearchpy.helpers.response import Response
+from opensearchpy.helpers.search import Search
+
+from django_opensearch_toolkit.async_client._compat import AsyncSearch
+from django_opensearch_toolkit.search.keys import get_request_digest
+from django_opensearch_toolkit.search.raw import async_execute_raw, execute_raw
+
+
+_T = TypeVar("_T")
+
+
+@dataclasses.dataclass(frozen=True)
+class SingleFlightStats:
+    """Snapshot of the counters of a SingleFlight."""
+
+    executions: int  # calls that were executed, i.e., by a leader
+    coalesced: int  # calls that shared the result of a leader instead
+
+    @property
+    def coalesced_ratio(self) -> float:
+        """Fraction of the calls that were coalesced."""
+        calls = self.executions + self.coalesced
+        return self.coalesced / calls if calls else 0.0
+
+
+class _Call:
+    """An in-flight call of a (synchronous) function, shared by its callers."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Share the result of an in-flight call among all concurrent callers with the same key.
+
+    Works across threads (do) and within each asyncio event loop (do_async).
+    Results are not kept after the call completes, i.e., this is not a cache.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the SingleFlight."""
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._tasks: Dict[Tuple[int, str], "asyncio.Future[Any]"] = {}  # by (id of the event loop, key)
+        self._executions = 0
+        self._coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], _T]) -> _T:
+        """Call fn, or wait for the in-flight call with the same key and return its result."""
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._executions += 1
+            else:
+                self._coalesced += 1
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[no-any-return]
+
+        try:
+            call.result = fn()
+            return call.result  # type: ignore[no-any-return]
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[_T]]) -> _T:
+        """Await fn, or the in-flight call with the same key (in this event loop), and return its result.
+
+        The call runs in its own task, so cancelling any of the callers doesn't cancel it for the others.
+        """
+        loop = asyncio.get_running_loop()
+        task_key = (id(loop), key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = self._tasks[task_key] = asyncio.ensure_future(fn())
+                task.add_done_callback(lambda _: self._forget_task(task_key))
+                self._executions += 1
+            else:
+                self._coalesced += 1
+        return await asyncio.shield(task)  # type: ignore[no-any-return]
+
+    def stats(self) -> SingleFlightStats:
+        """Return a snapshot of the counters."""
+        with self._lock:
+            return SingleFlightStats(executions=self._executions, coalesced=self._coalesced)
+
+    def _forget_task(self, task_key: Tuple[int, str]) -> None:
+        with self._lock:
+            self._tasks.pop(task_key, None)
+
+
+# Shared by all searches in the process
+search_flight = SingleFlight()
+
+
+def coalesced_execute(search: Search) -> Response:
+    """Execute the search, sharing the response with identical searches executing concurrently."""
+    return search._response_class(search, coalesced_execute_raw(search))
+
+
+def coalesced_execute_raw(search: Search, key: Optional[str] = None) -> Dict[str, Any]:
+    """Like coalesced_execute(), but return the decoded response (shared by the callers: don't modify it).
+
+    Args:
+        search: The search to execute.
+        key: Only searches with the same key are coalesced. Defaults to the digest of the search.
+    """
+    return search_flight.do(key or get_request_digest(search), lambda: execute_raw(search))
+
+
+async def async_coalesced_execute(search: AsyncSearch) -> Response:
+    """Execute the async search, sharing the response with identical searches executing concurrently."""
+    return search._response_class(search, await async_coalesced_execute_raw(search))
+
+
+async def async_coalesced_execute_raw(search: AsyncSearch) -> Dict[str, Any]:
+    """Like async_coalesced_execute(), but return the decoded response (don't modify it)."""
+    return await search_flight.do_async(get_request_digest(search), lambda: async_execute_raw(search))
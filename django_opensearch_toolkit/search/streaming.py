@@ -0,0 +1,287 @@
+"""Stream all the hits of a search from a view, e.g., to export them as NDJSON or CSV.
+
+The hits are read one page at a time from a point in time (PIT) of the indices,
+with search_after (instead of from/size, whose cost grows with the depth), so
+the results are consistent even if the indices change during the export. Each
+page is serialized and released before the next one is requested, so memory
+stays constant however many hits there are:
+
+    def export(request):
+        search = Merchant.search().query("match_all").sort("name")
+        return streaming_search_response(search, "csv", fields=["name", "website"], filename="merchants.csv")
+
+The PIT is deleted when the response is closed, i.e., also when the client disconnects.
+
+Under ASGI, Django consumes a synchronous iterator in a thread, buffering the
+whole response first. Use async_streaming_search_response() (with an AsyncSearch,
+e.g., from async_client.async_search()) in async views instead, whose pages are
+read with the async client.
+"""
+
+import csv
+import io
+import json
+from logging import getLogger
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from django.http import StreamingHttpResponse
+from opensearchpy.connection import connections
+from opensearchpy.helpers.search import Search
+
+from django_opensearch_toolkit.async_client._compat import AsyncSearch
+from django_opensearch_toolkit.async_client.connections import get_async_connection
+from django_opensearch_toolkit.search.pagination import add_tiebreaker
+from django_opensearch_toolkit.search.raw import hit_dicts, hit_rows
+
+
+_logger = getLogger(__name__)
+
+_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def iter_pit_pages(
+    search: Search,
+    page_size: int = 1000,
+    keep_alive: str = "1m",
+    tiebreaker: str = "_shard_doc",
+) -> Generator[Dict[str, Any], None, None]:
+    """Iterate over the (decoded) responses of each page of the search, read from a point in time.
+
+    Args:
+        search: The search (with its query, sort and `_source`). Its size and from are ignored.
+        page_size: Number of hits per page.
+        keep_alive: How long the PIT is kept between pages, e.g., "1m".
+        tiebreaker: A field with a unique value per document, appended to the sort of the search
+            so that search_after never skips or repeats hits. Defaults to `_shard_doc` (the position
+            of the document in the PIT), which is free. Avoid `_id`: sorting on it loads its fielddata
+            on the heap. Otherwise, use a keyword (or numeric) field with doc values.
+    """
+    # Validated now, while the PIT is only created when the first page is requested
+    index = _get_pit_index(search, page_size)
+    return _iter_pit_pages(search, index, page_size, keep_alive, tiebreaker)
+
+
+async def async_iter_pit_pages(
+    search: AsyncSearch,
+    page_size: int = 1000,
+    keep_alive: str = "1m",
+    tiebreaker: str = "_shard_doc",
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """Like iter_pit_pages(), but for an AsyncSearch, reading the pages with the async client."""
+    index = _get_pit_index(search, page_size)
+    client = get_async_connection(search._using) if isinstance(search._using, str) else search._using
+    pit_id: str = (await client.create_pit(index=index, keep_alive=keep_alive))["pit_id"]
+    try:
+        body = _get_page_body(search, page_size, tiebreaker)
+        search_after: Optional[List[Any]] = None
+        while True:
+            page_body = {**body, "pit": {"id": pit_id, "keep_alive": keep_alive}}
+            if search_after is not None:
+                page_body["search_after"] = search_after
+            response: Dict[str, Any] = await client.search(body=page_body, **search._params)
+            pit_id = response.get("pit_id", pit_id)  # the id may change between pages
+            hits = response.get("hits", {}).get("hits", [])
+            if hits:
+                yield response
+            if len(hits) < page_size:  # last page, skip the extra round-trip
+                return
+            search_after = hits[-1]["sort"]
+    finally:
+        try:
+            await client.delete_pit(body={"pit_id": [pit_id]})
+        except Exception as e:
+            # The PIT expires after keep_alive anyway
+            _logger.warning(f"Failed to delete point in time for [{index}]: {e}")
+
+
+def _get_pit_index(search: Union[Search, AsyncSearch], page_size: int) -> str:
+    """Validate the arguments, and return the indices to create the PIT of."""
+    if page_size <= 0:
+        raise ValueError(f"page_size must be positive, got {page_size}")
+    if not search._index:
+        raise ValueError("The search must target explicit indices to read them from a point in time")
+    return ",".join(search._index)
+
+
+def _get_page_body(search: Union[Search, AsyncSearch], page_size: int, tiebreaker: str) -> Dict[str, Any]:
+    """Return the body of the search for each page, without the PIT and search_after."""
+    body: Dict[str, Any] = search.to_dict()
+    body.pop("from", None)
+    body["size"] = page_size
+    body["sort"] = add_tiebreaker(body.get("sort", []), tiebreaker)
+    return body
+
+
+def _iter_pit_pages(
+    search: Search, index: str, page_size: int, keep_alive: str, tiebreaker: str
+) -> Generator[Dict[str, Any], None, None]:
+    """Create the PIT, iterate over the pages, and delete the PIT when done (or closed)."""
+    client = connections.get_connection(search._using)
+    pit_id: str = client.create_pit(index=index, keep_alive=keep_alive)["pit_id"]
+    try:
+        body = _get_page_body(search, page_size, tiebreaker)
+        search_after: Optional[List[Any]] = None
+        while True:
+            page_body = {**body, "pit": {"id": pit_id, "keep_alive": keep_alive}}
+            if search_after is not None:
+                page_body["search_after"] = search_after
+            response: Dict[str, Any] = client.search(body=page_body, **search._params)
+            pit_id = response.get("pit_id", pit_id)  # the id may change between pages
+            hits = response.get("hits", {}).get("hits", [])
+            if hits:
+                yield response
+            if len(hits) < page_size:  # last page, skip the extra round-trip
+                return
+            search_after = hits[-1]["sort"]
+    finally:
+        try:
+            client.delete_pit(body={"pit_id": [pit_id]})
+        except Exception as e:
+            # The PIT expires after keep_alive anyway
+            _logger.warning(f"Failed to delete point in time for [{index}]: {e}")
+
+
+def iter_ndjson(search: Search, fields: Optional[Sequence[str]] = None, **kwargs: Any) -> Iterator[bytes]:
+    """Iterate over the hits of the search as NDJSON, one chunk per page (see iter_pit_pages for kwargs).
+
+    Each line holds the `id` and the `_source` fields (all of them, if fields is None) of a hit.
+    """
+    return _iter_ndjson_chunks(iter_pit_pages(search, **kwargs), fields)
+
+
+def iter_csv(
+    search: Search,
+    fields: Sequence[str],
+    header: bool = True,
+    **kwargs: Any,
+) -> Iterator[bytes]:
+    """Iterate over the hits of the search as CSV, one chunk per page (see iter_pit_pages for kwargs).
+
+    Each row holds the id and the (possibly dotted) `_source` fields of a hit.
+    """
+    return _iter_csv_chunks(iter_pit_pages(search, **kwargs), fields, header)
+
+
+async def async_iter_ndjson(
+    search: AsyncSearch, fields: Optional[Sequence[str]] = None, **kwargs: Any
+) -> AsyncIterator[bytes]:
+    """Like iter_ndjson(), but for an AsyncSearch (see async_iter_pit_pages for kwargs)."""
+    async for response in async_iter_pit_pages(search, **kwargs):
+        yield _get_ndjson_chunk(response, fields)
+
+
+async def async_iter_csv(
+    search: AsyncSearch,
+    fields: Sequence[str],
+    header: bool = True,
+    **kwargs: Any,
+) -> AsyncIterator[bytes]:
+    """Like iter_csv(), but for an AsyncSearch (see async_iter_pit_pages for kwargs)."""
+    if header:
+        yield _get_csv_header(fields)
+    async for response in async_iter_pit_pages(search, **kwargs):
+        yield _get_csv_chunk(response, fields)
+
+
+def streaming_search_response(
+    search: Search,
+    format: str,
+    fields: Optional[Sequence[str]] = None,
+    filename: Optional[str] = None,
+    **kwargs: Any,
+) -> StreamingHttpResponse:
+    """Return a response streaming all the hits of the search as NDJSON or CSV.
+
+    Under ASGI, the response is buffered: use async_streaming_search_response() in async views instead.
+
+    Args:
+        search: The search to export.
+        format: "ndjson" or "csv".
+        fields: The `_source` fields to export. Required for CSV.
+        filename: If set, the response is an attachment with this file name.
+        **kwargs: Passed to iter_pit_pages (e.g., page_size).
+    """
+    search = _get_export_search(search, format, fields)
+    if format == "csv":
+        content = iter_csv(search, fields, **kwargs)  # type: ignore[arg-type]
+    else:
+        content = iter_ndjson(search, fields, **kwargs)
+    return _get_streaming_response(content, format, filename)
+
+
+def async_streaming_search_response(
+    search: AsyncSearch,
+    format: str,
+    fields: Optional[Sequence[str]] = None,
+    filename: Optional[str] = None,
+    **kwargs: Any,
+) -> StreamingHttpResponse:
+    """Like streaming_search_response(), but for an AsyncSearch, streamed without buffering under ASGI."""
+    search = _get_export_search(search, format, fields)
+    _get_pit_index(search, kwargs.get("page_size", 1000))  # validated before the response starts
+    if format == "csv":
+        content = async_iter_csv(search, fields, **kwargs)  # type: ignore[arg-type]
+    else:
+        content = async_iter_ndjson(search, fields, **kwargs)
+    return _get_streaming_response(content, format, filename)
+
+
+def _get_export_search(search: Any, format: str, fields: Optional[Sequence[str]]) -> Any:
+    """Validate the export, and return the search limited to the exported fields."""
+    if format not in _CONTENT_TYPES:
+        raise ValueError(f"Unsupported format={format}. Choose one of: {', '.join(_CONTENT_TYPES)}")
+    if format == "csv" and fields is None:
+        raise ValueError("The fields to export are required for CSV")
+    return search.source(list(fields)) if fields is not None else search
+
+
+def _get_streaming_response(
+    content: Union[Iterator[bytes], AsyncIterator[bytes]], format: str, filename: Optional[str]
+) -> StreamingHttpResponse:
+    response = StreamingHttpResponse(content, content_type=_CONTENT_TYPES[format])
+    if filename is not None:
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+def _iter_ndjson_chunks(pages: Iterator[Dict[str, Any]], fields: Optional[Sequence[str]]) -> Iterator[bytes]:
+    for response in pages:
+        yield _get_ndjson_chunk(response, fields)
+
+
+def _iter_csv_chunks(pages: Iterator[Dict[str, Any]], fields: Sequence[str], header: bool) -> Iterator[bytes]:
+    if header:
+        yield _get_csv_header(fields)
+    for response in pages:
+        yield _get_csv_chunk(response, fields)
+
+
+def _get_ndjson_chunk(response: Dict[str, Any], fields: Optional[Sequence[str]]) -> bytes:
+    lines = [json.dumps(row, separators=(",", ":")) for row in hit_dicts(response, fields)]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _get_csv_header(fields: Sequence[str]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(["id", *fields])
+    return buffer.getvalue().encode()
+
+
+def _get_csv_chunk(response: Dict[str, Any], fields: Sequence[str]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(hit_rows(response, fields))
+    return buffer.getvalue().encode()
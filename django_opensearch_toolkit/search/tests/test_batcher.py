@@ -0,0 +1,175 @@
+"""Unit tests for the batcher module."""
+
+import asyncio
+import json
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.http import HttpRequest, HttpResponse
+from opensearchpy.client import OpenSearch
+from opensearchpy.exceptions import ConnectionError, TransportError
+from opensearchpy.helpers.search import Search
+
+from django_opensearch_toolkit.search import (
+    SearchBatcher,
+    enqueue_search,
+    get_search_batcher,
+    search_batching,
+)
+from django_opensearch_toolkit.search.middleware import SearchBatchingMiddleware
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+def _msearch_response(body: List[Dict[str, Any]], **kwargs: Any) -> Dict[str, Any]:
+    """Respond to each search with a hit whose name is the index, or with an error for index 'missing'."""
+    responses: List[Dict[str, Any]] = []
+    for header in body[::2]:
+        index = header["index"][0]
+        if index == "missing":
+            responses.append({"status": 404, "error": {"type": "index_not_found_exception"}})
+        else:
+            responses.append(
+                {"hits": {"total": {"value": 1}, "hits": [{"_id": "1", "_source": {"name": index}}]}}
+            )
+    return {"responses": responses}
+
+
+class SearchBatcherTest(MagicMockOpenSearchTestCase):
+    """Unit tests for SearchBatcher."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.msearch.side_effect = _msearch_response
+
+    def _search(self, index: str) -> Search:
+        return (
+            Search(using=self.unittest_connection, index=index).query("match", name="x").params(routing="r")
+        )
+
+    def test_searches_are_batched(self) -> None:
+        batcher = SearchBatcher(msearch_kwargs={"max_concurrent_searches": 4})
+        merchants = batcher.add(self._search("merchants"))
+        products = batcher.add(self._search("products"))
+        self.assertFalse(merchants.done)
+
+        self.assertEqual(merchants.result()[0].name, "merchants")
+        self.assertTrue(products.done)
+        self.assertEqual(products.result()[0].name, "products")
+
+        self.test_client.msearch.assert_called_once()
+        self.assertEqual(self.test_client.msearch.call_args.kwargs["max_concurrent_searches"], 4)
+        self.assertListEqual(
+            self.test_client.msearch.call_args.kwargs["body"][:2],
+            [{"index": ["merchants"], "routing": "r"}, {"query": {"match": {"name": "x"}}}],
+        )
+        self.assertEqual(batcher.num_requests, 1)
+
+    def test_later_searches_are_sent_in_a_new_batch(self) -> None:
+        batcher = SearchBatcher()
+        first = batcher.add(self._search("merchants"))
+        first.result()
+        second = batcher.add(self._search("products"))
+        second.result()
+        first.result()  # not sent again
+        self.assertEqual(self.test_client.msearch.call_count, 2)
+
+    def test_errors_are_dispatched(self) -> None:
+        batcher = SearchBatcher()
+        missing = batcher.add(self._search("missing"))
+        merchants = batcher.add(self._search("merchants"))
+        batcher.flush()
+
+        with self.assertRaises(TransportError) as cm:
+            missing.result()
+        self.assertEqual(cm.exception.status_code, 404)
+        self.assertEqual(cm.exception.error, "index_not_found_exception")
+        self.assertEqual(merchants.result()[0].name, "merchants")
+
+    def test_failed_request(self) -> None:
+        self.test_client.msearch.side_effect = ConnectionError("N/A", "Simulate connection error", None)
+        batcher = SearchBatcher()
+        batched = [batcher.add(self._search(index)) for index in ["merchants", "products"]]
+        batcher.flush()
+        for b in batched:
+            with self.assertRaises(ConnectionError):
+                b.result()
+
+    def test_async_result(self) -> None:
+        async_client = MagicMock()
+        async_client.msearch = AsyncMock(side_effect=_msearch_response)
+        batcher = SearchBatcher()
+
+        async def _run() -> List[str]:
+            batched = [batcher.add(self._search(index)) for index in ["merchants", "products"]]
+            responses = await asyncio.gather(*[b.async_result() for b in batched])
+            return [r[0].name for r in responses]
+
+        with patch(
+            "django_opensearch_toolkit.search.batcher.get_async_connection", return_value=async_client
+        ):
+            self.assertListEqual(asyncio.run(_run()), ["merchants", "products"])
+        async_client.msearch.assert_awaited_once()
+
+    def test_async_result_with_client_objects(self) -> None:
+        async_client = MagicMock()
+        async_client.msearch = AsyncMock(side_effect=_msearch_response)
+        batcher = SearchBatcher()
+
+        async def _run() -> None:
+            async_batched = batcher.add(Search(using=async_client, index="merchants"))
+            sync_batched = batcher.add(Search(using=OpenSearch(), index="merchants"))
+            self.assertEqual((await async_batched.async_result())[0].name, "merchants")
+            with self.assertRaises(TypeError):
+                await sync_batched.async_result()
+
+        asyncio.run(_run())
+        async_client.msearch.assert_awaited_once()
+
+    def test_missing_responses(self) -> None:
+        self.test_client.msearch.side_effect = lambda body, **kwargs: {
+            "responses": _msearch_response(body)["responses"][:1]
+        }
+        batcher = SearchBatcher()
+        merchants = batcher.add(self._search("merchants"))
+        products = batcher.add(self._search("products"))
+        with self.assertLogs("django_opensearch_toolkit.search.batcher", "WARNING"):
+            batcher.flush()
+
+        self.assertEqual(merchants.result()[0].name, "merchants")
+        with self.assertRaises(TransportError) as cm:
+            products.result()
+        self.assertEqual(cm.exception.error, "missing_response")
+
+    def test_search_batching(self) -> None:
+        self.assertIsNone(get_search_batcher())
+        with search_batching() as batcher:
+            self.assertIs(get_search_batcher(), batcher)
+            batched = [enqueue_search(self._search(index)) for index in ["merchants", "products"]]
+            self.assertEqual([b.result()[0].name for b in batched], ["merchants", "products"])
+        self.assertIsNone(get_search_batcher())
+        self.test_client.msearch.assert_called_once()
+
+    def test_enqueue_search_without_batcher(self) -> None:
+        batched = [enqueue_search(self._search(index)) for index in ["merchants", "products"]]
+        self.assertEqual([b.result()[0].name for b in batched], ["merchants", "products"])
+        self.assertEqual(self.test_client.msearch.call_count, 2)
+
+
+class SearchBatchingMiddlewareTest(MagicMockOpenSearchTestCase):
+    """Unit tests for SearchBatchingMiddleware."""
+
+    def _view(self, request: HttpRequest) -> HttpResponse:
+        return HttpResponse(json.dumps(get_search_batcher() is not None))
+
+    def test_sync(self) -> None:
+        middleware = SearchBatchingMiddleware(self._view)
+        self.assertEqual(middleware(HttpRequest()).content, b"true")
+        self.assertIsNone(get_search_batcher())
+
+    def test_async(self) -> None:
+        async def _async_view(request: HttpRequest) -> HttpResponse:
+            return self._view(request)
+
+        middleware = SearchBatchingMiddleware(_async_view)
+        self.assertEqual(asyncio.run(middleware(HttpRequest())).content, b"true")
@@ -0,0 +1,203 @@
+"""Unit tests for the search result cache."""
+
+import threading
+from typing import Any, Dict
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import override_settings
+from opensearchpy.helpers.search import Search
+
+from django_opensearch_toolkit.search import cache as cache_module
+from django_opensearch_toolkit.search import cached_execute, cached_execute_raw, invalidate_index
+from django_opensearch_toolkit.signals import index_written
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "search_test": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "search_test"},
+}
+
+
+def _response(name: str, **extra: Any) -> Dict[str, Any]:
+    return {
+        "took": 1,
+        "timed_out": False,
+        "_shards": {"total": 1, "successful": 1, "failed": 0},
+        "hits": {
+            "total": {"value": 1},
+            "hits": [{"_index": "merchants", "_id": "1", "_source": {"name": name}}],
+        },
+        **extra,
+    }
+
+
+_OPTIONS = {"cache": "search_test", "timeout": 60, "refresh_interval": 0}
+
+
+@override_settings(CACHES=_CACHES, OPENSEARCH_SEARCH_CACHE=_OPTIONS)
+class SearchCacheTest(MagicMockOpenSearchTestCase):
+    """Unit tests for the search result cache."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        caches["search_test"].clear()
+        self.addCleanup(self._discard_pending_bumps)
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.search.return_value = _response("Merchant 1")
+
+    @staticmethod
+    def _discard_pending_bumps() -> None:
+        """Forget the bumps left pending by the mocked timers of a test (no timer thread waits on them)."""
+        with cache_module._pending_bumps_lock:
+            for target in [t for t in cache_module._pending_bumps if t[0] == "search_test"]:
+                del cache_module._pending_bumps[target]
+
+    def _search(self, index: Any = "merchants") -> Search:
+        return Search(using=self.unittest_connection, index=index).query("match_all").sort("name")
+
+    def test_response_is_cached(self) -> None:
+        self.assertEqual(cached_execute(self._search())[0].name, "Merchant 1")
+        self.test_client.search.return_value = _response("Merchant 2")
+
+        response = cached_execute(self._search())
+        self.assertEqual(response[0].name, "Merchant 1")
+        self.assertEqual(response.hits.total.value, 1)
+        self.test_client.search.assert_called_once()
+
+    def test_raw_response_is_cached(self) -> None:
+        self.assertEqual(cached_execute(self._search())[0].name, "Merchant 1")
+        self.assertDictEqual(cached_execute_raw(self._search()), _response("Merchant 1"))
+        self.test_client.search.assert_called_once()
+
+    def test_different_searches(self) -> None:
+        cached_execute(self._search())
+        cached_execute(self._search().extra(size=5))
+        cached_execute(self._search(index="products"))
+        self.assertEqual(self.test_client.search.call_count, 3)
+
+    def test_write_invalidates_index(self) -> None:
+        cached_execute(self._search())
+        cached_execute(self._search(index="products"))
+        self.test_client.search.return_value = _response("Merchant 2")
+
+        index_written.send(sender=self.__class__, connection_name=self.unittest_connection, index="merchants")
+        self.assertEqual(cached_execute(self._search())[0].name, "Merchant 2")
+        cached_execute(self._search(index="products"))  # still cached
+        self.assertEqual(self.test_client.search.call_count, 3)
+
+    @override_settings(OPENSEARCH_SEARCH_CACHE={**_OPTIONS, "refresh_interval": 1})
+    def test_write_invalidates_index_again_after_refresh(self) -> None:
+        with patch("django_opensearch_toolkit.search.cache.time.monotonic", return_value=100.0):
+            with patch("django_opensearch_toolkit.search.cache.threading.Timer") as timer_cls:
+                invalidate_index(self.unittest_connection, "merchants")
+        timer_cls.assert_called_once()
+        self.assertEqual(timer_cls.call_args.args[0], 1)
+        timer_cls.return_value.start.assert_called_once()
+
+        # The write isn't visible yet, so the old results are cached again
+        self.assertEqual(cached_execute(self._search())[0].name, "Merchant 1")
+        self.test_client.search.return_value = _response("Merchant 2")
+        self.assertEqual(cached_execute(self._search())[0].name, "Merchant 1")
+
+        # ... until the refresh interval has passed
+        with patch("django_opensearch_toolkit.search.cache.time.monotonic", return_value=101.0):
+            timer_cls.call_args.args[1](*timer_cls.call_args.kwargs["args"])
+        self.assertEqual(cached_execute(self._search())[0].name, "Merchant 2")
+
+    @override_settings(OPENSEARCH_SEARCH_CACHE={**_OPTIONS, "refresh_interval": 1})
+    def test_single_pending_bump_per_index(self) -> None:
+        """Test that writes while a bump is pending postpone it, instead of starting more timers."""
+        with patch("django_opensearch_toolkit.search.cache.threading.Timer") as timer_cls:
+            with patch("django_opensearch_toolkit.search.cache.time.monotonic", return_value=100.0):
+                invalidate_index(self.unittest_connection, "merchants")
+            with patch("django_opensearch_toolkit.search.cache.time.monotonic", return_value=100.5):
+                for _ in range(10):
+                    invalidate_index(self.unittest_connection, "merchants")
+            invalidate_index(self.unittest_connection, "products")
+            self.assertEqual(timer_cls.call_count, 2)
+            callback, args = timer_cls.call_args_list[0].args[1], timer_cls.call_args_list[0].kwargs["args"]
+
+            # The first timer fires before the postponed deadline, so it waits for the rest
+            with patch("django_opensearch_toolkit.search.cache.time.monotonic", return_value=101.0):
+                with patch("django_opensearch_toolkit.search.cache._bump_versions") as bump_versions:
+                    callback(*args)
+            bump_versions.assert_not_called()
+            self.assertEqual(timer_cls.call_count, 3)
+            self.assertAlmostEqual(timer_cls.call_args.args[0], 0.5)
+
+            with patch("django_opensearch_toolkit.search.cache.time.monotonic", return_value=101.5):
+                with patch("django_opensearch_toolkit.search.cache._bump_versions") as bump_versions:
+                    callback(*args)
+            bump_versions.assert_called_once_with(
+                caches["search_test"], self.unittest_connection, "merchants"
+            )
+
+            # Once it has fired, the next write starts a new timer
+            invalidate_index(self.unittest_connection, "merchants")
+            self.assertEqual(timer_cls.call_count, 4)
+
+    @override_settings(OPENSEARCH_SEARCH_CACHE={**_OPTIONS, "refresh_interval": 1})
+    def test_bump_without_pending_deadline(self) -> None:
+        """Test that a timer whose pending bump was already discarded does nothing."""
+        with patch("django_opensearch_toolkit.search.cache.threading.Timer") as timer_cls:
+            invalidate_index(self.unittest_connection, "merchants")
+            self._discard_pending_bumps()
+            with patch("django_opensearch_toolkit.search.cache._bump_versions") as bump_versions:
+                timer_cls.call_args.args[1](*timer_cls.call_args.kwargs["args"])
+        bump_versions.assert_not_called()
+        timer_cls.assert_called_once()
+
+    def test_searches_are_not_coalesced_across_writes(self) -> None:
+        """Test that a search that started before a write isn't shared with searches after it."""
+        started, release = threading.Event(), threading.Event()
+
+        def _search(**kwargs: Any) -> Dict[str, Any]:
+            if not started.is_set():
+                started.set()
+                release.wait(timeout=5)
+                return _response("Merchant 1")
+            return _response("Merchant 2")
+
+        self.test_client.search.side_effect = _search
+        thread = threading.Thread(target=cached_execute, args=(self._search(),))
+        thread.start()
+        started.wait(timeout=5)
+        invalidate_index(self.unittest_connection, "merchants")
+        self.assertEqual(cached_execute(self._search())[0].name, "Merchant 2")
+        release.set()
+        thread.join()
+        self.assertEqual(self.test_client.search.call_count, 2)
+
+    def test_write_invalidates_searches_over_all_indices(self) -> None:
+        for index in [None, "merch*"]:
+            cached_execute(self._search(index=index))
+            invalidate_index(self.unittest_connection, "products")
+            cached_execute(self._search(index=index))
+        self.assertEqual(self.test_client.search.call_count, 4)
+
+    def test_write_to_other_cluster(self) -> None:
+        cached_execute(self._search())
+        invalidate_index("other_cluster", "merchants")
+        cached_execute(self._search())
+        self.test_client.search.assert_called_once()
+
+    def test_evicted_version(self) -> None:
+        """Test that responses cached before a version was evicted are not served again."""
+        cached_execute(self._search())
+        caches["search_test"].delete("django_opensearch_toolkit:search:version:unittest:merchants")
+        cached_execute(self._search())
+        self.assertEqual(self.test_client.search.call_count, 2)
+
+    def test_partial_response_is_not_cached(self) -> None:
+        self.test_client.search.return_value = _response("Merchant 1", timed_out=True)
+        cached_execute(self._search())
+        cached_execute(self._search())
+        self.assertEqual(self.test_client.search.call_count, 2)
+
+    @override_settings(OPENSEARCH_SEARCH_CACHE=None)
+    def test_disabled(self) -> None:
+        cached_execute(self._search())
+        cached_execute(self._search())
+        self.assertEqual(self.test_client.search.call_count, 2)
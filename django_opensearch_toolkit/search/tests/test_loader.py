@@ -0,0 +1,152 @@
+"""Unit tests for the loader module."""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.http import HttpRequest, HttpResponse
+from opensearchpy.exceptions import ConnectionError, TransportError
+from opensearchpy.helpers.document import Document
+from opensearchpy.helpers.field import Keyword
+
+from django_opensearch_toolkit.search import DocumentLoader, document_loading, get_document_loader
+from django_opensearch_toolkit.search.middleware import SearchBatchingMiddleware
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+class _Merchant(Document):
+    name = Keyword()
+
+    class Index:
+        using = "unittest"
+        name = "merchants"
+
+
+def _mget_response(index: str, body: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+    """Find the ids starting with 'm', fail the id 'error', and miss the others."""
+    docs: List[Dict[str, Any]] = []
+    for id in body["ids"]:
+        if id == "error":
+            docs.append({"_index": index, "_id": id, "error": {"type": "shard_not_available_exception"}})
+        elif id.startswith("m"):
+            docs.append({"_index": index, "_id": id, "found": True, "_source": {"name": f"name-{id}"}})
+        else:
+            docs.append({"_index": index, "_id": id, "found": False})
+    return {"docs": docs}
+
+
+class DocumentLoaderTest(MagicMockOpenSearchTestCase):
+    """Unit tests for DocumentLoader."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.mget.side_effect = _mget_response
+
+    def test_ids_are_fetched_together(self) -> None:
+        loader = DocumentLoader(_Merchant)
+        first = loader.add("m1")
+        others = [loader.add(id) for id in ["m2", "x", "m1"]]
+        self.assertFalse(first.done)
+
+        merchant = first.result()
+        assert merchant is not None
+        self.assertEqual(merchant.name, "name-m1")
+        self.assertEqual(merchant.meta.id, "m1")
+        self.assertTrue(all(d.done for d in others))
+        self.assertIsNone(others[1].result())
+        self.assertIs(others[2].result(), merchant)  # the same instance for the same id
+
+        self.test_client.mget.assert_called_once_with(index="merchants", body={"ids": ["m1", "m2", "x"]})
+        self.assertEqual(loader.num_requests, 1)
+
+    def test_identity_map(self) -> None:
+        loader = DocumentLoader(_Merchant)
+        merchants = loader.load_many(["m1", 2])
+        self.assertIsNone(merchants[1])
+        self.assertIs(loader.load("m1"), merchants[0])
+        self.assertIsNone(loader.load(2))  # misses are remembered too
+        self.test_client.mget.assert_called_once()
+
+        loader.clear("m1")
+        self.assertIsNot(loader.load("m1"), merchants[0])
+        self.assertEqual(self.test_client.mget.call_count, 2)
+
+    def test_prime(self) -> None:
+        loader = DocumentLoader(_Merchant)
+        merchant = _Merchant(name="primed", meta={"id": "m1"})
+        loader.prime(merchant)
+        self.assertIs(loader.load("m1"), merchant)
+        self.test_client.mget.assert_not_called()
+
+    def test_max_batch_size(self) -> None:
+        loader = DocumentLoader(_Merchant, max_batch_size=2)
+        self.assertEqual(len(loader.load_many(["m1", "m2", "m3"])), 3)
+        self.assertListEqual(
+            [c.kwargs["body"]["ids"] for c in self.test_client.mget.call_args_list], [["m1", "m2"], ["m3"]]
+        )
+        with self.assertRaises(ValueError):
+            DocumentLoader(_Merchant, max_batch_size=0)
+
+    def test_errors_are_dispatched(self) -> None:
+        loader = DocumentLoader(_Merchant)
+        failed = loader.add("error")
+        found = loader.add("m1")
+        loader.flush()
+        with self.assertRaises(TransportError) as cm:
+            failed.result()
+        self.assertEqual(cm.exception.error, "shard_not_available_exception")
+        self.assertIsNotNone(found.result())
+
+    def test_failed_request_is_retried(self) -> None:
+        self.test_client.mget.side_effect = ConnectionError("N/A", "Simulate connection error", None)
+        loader = DocumentLoader(_Merchant)
+        with self.assertRaises(ConnectionError):
+            loader.load("m1")
+
+        self.test_client.mget.side_effect = _mget_response
+        self.assertIsNotNone(loader.load("m1"))
+        self.assertEqual(self.test_client.mget.call_count, 2)
+
+    def test_async_loads_in_the_same_tick_are_fetched_together(self) -> None:
+        async_client = MagicMock()
+        async_client.mget = AsyncMock(side_effect=_mget_response)
+        loader = DocumentLoader(_Merchant)
+
+        async def _run() -> List[Optional[_Merchant]]:
+            return await asyncio.gather(*[loader.async_load(id) for id in ["m1", "m2", "x", "m1"]])
+
+        with patch("django_opensearch_toolkit.search.loader.get_async_connection", return_value=async_client):
+            merchants = asyncio.run(_run())
+            self.assertIs(asyncio.run(loader.async_load("m2")), merchants[1])
+            self.assertEqual(len(asyncio.run(loader.async_load_many(["m1", "m3"]))), 2)
+
+        self.assertIsNone(merchants[2])
+        self.assertIs(merchants[0], merchants[3])
+        self.assertListEqual(
+            [c.kwargs["body"]["ids"] for c in async_client.mget.await_args_list], [["m1", "m2", "x"], ["m3"]]
+        )
+
+    def test_document_loading(self) -> None:
+        with document_loading():
+            loader = get_document_loader(_Merchant)
+            self.assertIs(get_document_loader(_Merchant), loader)
+            self.assertIsNot(get_document_loader(_Merchant, index="merchants_v2"), loader)
+        self.assertIsNot(get_document_loader(_Merchant), get_document_loader(_Merchant))
+
+
+class SearchBatchingMiddlewareLoaderTest(MagicMockOpenSearchTestCase):
+    """Unit tests for the document loaders of SearchBatchingMiddleware."""
+
+    def test_loaders_are_shared_within_a_request(self) -> None:
+        loaders: List[DocumentLoader[_Merchant]] = []
+
+        def _view(request: HttpRequest) -> HttpResponse:
+            loaders.extend([get_document_loader(_Merchant), get_document_loader(_Merchant)])
+            return HttpResponse()
+
+        middleware = SearchBatchingMiddleware(_view)
+        middleware(HttpRequest())
+        middleware(HttpRequest())
+        self.assertIs(loaders[0], loaders[1])
+        self.assertIsNot(loaders[1], loaders[2])  # each request has its own identity map
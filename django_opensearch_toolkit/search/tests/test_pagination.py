@@ -0,0 +1,138 @@
+"""Unit tests for the pagination module."""
+
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+from django.core import signing
+from opensearchpy.helpers.search import Search
+
+from django_opensearch_toolkit.search import CursorPaginator
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+_NUM_HITS = 7
+
+
+def _search_response(body: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+    """Return the hits after search_after, with their ids as the sort values, and a new PIT id if any."""
+    start = body["search_after"][1] + 1 if "search_after" in body else 0
+    hits = [
+        {"_id": str(i), "_source": {"name": f"n{i}"}, "sort": [f"n{i}", i]}
+        for i in range(start, min(start + body["size"], _NUM_HITS))
+    ]
+    response: Dict[str, Any] = {"took": 1, "hits": {"total": {"value": _NUM_HITS}, "hits": hits}}
+    if "pit" in body:
+        response["pit_id"] = f"pit-{start}"
+    return response
+
+
+class CursorPaginatorTest(MagicMockOpenSearchTestCase):
+    """Unit tests for CursorPaginator."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.search.side_effect = _search_response
+        self.test_client.create_pit.return_value = {"pit_id": "pit-created"}
+
+    def _search(self) -> Search:
+        return Search(using=self.unittest_connection, index="merchants").query("match_all").sort("name")
+
+    def _walk(self, paginator: CursorPaginator) -> List[List[str]]:
+        """Return the ids of the hits of every page."""
+        pages: List[List[str]] = []
+        cursor: Optional[str] = None
+        while True:
+            page = paginator.get_page(cursor)
+            pages.append([hit["_id"] for hit in page.hits])
+            if not page.has_next:
+                return pages
+            cursor = page.next_cursor
+
+    def test_pages(self) -> None:
+        paginator = CursorPaginator(self._search().extra(from_=100, size=50), page_size=3, tiebreaker="id")
+        self.assertListEqual(self._walk(paginator), [["0", "1", "2"], ["3", "4", "5"], ["6"]])
+
+        bodies = [c.kwargs["body"] for c in self.test_client.search.call_args_list]
+        self.assertDictEqual(
+            bodies[0], {"query": {"match_all": {}}, "sort": ["name", "id"], "size": 4}  # from is dropped
+        )
+        self.assertListEqual([b.get("search_after") for b in bodies], [None, ["n2", 2], ["n5", 5]])
+        self.assertEqual(self.test_client.search.call_args.kwargs["index"], ["merchants"])
+
+    def test_last_page_is_full(self) -> None:
+        paginator = CursorPaginator(self._search(), page_size=_NUM_HITS, tiebreaker="id")
+        self.assertListEqual(self._walk(paginator), [[str(i) for i in range(_NUM_HITS)]])
+        self.test_client.search.assert_called_once()
+
+    def test_tiebreaker_already_sorted(self) -> None:
+        paginator = CursorPaginator(self._search().sort("name", "-id"), page_size=3, tiebreaker="id")
+        paginator.get_page()
+        self.assertListEqual(
+            self.test_client.search.call_args.kwargs["body"]["sort"], ["name", {"id": {"order": "desc"}}]
+        )
+
+    def test_execute(self) -> None:
+        executed: List[Search] = []
+
+        def _execute(search: Search) -> Dict[str, Any]:
+            executed.append(search)
+            return _search_response(search.to_dict())
+
+        page = CursorPaginator(self._search(), page_size=3, tiebreaker="id", execute=_execute).get_page()
+        self.assertEqual(len(page.hits), 3)
+        self.assertEqual(len(executed), 1)
+        self.test_client.search.assert_not_called()
+
+    def test_invalid_cursors(self) -> None:
+        paginator = CursorPaginator(self._search(), page_size=3, tiebreaker="id")
+        cursor = paginator.get_page().next_cursor
+        assert cursor is not None
+
+        for invalid_cursor in ["forged", cursor[:-1], signing.dumps({"a": [1]})]:
+            with self.assertRaises(ValueError):
+                paginator.get_page(invalid_cursor)
+        with self.assertRaises(ValueError):  # made for another search
+            CursorPaginator(self._search().filter("term", name="x"), page_size=3, tiebreaker="id").get_page(
+                cursor
+            )
+        with self.assertRaises(ValueError):  # made without a PIT
+            CursorPaginator(self._search(), page_size=3, pit_keep_alive="1m").get_page(cursor)
+
+    def test_expired_cursor(self) -> None:
+        paginator = CursorPaginator(self._search(), page_size=3, tiebreaker="id", max_age=60)
+        with patch("django.core.signing.time.time", return_value=1_000_000):
+            cursor = paginator.get_page().next_cursor
+        assert cursor is not None
+        with patch("django.core.signing.time.time", return_value=1_000_030):
+            paginator.get_page(cursor)
+        with patch("django.core.signing.time.time", return_value=1_000_100):
+            with self.assertRaises(ValueError):
+                paginator.get_page(cursor)
+
+    def test_point_in_time(self) -> None:
+        paginator = CursorPaginator(self._search(), page_size=3, pit_keep_alive="5m")
+        self.assertListEqual(self._walk(paginator), [["0", "1", "2"], ["3", "4", "5"], ["6"]])
+
+        self.test_client.create_pit.assert_called_once_with(index="merchants", keep_alive="5m")
+        calls = self.test_client.search.call_args_list
+        self.assertIsNone(calls[0].kwargs["index"])  # a PIT search doesn't name the indices
+        self.assertListEqual(calls[0].kwargs["body"]["sort"], ["name", "_shard_doc"])
+        self.assertListEqual(  # each page uses the latest PIT id
+            [c.kwargs["body"]["pit"] for c in calls],
+            [{"id": pit_id, "keep_alive": "5m"} for pit_id in ["pit-created", "pit-0", "pit-3"]],
+        )
+        self.test_client.delete_pit.assert_not_called()  # it expires, so the last page can be retried
+
+    def test_point_in_time_deleted(self) -> None:
+        paginator = CursorPaginator(self._search(), page_size=3, pit_keep_alive="5m", delete_pit=True)
+        self._walk(paginator)
+        self.test_client.delete_pit.assert_called_once_with(body={"pit_id": ["pit-6"]})
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            CursorPaginator(self._search(), page_size=0, tiebreaker="id")
+        with self.assertRaises(ValueError):  # a tiebreaker is required without a PIT
+            CursorPaginator(self._search(), page_size=3)
+        with self.assertRaises(ValueError):
+            CursorPaginator(Search(using=self.unittest_connection), page_size=3, pit_keep_alive="1m")
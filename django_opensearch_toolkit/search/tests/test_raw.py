@@ -0,0 +1,89 @@
+"""Unit tests for the raw module."""
+
+import asyncio
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock
+
+from opensearchpy.helpers.search import Search
+
+from django_opensearch_toolkit.async_client._compat import AsyncSearch
+from django_opensearch_toolkit.async_client.connections import async_connections
+from django_opensearch_toolkit.search import async_execute_raw, execute_raw, hit_dicts, hit_rows
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+_RESPONSE: Dict[str, Any] = {
+    "took": 1,
+    "hits": {
+        "total": {"value": 2},
+        "hits": [
+            {
+                "_index": "merchants",
+                "_id": "1",
+                "_source": {"name": "n1", "website": "w1", "address": {"city": "c1"}},
+            },
+            {"_index": "merchants", "_id": "2", "_source": {"name": "n2"}},
+        ],
+    },
+}
+
+
+class ExecuteRawTest(MagicMockOpenSearchTestCase):
+    """Unit tests for execute_raw() and async_execute_raw()."""
+
+    def test_execute_raw(self) -> None:
+        test_client = self.get_test_client(self.unittest_connection)
+        test_client.search.return_value = _RESPONSE
+        search = (
+            Search(using=self.unittest_connection, index="merchants").query("match_all").params(routing="r")
+        )
+
+        self.assertIs(execute_raw(search), _RESPONSE)
+        test_client.search.assert_called_once_with(
+            index=["merchants"], body={"query": {"match_all": {}}}, routing="r"
+        )
+
+    def test_async_execute_raw(self) -> None:
+        client = MagicMock()
+        client.search = AsyncMock(return_value=_RESPONSE)
+        search = AsyncSearch(using=client, index="merchants").query("match_all")
+
+        self.assertIs(asyncio.run(async_execute_raw(search)), _RESPONSE)
+        client.search.assert_awaited_once_with(index=["merchants"], body={"query": {"match_all": {}}})
+
+    def test_async_execute_raw_with_connection_name(self) -> None:
+        """Test that connection names are resolved with the toolkit's registry of async clients."""
+        client = MagicMock()
+        client.search = AsyncMock(return_value=_RESPONSE)
+        async_connections.add_connection("async_unittest", client)
+        self.addCleanup(async_connections.remove_connection, "async_unittest")
+        search = AsyncSearch(using="async_unittest", index="merchants").query("match_all")
+
+        self.assertIs(asyncio.run(async_execute_raw(search)), _RESPONSE)
+        client.search.assert_awaited_once()
+
+
+class HitRowsTest(MagicMockOpenSearchTestCase):
+    """Unit tests for hit_dicts() and hit_rows()."""
+
+    def test_hit_dicts(self) -> None:
+        self.assertListEqual(
+            hit_dicts(_RESPONSE, ["name", "website", "address.city"]),
+            [
+                {"id": "1", "name": "n1", "website": "w1", "address.city": "c1"},
+                {"id": "2", "name": "n2", "website": None, "address.city": None},
+            ],
+        )
+
+    def test_hit_dicts_whole_source(self) -> None:
+        self.assertListEqual(
+            hit_dicts(_RESPONSE, id_key=None),
+            [{"name": "n1", "website": "w1", "address": {"city": "c1"}}, {"name": "n2"}],
+        )
+        self.assertListEqual(hit_dicts({"hits": {"hits": []}}), [])
+
+    def test_hit_rows(self) -> None:
+        rows = hit_rows(_RESPONSE, ["name", "address.city"])
+        self.assertListEqual(rows, [("1", "n1", "c1"), ("2", "n2", None)])
+        self.assertEqual(rows[0].name, "n1")  # type: ignore[attr-defined]
+        self.assertIs(type(rows[0]), type(hit_rows(_RESPONSE, ["name", "address.city"])[0]))
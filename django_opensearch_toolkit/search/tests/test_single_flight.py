@@ -0,0 +1,144 @@
+"""Unit tests for the single_flight module."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+from django.test import TestCase
+from opensearchpy.helpers.search import Search
+
+from django_opensearch_toolkit.async_client._compat import AsyncSearch
+from django_opensearch_toolkit.search import (
+    SingleFlight,
+    async_coalesced_execute,
+    coalesced_execute,
+    search_flight,
+)
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+_RESPONSE: Dict[str, Any] = {
+    "hits": {"total": {"value": 1}, "hits": [{"_id": "1", "_source": {"name": "n1"}}]}
+}
+
+
+def _num_calls(flight: SingleFlight) -> int:
+    stats = flight.stats()
+    return stats.executions + stats.coalesced
+
+
+class SingleFlightTest(TestCase):
+    """Unit tests for SingleFlight."""
+
+    databases = set()
+
+    def setUp(self) -> None:
+        self.flight = SingleFlight()
+
+    def _do_concurrently(self, keys: List[str], fn: Any, release: threading.Event) -> List[Any]:
+        """Call flight.do() for each key on its own thread, releasing fn once all callers are waiting."""
+        with ThreadPoolExecutor(max_workers=len(keys)) as pool:
+            futures = [pool.submit(self.flight.do, key, fn) for key in keys]
+            while _num_calls(self.flight) < len(keys):
+                threading.Event().wait(0.001)
+            release.set()
+            return [f.exception() or f.result() for f in futures]
+
+    def test_do(self) -> None:
+        release = threading.Event()
+        fn = MagicMock(side_effect=lambda: release.wait() and "result")
+        results = self._do_concurrently(["a"] * 10, fn, release)
+
+        self.assertListEqual(results, ["result"] * 10)
+        fn.assert_called_once()
+        stats = self.flight.stats()
+        self.assertEqual((stats.executions, stats.coalesced), (1, 9))
+        self.assertAlmostEqual(stats.coalesced_ratio, 0.9)
+
+        self.assertEqual(self.flight.do("a", lambda: "next"), "next")  # results are not kept
+
+    def test_do_different_keys(self) -> None:
+        release = threading.Event()
+        fn = MagicMock(side_effect=lambda: release.wait())
+        self._do_concurrently(["a", "b", "a"], fn, release)
+        self.assertEqual(fn.call_count, 2)
+
+    def test_do_shares_exceptions(self) -> None:
+        release = threading.Event()
+
+        def _fail() -> None:
+            release.wait()
+            raise ValueError("Simulate failure")
+
+        results = self._do_concurrently(["a"] * 3, _fail, release)
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+
+    def test_do_async(self) -> None:
+        fn = AsyncMock(return_value="result")
+
+        async def _run() -> List[Any]:
+            return await asyncio.gather(*[self.flight.do_async("a", fn) for _ in range(10)])
+
+        self.assertListEqual(asyncio.run(_run()), ["result"] * 10)
+        fn.assert_awaited_once()
+        self.assertEqual(self.flight.stats().coalesced, 9)
+
+    def test_do_async_cancelled_caller(self) -> None:
+        """Test that cancelling the leader doesn't cancel the call for the other callers."""
+
+        async def _run() -> Any:
+            release = asyncio.Event()
+
+            async def _fn() -> str:
+                await release.wait()
+                return "result"
+
+            leader = asyncio.ensure_future(self.flight.do_async("a", _fn))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(self.flight.do_async("a", _fn))
+            await asyncio.sleep(0)
+            leader.cancel()
+            release.set()
+            return await follower
+
+        self.assertEqual(asyncio.run(_run()), "result")
+
+
+class CoalescedExecuteTest(MagicMockOpenSearchTestCase):
+    """Unit tests for coalesced_execute() and async_coalesced_execute()."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+
+    def test_coalesced_execute(self) -> None:
+        release = threading.Event()
+        self.test_client.search.side_effect = lambda **kwargs: release.wait() and _RESPONSE
+
+        search = Search(using=self.unittest_connection, index="merchants").query("match_all")
+        num_calls = _num_calls(search_flight)
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            futures = [pool.submit(coalesced_execute, search) for _ in range(5)]
+            while _num_calls(search_flight) < num_calls + 5:
+                threading.Event().wait(0.001)
+            release.set()
+            responses = [f.result() for f in futures]
+
+        self.test_client.search.assert_called_once()
+        for response in responses:
+            self.assertEqual(response[0].name, "n1")
+        self.assertEqual(len({id(r) for r in responses}), 5)  # each caller gets its own Response
+
+    def test_async_coalesced_execute(self) -> None:
+        client = MagicMock()
+        client.search = AsyncMock(return_value=_RESPONSE)
+
+        async def _run() -> List[Any]:
+            search = AsyncSearch(using=client, index="merchants").query("match_all")
+            return await asyncio.gather(*[async_coalesced_execute(search) for _ in range(5)])
+
+        responses = asyncio.run(_run())
+        client.search.assert_awaited_once()
+        self.assertListEqual([r[0].name for r in responses], ["n1"] * 5)
@@ -0,0 +1,176 @@
+"""Unit tests for the streaming module."""
+
+import asyncio
+import json
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+from opensearchpy.exceptions import ConnectionError
+from opensearchpy.helpers.search import Search
+
+from django_opensearch_toolkit.async_client._compat import AsyncSearch
+from django_opensearch_toolkit.async_client.connections import async_connections
+from django_opensearch_toolkit.search import (
+    async_iter_pit_pages,
+    async_streaming_search_response,
+    iter_csv,
+    iter_ndjson,
+    iter_pit_pages,
+    streaming_search_response,
+)
+from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
+
+
+_NAMES = ["a", "b", "c", "d", "e"]
+
+
+class StreamingTest(MagicMockOpenSearchTestCase):
+    """Unit tests for iter_pit_pages() and the streaming serializers."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_client = self.get_test_client(self.unittest_connection)
+        self.test_client.create_pit.return_value = {"pit_id": "pit-1"}
+        self.test_client.search.side_effect = self._search_response
+
+    def _search_response(self, body: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        """Return the page of hits after search_after, from the names sorted with ids as the sort values."""
+        start = body["search_after"][1] + 1 if "search_after" in body else 0
+        hits = [
+            {
+                "_id": str(i),
+                "_source": {"name": _NAMES[i], "address": {"city": "x,y"}},
+                "sort": [_NAMES[i], i],
+            }
+            for i in range(start, min(start + body["size"], len(_NAMES)))
+        ]
+        return {"pit_id": f"pit-{start + 2}", "hits": {"hits": hits}}
+
+    def _search(self) -> Search:
+        return Search(using=self.unittest_connection, index="merchants").query("match_all").sort("name")
+
+    def test_iter_pit_pages(self) -> None:
+        pages = list(iter_pit_pages(self._search().extra(size=10, from_=20), page_size=2, keep_alive="30s"))
+        self.assertListEqual(
+            [[h["_id"] for h in p["hits"]["hits"]] for p in pages], [["0", "1"], ["2", "3"], ["4"]]
+        )
+
+        self.test_client.create_pit.assert_called_once_with(index="merchants", keep_alive="30s")
+        bodies = [c.kwargs["body"] for c in self.test_client.search.call_args_list]
+        self.assertDictEqual(
+            bodies[0],
+            {
+                "query": {"match_all": {}},
+                "sort": ["name", "_shard_doc"],
+                "size": 2,
+                "pit": {"id": "pit-1", "keep_alive": "30s"},
+            },
+        )
+        self.assertDictEqual(bodies[1]["pit"], {"id": "pit-2", "keep_alive": "30s"})  # the latest PIT id
+        self.assertListEqual([b.get("search_after") for b in bodies], [None, ["b", 1], ["d", 3]])
+        self.test_client.delete_pit.assert_called_once_with(body={"pit_id": ["pit-6"]})
+
+    def test_iter_pit_pages_last_page_full(self) -> None:
+        self.assertEqual(len(list(iter_pit_pages(self._search(), page_size=5))), 1)
+        self.assertEqual(self.test_client.search.call_count, 2)
+        self.test_client.delete_pit.assert_called_once()
+
+    def test_pit_is_deleted_when_closed(self) -> None:
+        pages = iter_pit_pages(self._search(), page_size=2)
+        next(pages)
+        pages.close()  # e.g., the client disconnected
+        self.test_client.delete_pit.assert_called_once_with(body={"pit_id": ["pit-2"]})
+
+    def test_pit_is_deleted_on_error(self) -> None:
+        self.test_client.search.side_effect = ConnectionError("N/A", "Simulate connection error", None)
+        self.test_client.delete_pit.side_effect = ConnectionError("N/A", "Simulate connection error", None)
+        with self.assertRaises(ConnectionError):
+            list(iter_pit_pages(self._search()))
+        self.test_client.delete_pit.assert_called_once()
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            iter_pit_pages(self._search(), page_size=0)
+        with self.assertRaises(ValueError):
+            iter_pit_pages(Search(using=self.unittest_connection))
+        with self.assertRaises(ValueError):
+            streaming_search_response(self._search(), "xml")
+        with self.assertRaises(ValueError):
+            streaming_search_response(self._search(), "csv")
+        self.test_client.create_pit.assert_not_called()
+
+    def test_iter_ndjson(self) -> None:
+        chunks = list(iter_ndjson(self._search(), ["name"], page_size=3))
+        self.assertEqual(len(chunks), 2)
+        rows = [json.loads(line) for chunk in chunks for line in chunk.decode().splitlines()]
+        self.assertListEqual(rows, [{"id": str(i), "name": name} for i, name in enumerate(_NAMES)])
+
+    def test_iter_csv(self) -> None:
+        chunks = list(iter_csv(self._search(), ["name", "address.city"], page_size=3))
+        self.assertEqual(len(chunks), 3)  # header and 2 pages
+        self.assertListEqual(
+            b"".join(chunks).decode().splitlines(),
+            ["id,name,address.city"] + [f'{i},{name},"x,y"' for i, name in enumerate(_NAMES)],
+        )
+
+    def test_streaming_search_response(self) -> None:
+        response = streaming_search_response(self._search(), "csv", fields=["name"], filename="merchants.csv")
+        self.test_client.create_pit.assert_not_called()  # nothing is read until the response is consumed
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="merchants.csv"')
+
+        content = b"".join(response.streaming_content)  # type: ignore[arg-type]
+        lines: List[str] = content.decode().splitlines()
+        self.assertEqual(len(lines), 1 + len(_NAMES))
+        self.assertEqual(self.test_client.search.call_args.kwargs["body"]["_source"], ["name"])
+        response.close()
+        self.test_client.delete_pit.assert_called_once()
+
+    def _async_search(self) -> AsyncSearch:
+        self.async_os_client = MagicMock()
+        self.async_os_client.create_pit = AsyncMock(return_value={"pit_id": "pit-1"})
+        self.async_os_client.search = AsyncMock(side_effect=self._search_response)
+        self.async_os_client.delete_pit = AsyncMock()
+        return AsyncSearch(using=self.async_os_client, index="merchants").query("match_all").sort("name")
+
+    def test_async_iter_pit_pages(self) -> None:
+        async def _run() -> List[List[str]]:
+            pages = async_iter_pit_pages(self._async_search(), page_size=2, keep_alive="30s")
+            return [[h["_id"] for h in p["hits"]["hits"]] async for p in pages]
+
+        self.assertListEqual(asyncio.run(_run()), [["0", "1"], ["2", "3"], ["4"]])
+        self.async_os_client.create_pit.assert_awaited_once_with(index="merchants", keep_alive="30s")
+        bodies = [c.kwargs["body"] for c in self.async_os_client.search.await_args_list]
+        self.assertListEqual(bodies[0]["sort"], ["name", "_shard_doc"])
+        self.assertListEqual([b.get("search_after") for b in bodies], [None, ["b", 1], ["d", 3]])
+        self.async_os_client.delete_pit.assert_awaited_once_with(body={"pit_id": ["pit-6"]})
+        self.test_client.search.assert_not_called()
+
+    def test_async_iter_pit_pages_with_connection_name(self) -> None:
+        """Test that connection names are resolved with the toolkit's registry of async clients."""
+        async_connections.add_connection("async_unittest", self._async_search()._using)
+        self.addCleanup(async_connections.remove_connection, "async_unittest")
+        search = AsyncSearch(using="async_unittest", index="merchants").query("match_all").sort("name")
+
+        async def _run() -> List[List[str]]:
+            return [
+                [h["_id"] for h in p["hits"]["hits"]] async for p in async_iter_pit_pages(search, page_size=2)
+            ]
+
+        self.assertListEqual(asyncio.run(_run()), [["0", "1"], ["2", "3"], ["4"]])
+        self.async_os_client.create_pit.assert_awaited_once()
+
+    def test_async_streaming_search_response(self) -> None:
+        response = async_streaming_search_response(self._async_search(), "ndjson", fields=["name"])
+        self.assertTrue(response.is_async)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        async def _consume() -> bytes:
+            return b"".join([chunk async for chunk in response.streaming_content])  # type: ignore[union-attr]
+
+        rows = [json.loads(line) for line in asyncio.run(_consume()).decode().splitlines()]
+        self.assertListEqual(rows, [{"id": str(i), "name": name} for i, name in enumerate(_NAMES)])
+        self.async_os_client.delete_pit.assert_awaited_once()
+
+        with self.assertRaises(ValueError):  # validated before the response starts
+            async_streaming_search_response(AsyncSearch(using=self.async_os_client), "ndjson")
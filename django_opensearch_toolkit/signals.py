@@ -0,0 +1,9 @@
+"""Signals sent by django-opensearch-toolkit."""
+
+from django.dispatch import Signal
+
+
+# Sent after the toolkit's write paths (e.g., OpenSearchBulkWriter, async_save, reindexing, alias swaps)
+# change the documents of an index, with the keyword arguments `connection_name` and `index`. The index
+# is named as it was written to (e.g., an alias).
+index_written = Signal()
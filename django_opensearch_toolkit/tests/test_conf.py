@@ -0,0 +1,90 @@
+"""Unit tests for conf.py."""
+
+import json
+
+from django.test import TestCase, override_settings
+
+from django_opensearch_toolkit.conf import (
+    get_cluster_configurations,
+    get_cluster_toolkit_options,
+    get_migration_metrics_hook,
+    get_search_cache_options,
+)
+
+
+class ClusterConfigurationsTest(TestCase):
+    """Unit tests for loading OPENSEARCH_CLUSTERS."""
+
+    databases = set()
+
+    @override_settings(
+        OPENSEARCH_CLUSTERS={
+            "cluster1": {"timeout": 30, "toolkit_options": {"prefill_connections": 4}},
+            "cluster2": {"timeout": 10},
+        }
+    )
+    def test_toolkit_options_are_split(self) -> None:
+        self.assertDictEqual(
+            get_cluster_configurations(),
+            {"cluster1": {"timeout": 30}, "cluster2": {"timeout": 10}},
+        )
+        self.assertDictEqual(
+            get_cluster_toolkit_options(),
+            {"cluster1": {"prefill_connections": 4}, "cluster2": {"prefill_connections": 0}},
+        )
+
+    @override_settings(OPENSEARCH_CLUSTERS={"cluster1": {"toolkit_options": {"unknown": 1}}})
+    def test_unknown_toolkit_option(self) -> None:
+        with self.assertRaises(ValueError):
+            get_cluster_toolkit_options()
+
+    @override_settings(OPENSEARCH_CLUSTERS={"cluster1": {"toolkit_options": {"prefill_connections": -1}}})
+    def test_invalid_prefill_connections(self) -> None:
+        with self.assertRaises(ValueError):
+            get_cluster_toolkit_options()
+
+    @override_settings(OPENSEARCH_CLUSTERS=[])
+    def test_invalid_clusters(self) -> None:
+        with self.assertRaises(ValueError):
+            get_cluster_configurations()
+
+
+class MigrationMetricsHookTest(TestCase):
+    """Unit tests for get_migration_metrics_hook()."""
+
+    databases = set()
+
+    def test_no_hook(self) -> None:
+        self.assertIsNone(get_migration_metrics_hook())
+
+    @override_settings(OPENSEARCH_MIGRATION_METRICS_HOOK="json.dumps")
+    def test_hook(self) -> None:
+        self.assertIs(get_migration_metrics_hook(), json.dumps)
+
+    def test_invalid_hook(self) -> None:
+        for hook in ["no.such.hook", 123]:
+            with override_settings(OPENSEARCH_MIGRATION_METRICS_HOOK=hook):
+                with self.assertRaisesRegex(ValueError, "OPENSEARCH_MIGRATION_METRICS_HOOK"):
+                    get_migration_metrics_hook()
+
+
+class SearchCacheOptionsTest(TestCase):
+    """Unit tests for get_search_cache_options()."""
+
+    databases = set()
+
+    @override_settings(OPENSEARCH_SEARCH_CACHE=None)
+    def test_disabled(self) -> None:
+        self.assertIsNone(get_search_cache_options())
+
+    @override_settings(OPENSEARCH_SEARCH_CACHE={"timeout": 5})
+    def test_defaults(self) -> None:
+        self.assertDictEqual(
+            get_search_cache_options() or {}, {"cache": "default", "timeout": 5, "refresh_interval": 1}
+        )
+
+    def test_invalid_options(self) -> None:
+        for options in [[], {"unknown": 1}, {"cache": 1}, {"timeout": 0}, {"refresh_interval": -1}]:
+            with override_settings(OPENSEARCH_SEARCH_CACHE=options):
+                with self.assertRaisesRegex(ValueError, "OPENSEARCH_SEARCH_CACHE"):
+                    get_search_cache_options()
@@ -0,0 +1,80 @@
+"""Unit tests for LazyOpenSearch."""
+
+from unittest.mock import patch
+
+from django.apps import apps
+from django.test import TestCase, override_settings
+from opensearchpy.client import OpenSearch
+from opensearchpy.connection import connections
+
+from django_opensearch_toolkit.lazy_client import LazyOpenSearch, _reset_all_after_fork
+
+
+class LazyOpenSearchTest(TestCase):
+    """Unit tests for LazyOpenSearch."""
+
+    databases = set()
+
+    def setUp(self) -> None:
+        self.lazy_client = LazyOpenSearch(hosts=[{"host": "localhost", "port": 9200}], timeout=17)
+
+    def test_created_on_first_use(self) -> None:
+        self.assertFalse(self.lazy_client.has_client())
+
+        client = self.lazy_client.get_client()
+        self.assertIsInstance(client, OpenSearch)
+        self.assertTrue(self.lazy_client.has_client())
+        self.assertIs(client, self.lazy_client.get_client())
+        self.assertEqual(client.transport.kwargs["timeout"], 17)
+
+    def test_attributes_are_forwarded(self) -> None:
+        self.assertIs(self.lazy_client.transport, self.lazy_client.get_client().transport)
+
+    def test_rebuilt_in_new_process(self) -> None:
+        client = self.lazy_client.get_client()
+
+        with patch("os.getpid", return_value=-1):
+            self.assertFalse(self.lazy_client.has_client())
+            client_in_child = self.lazy_client.get_client()
+
+        self.assertIsNot(client, client_in_child)
+
+    def test_reset_after_fork(self) -> None:
+        client = self.lazy_client.get_client()
+        _reset_all_after_fork()
+        self.assertFalse(self.lazy_client.has_client())
+        self.assertIsNot(client, self.lazy_client.get_client())
+
+
+class LazyConnectionsSettingTest(TestCase):
+    """Unit tests for the OPENSEARCH_LAZY_CONNECTIONS setting."""
+
+    databases = set()
+
+    def tearDown(self) -> None:
+        apps.get_app_config("django_opensearch_toolkit").ready()  # restore the original connections
+        super().tearDown()
+
+    @override_settings(OPENSEARCH_LAZY_CONNECTIONS=True, OPENSEARCH_CLUSTERS={"cluster1": {"timeout": 17}})
+    def test_lazy_connections(self) -> None:
+        apps.get_app_config("django_opensearch_toolkit").ready()
+        client = connections.get_connection("cluster1")
+        self.assertIsInstance(client, LazyOpenSearch)
+        self.assertFalse(client.has_client())
+
+    @override_settings(OPENSEARCH_LAZY_CONNECTIONS=False, OPENSEARCH_CLUSTERS={"cluster1": {"timeout": 17}})
+    def test_default_connections(self) -> None:
+        apps.get_app_config("django_opensearch_toolkit").ready()
+        self.assertIsInstance(connections.get_connection("cluster1"), OpenSearch)
+
+    def test_lazy_connections_turned_off(self) -> None:
+        with override_settings(OPENSEARCH_LAZY_CONNECTIONS=True, OPENSEARCH_CLUSTERS={"cluster1": {}}):
+            apps.get_app_config("django_opensearch_toolkit").ready()
+        with override_settings(OPENSEARCH_LAZY_CONNECTIONS=False, OPENSEARCH_CLUSTERS={"cluster1": {}}):
+            apps.get_app_config("django_opensearch_toolkit").ready()
+            self.assertIsInstance(connections.get_connection("cluster1"), OpenSearch)
+
+    @override_settings(OPENSEARCH_LAZY_CONNECTIONS="yes")
+    def test_invalid_setting(self) -> None:
+        with self.assertRaises(ValueError):
+            apps.get_app_config("django_opensearch_toolkit").ready()
@@ -0,0 +1,92 @@
+"""Unit tests for warmup.py."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+from typing import Any, Set, Tuple
+from unittest.mock import patch
+
+from django.apps import apps
+from django.test import TestCase, override_settings
+from opensearchpy.client import OpenSearch
+from opensearchpy.connection import connections
+
+from django_opensearch_toolkit.warmup import warm_up_connections
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Minimal HTTP/1.1 handler that answers HEAD requests and records the client sockets."""
+
+    protocol_version = "HTTP/1.1"
+    client_addresses: Set[Tuple[str, int]] = set()
+
+    def do_HEAD(self) -> None:
+        self.client_addresses.add(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class WarmUpConnectionsTest(TestCase):
+    """Unit tests for warm_up_connections()."""
+
+    databases = set()
+
+    def setUp(self) -> None:
+        _KeepAliveHandler.client_addresses = set()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.os_client = OpenSearch(
+            hosts=[{"host": "127.0.0.1", "port": self.server.server_port}],
+            pool_maxsize=3,
+        )
+        connections.add_connection("warmup_unittest", self.os_client)
+
+    def tearDown(self) -> None:
+        connections.remove_connection("warmup_unittest")
+        self.os_client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _clusters(self, prefill_connections: int) -> Any:
+        return {"warmup_unittest": {"toolkit_options": {"prefill_connections": prefill_connections}}}
+
+    def test_prefill_connections(self) -> None:
+        with override_settings(OPENSEARCH_CLUSTERS=self._clusters(3)):
+            warm_up_connections()
+
+        # 3 separate connections were opened, and the ping reused one of them
+        self.assertEqual(len(_KeepAliveHandler.client_addresses), 3)
+        pool = self.os_client.transport.connection_pool.connections[0].pool
+        self.assertEqual(pool.num_connections, 3)
+        self.assertEqual(pool.pool.qsize(), pool.pool.maxsize)
+
+    def test_prefill_connections_limited_by_pool_size(self) -> None:
+        with override_settings(OPENSEARCH_CLUSTERS=self._clusters(5)):
+            with self.assertLogs("django_opensearch_toolkit.warmup", level="WARNING"):
+                warm_up_connections()
+        self.assertEqual(len(_KeepAliveHandler.client_addresses), 3)
+
+    def test_disabled_by_default(self) -> None:
+        with override_settings(OPENSEARCH_CLUSTERS=self._clusters(0)):
+            warm_up_connections()
+        self.assertEqual(len(_KeepAliveHandler.client_addresses), 0)
+
+    def test_failures_are_not_raised(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        with override_settings(OPENSEARCH_CLUSTERS=self._clusters(3)):
+            with self.assertLogs("django_opensearch_toolkit.warmup", level="WARNING"):
+                warm_up_connections()
+
+    def test_not_warmed_up_on_app_initialization(self) -> None:
+        try:
+            with patch("django_opensearch_toolkit.warmup.warm_up_connection") as warm_up_connection:
+                with override_settings(OPENSEARCH_CLUSTERS=self._clusters(3)):
+                    apps.get_app_config("django_opensearch_toolkit").ready()
+        finally:
+            apps.get_app_config("django_opensearch_toolkit").ready()  # restore the original connections
+            connections.add_connection("warmup_unittest", self.os_client)
+        warm_up_connection.assert_not_called()
@@ -0,0 +1,105 @@
+"""Warm up the connection pools of the OpenSearch clients.
+
+Clients open connections lazily, so the first requests served after a deploy
+pay for TCP (and TLS) handshakes to every node. Warming up pre-opens a number
+of keep-alive connections to each node and issues a cheap ping, so the first
+requests reuse established connections.
+
+This is opt-in for each cluster via the `prefill_connections` toolkit option:
+
+    OPENSEARCH_CLUSTERS = {
+        "cluster_name": {
+            "hosts": [...],
+            "toolkit_options": {"prefill_connections": 4},
+        },
+    }
+
+Warming up is never done when the app is initialized, since that also happens in
+the master process of pre-fork servers (whose workers would then share the same
+sockets) and for every management command. Call warm_up_connections() from each
+serving process once it has started, i.e., from a post-fork hook of the server,
+e.g. in a gunicorn config file:
+
+    def post_fork(server, worker):
+        warm_up_connections()
+
+For servers that don't fork, call it at the end of wsgi.py (or asgi.py).
+"""
+
+from logging import getLogger
+from typing import Any, Iterable, Optional
+
+from opensearchpy.connection import connections
+
+from django_opensearch_toolkit.conf import get_cluster_toolkit_options
+
+
+_logger = getLogger(__name__)
+
+# Timeout for each warmup request. Kept short so an unreachable cluster does not stall startup.
+_WARMUP_TIMEOUT_SECONDS = 5
+
+
+def warm_up_connections(cluster_names: Optional[Iterable[str]] = None) -> None:
+    """Warm up the clients of all clusters (or the given ones) that set `prefill_connections`.
+
+    Failures are logged and never raised, since warming up is only an optimization.
+    """
+    toolkit_options = get_cluster_toolkit_options()
+    for c_name in cluster_names if cluster_names is not None else toolkit_options:
+        prefill_connections = toolkit_options[c_name]["prefill_connections"]
+        if prefill_connections > 0:
+            warm_up_connection(c_name, prefill_connections)
+
+
+def warm_up_connection(connection_name: str, prefill_connections: int) -> None:
+    """Open up to `prefill_connections` keep-alive connections to each node of a cluster, then ping it."""
+    try:
+        client = connections.get_connection(connection_name)
+        for node_connection in client.transport.connection_pool.connections:
+            _prefill_node_connection(node_connection, prefill_connections)
+        if not client.ping(request_timeout=_WARMUP_TIMEOUT_SECONDS):
+            _logger.warning(f"[{connection_name}] Cluster did not respond to ping during warmup")
+            return
+    except Exception:
+        _logger.exception(f"[{connection_name}] Failed to warm up connections")
+        return
+    _logger.info(f"[{connection_name}] Warmed up connections")
+
+
+def _prefill_node_connection(node_connection: Any, prefill_connections: int) -> None:
+    """Open keep-alive connections in the urllib3 pool of a single node.
+
+    Each request holds on to its connection until all requests are issued, which
+    forces the pool to open a separate connection for each one. The connections
+    are then released back to the pool, where they are kept alive for reuse.
+    Nodes using a connection class without a urllib3 pool are skipped.
+    """
+    pool = getattr(node_connection, "pool", None)
+    if pool is None or not hasattr(pool, "urlopen"):
+        return
+
+    if prefill_connections > pool.pool.maxsize:
+        _logger.warning(
+            f"Can only prefill {pool.pool.maxsize} connections to {node_connection.host}. "
+            "Increase the `pool_maxsize` of the cluster to keep more connections open."
+        )
+        prefill_connections = pool.pool.maxsize
+
+    responses = []
+    try:
+        for _ in range(prefill_connections):
+            responses.append(
+                pool.urlopen(
+                    "HEAD",
+                    node_connection.url_prefix + "/",
+                    headers=node_connection.headers,
+                    timeout=_WARMUP_TIMEOUT_SECONDS,
+                    retries=False,
+                    preload_content=False,
+                    release_conn=False,
+                )
+            )
+    finally:
+        for response in responses:
+            response.release_conn()
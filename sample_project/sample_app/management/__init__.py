@@ -0,0 +1 @@
+"""Management configurations for the sample_app app."""
@@ -0,0 +1 @@
+"""Management commands for the sample_app app."""
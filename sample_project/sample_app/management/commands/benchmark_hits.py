@@ -0,0 +1,102 @@
+"""Custom django-admin (manage.py) command to benchmark serializing the hits of search responses.
+
+Serializes synthetic 1,000-hit responses for the Merchant and Product documents,
+as a view returning JSON would, with:
+  - document: iterating Search's Response (a Merchant/Product per hit) and reading the fields
+  - hit_dicts: django_opensearch_toolkit.search.hit_dicts()
+  - hit_rows: django_opensearch_toolkit.search.hit_rows()
+
+The response is already decoded in every case, so only the deserialization is measured.
+No cluster is needed. Usage (from the root of the repo):
+
+    PYTHONPATH=. python sample_project/manage.py benchmark_hits [--hits 1000] [--repeat 20]
+"""
+
+import statistics
+import timeit
+from typing import Any, Callable, Dict, List, Type
+
+from django.core.management.base import BaseCommand, CommandParser
+from opensearchpy.helpers.document import Document
+
+from django_opensearch_toolkit.search import hit_dicts, hit_rows
+
+from ...opensearch_models import Merchant, Product
+
+
+_FIXTURES: Dict[Type[Document], Callable[[int], Dict[str, Any]]] = {
+    Merchant: lambda i: {
+        "name": f"Merchant {i}",
+        "description": f"Description of merchant {i}",
+        "website": f"https://merchant{i}.example.com",
+        "created": 1700000000000 + i,
+        "updated": 1700000000000 + i,
+    },
+    Product: lambda i: {
+        "name": f"Product {i}",
+        "description": f"Description of product {i}",
+        "price": 100 * i,
+        "merchant_id": str(i % 50),
+        "created": 1700000000000 + i,
+        "updated": 1700000000000 + i,
+    },
+}
+
+
+def _make_response(document_cls: Type[Document], num_hits: int) -> Dict[str, Any]:
+    """Return a decoded search response with num_hits hits of the document."""
+    index = document_cls._default_index()
+    make_source = _FIXTURES[document_cls]
+    return {
+        "took": 3,
+        "timed_out": False,
+        "_shards": {"total": 1, "successful": 1, "skipped": 0, "failed": 0},
+        "hits": {
+            "total": {"value": num_hits, "relation": "eq"},
+            "max_score": None,
+            "hits": [
+                {"_index": index, "_id": str(i), "_score": None, "_source": make_source(i), "sort": [i]}
+                for i in range(num_hits)
+            ],
+        },
+    }
+
+
+class Command(BaseCommand):
+    """Custom django-admin (manage.py) command to benchmark serializing the hits of search responses."""
+
+    help = "Compare serializing search hits via Document objects vs. hit_dicts()/hit_rows()"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Define arguments for this command."""
+        parser.add_argument("--hits", type=int, default=1000, help="Number of hits per response")
+        parser.add_argument("--repeat", type=int, default=20, help="Number of timed runs per approach")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the command."""
+        del args  # unused
+        for document_cls in _FIXTURES:
+            self._benchmark(document_cls, options["hits"], options["repeat"])
+
+    def _benchmark(self, document_cls: Type[Document], num_hits: int, repeat: int) -> None:
+        """Display the median time to serialize a response with each approach."""
+        raw_response = _make_response(document_cls, num_hits)
+        fields = list(_FIXTURES[document_cls](0))
+        search = document_cls.search().source(fields)
+
+        def _document() -> List[Dict[str, Any]]:
+            response = search._response_class(search, raw_response)
+            return [{"id": hit.meta.id, **{f: getattr(hit, f, None) for f in fields}} for hit in response]
+
+        approaches: Dict[str, Callable[[], Any]] = {
+            "document": _document,
+            "hit_dicts": lambda: hit_dicts(raw_response, fields),
+            "hit_rows": lambda: hit_rows(raw_response, fields),
+        }
+
+        self.stdout.write(f"{document_cls.__name__} ({num_hits} hits, {len(fields)} fields)")
+        baseline = None
+        for name, fn in approaches.items():
+            median = statistics.median(timeit.repeat(fn, number=1, repeat=repeat))
+            baseline = baseline or median
+            self.stdout.write(f"  {name:<10} {median * 1000:8.2f} ms  {baseline / median:6.1f}x")
@@ -12,8 +12,9 @@ from .m0002_create_products_index import CreateProductsIndex
 #   - Don't remove an entry from this list
 #   - Don't reorder entries
 #   - Only add new entries at the end
-# We use a serial migration order right now for OpenSearch. It's a dependency chain,
-# instead of a more general dependency graph, like Django would create.
+# By default, each migration depends on the previous entry, i.e. they form a chain.
+# Pass `dependencies=[...]` to a migration to declare a more general dependency graph,
+# like Django does. Independent migrations can then be applied concurrently.
 MIGRATIONS: List[OpenSearchMigration] = [
     CreateMerchantsIndex(),
     CreateProductsIndex(),
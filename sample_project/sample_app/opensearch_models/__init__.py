@@ -1,4 +1,14 @@
 """OpenSearch document models for the sample_app."""
 
+from typing import List, Type
+
+from opensearchpy.helpers.document import Document
+
 from .merchant import Merchant
 from .product import Product
+
+
+DOCUMENTS: List[Type[Document]] = [
+    Merchant,
+    Product,
+]
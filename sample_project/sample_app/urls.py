@@ -2,9 +2,10 @@
 
 from django.urls import path
 
-from .views.merchants_view import MerchantView
+from .views.merchants_view import MerchantExportView, MerchantView
 
 
 urlpatterns = [
     path("merchants/", MerchantView.as_view(), name="merchants-list"),
+    path("merchants/export/", MerchantExportView.as_view(), name="merchants-export"),
 ]
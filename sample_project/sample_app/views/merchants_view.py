@@ -4,10 +4,19 @@ import json
 import time
 
 from django.http import JsonResponse, HttpResponse, HttpRequest
+from django.http.response import HttpResponseBase
 from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.decorators.csrf import csrf_exempt
 
+from django_opensearch_toolkit.search import (
+    CursorPaginator,
+    cached_execute_raw,
+    hit_dicts,
+    invalidate_index,
+    streaming_search_response,
+)
+
 from ..opensearch_models import Merchant
 
 
@@ -16,28 +25,24 @@ class MerchantView(View):
     """API views for the Merchants index."""
 
     def get(self, request: HttpRequest) -> HttpResponse:
-        """List the first 10 merchants."""
-        del request  # unused
-
+        """List the merchants, 10 per page. Pass the `next_cursor` of a page as `cursor` for the next one."""
         search = Merchant.search()
         search = search.query("match_all")
         search = search.source(["_id", "name", "description", "website"])
         search = search.sort("name")
-        search = search.extra(size=10)
-
-        response = search.execute()
 
-        merchants_serialized = [
-            {
-                "id": hit.meta.id,
-                "name": hit.name,
-                "description": hit.description,
-                "website": hit.website,
-            }
-            for hit in response
-        ]
+        # Each page starts after the last hit of the previous one (search_after), so deep pages cost the
+        # same as the first. Responses are cached, and invalidated when the toolkit writes to the index.
+        # The hits are serialized straight from the decoded response, without building a Merchant for each.
+        # The website of a merchant is unique, and a keyword field (with doc values) to break ties on.
+        paginator = CursorPaginator(search, page_size=10, tiebreaker="website", execute=cached_execute_raw)
+        try:
+            page = paginator.get_page(request.GET.get("cursor"))
+        except ValueError:
+            return JsonResponse({"error": "Invalid cursor"}, status=400)
+        merchants_serialized = hit_dicts(page.response, ["name", "description", "website"])
 
-        return JsonResponse({"merchants": merchants_serialized})
+        return JsonResponse({"merchants": merchants_serialized, "next_cursor": page.next_cursor})
 
     def post(self, request: HttpRequest) -> HttpResponse:
         """Create a new merchant."""
@@ -55,7 +60,10 @@ class MerchantView(View):
         except (json.JSONDecodeError, KeyError):
             return JsonResponse({"error": "Invalid data"}, status=400)
 
-        merchant.save()
+        # Document.save() bypasses the toolkit's write paths, so invalidate the cached searches explicitly,
+        # once the merchant is visible to searches
+        merchant.save(refresh="wait_for")
+        invalidate_index(Merchant.Index.using, Merchant.Index.name)
         merchant_serialized = {
             "id": merchant.meta.id,
             "name": merchant.name,
@@ -64,3 +72,24 @@ class MerchantView(View):
         }
 
         return JsonResponse({"merchant": merchant_serialized}, status=201)
+
+
+class MerchantExportView(View):
+    """Export all merchants, streamed as CSV (the default) or NDJSON."""
+
+    def get(self, request: HttpRequest) -> HttpResponseBase:
+        """Stream all merchants, sorted by name."""
+        export_format = request.GET.get("format", "csv")
+        if export_format not in ("csv", "ndjson"):
+            return JsonResponse({"error": "Invalid format"}, status=400)
+
+        search = Merchant.search()
+        search = search.query("match_all")
+        search = search.sort("name")
+
+        return streaming_search_response(
+            search,
+            export_format,
+            fields=["name", "description", "website"],
+            filename=f"merchants.{export_format}",
+        )
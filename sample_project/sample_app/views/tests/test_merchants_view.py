@@ -2,9 +2,10 @@
 
 import datetime
 import json
-from typing import List
+from typing import Any, Dict, List, Optional
 from unittest.mock import patch
 
+from django.core.cache import caches
 from django.test import Client
 from django_opensearch_toolkit.unittest import MagicMockOpenSearchTestCase
 
@@ -18,6 +19,7 @@ class MerchantViewTests(MagicMockOpenSearchTestCase):
     def setUp(self) -> None:
         super().setUp()
 
+        caches["opensearch_search"].clear()
         self.rest_client = Client()
         self.rest_endpoint = "/api/v1/merchants/"
         self.os_client = self.get_test_client("sample_app")
@@ -68,7 +70,8 @@ class MerchantViewTests(MagicMockOpenSearchTestCase):
                         "description": "Description 2",
                         "website": "http://example2.com",
                     },
-                ]
+                ],
+                "next_cursor": None,
             },
         )
 
@@ -78,17 +81,55 @@ class MerchantViewTests(MagicMockOpenSearchTestCase):
             body={
                 "query": {"match_all": {}},
                 "_source": ["_id", "name", "description", "website"],
-                "sort": ["name"],
-                "size": 10,
+                "sort": ["name", "website"],
+                "size": 11,
             },
         )
 
+    def test_get_merchants_pages(self) -> None:
+        def _search(index: List[str], body: Dict[str, Any]) -> Dict[str, Any]:
+            start = int(body["search_after"][1]) + 1 if "search_after" in body else 0
+            hits = [
+                {"_id": str(i), "_source": {"name": f"Merchant {i:02}"}, "sort": [f"Merchant {i:02}", str(i)]}
+                for i in range(start, min(start + body["size"], 25))
+            ]
+            return {"hits": {"hits": hits}}
+
+        self.os_client.search.side_effect = _search
+
+        # Walk all the pages
+        ids: List[str] = []
+        cursor: Optional[str] = None
+        for _ in range(3):
+            params: Dict[str, str] = {"cursor": cursor} if cursor else {}
+            response = self.rest_client.get(self.rest_endpoint, params)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(m["id"] for m in response.json()["merchants"])
+            cursor = response.json()["next_cursor"]
+
+        self.assertIsNone(cursor)
+        self.assertListEqual(ids, [str(i) for i in range(25)])
+        self.assertEqual(self.os_client.search.call_count, 3)
+        self.assertEqual(
+            self.os_client.search.call_args.kwargs["body"]["search_after"], ["Merchant 19", "19"]
+        )
+
+    def test_get_merchants_invalid_cursor(self) -> None:
+        response = self.rest_client.get(self.rest_endpoint, {"cursor": "forged"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "Invalid cursor"})
+        self.os_client.search.assert_not_called()
+
     def test_post_merchant(self) -> None:
         # Patch the OpenSearch index method
         self.os_client.index.return_value = {"_id": "zyrTds13x", "result": "created"}
 
         # Call our API
-        with patch("time.time", return_value=1733088413.532):
+        with (
+            patch("time.time", return_value=1733088413.532),
+            patch("sample_app.views.merchants_view.invalidate_index") as invalidate_index,
+        ):
             response = self.rest_client.post(
                 path=self.rest_endpoint,
                 data=json.dumps(
@@ -119,7 +160,9 @@ class MerchantViewTests(MagicMockOpenSearchTestCase):
                 "created": datetime.datetime(2024, 12, 1, 21, 26, 53, 532000),
                 "updated": datetime.datetime(2024, 12, 1, 21, 26, 53, 532000),
             },
+            refresh="wait_for",
         )
+        invalidate_index.assert_called_once_with("sample_app", "merchants")
 
     def test_post_merchant_invalid_data(self) -> None:
         # Call our API
@@ -141,3 +184,81 @@ class MerchantViewTests(MagicMockOpenSearchTestCase):
 
         # OpenSearch is not called as data validation failed
         self.os_client.index.assert_not_called()
+
+
+class MerchantExportViewTests(MagicMockOpenSearchTestCase):
+    """Tests for the MerchantExportView class."""
+
+    def connections_to_patch(self) -> List[str]:
+        return ["sample_app"]
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.rest_client = Client()
+        self.rest_endpoint = "/api/v1/merchants/export/"
+        self.os_client = self.get_test_client("sample_app")
+        self.os_client.create_pit.return_value = {"pit_id": "pit-1"}
+        self.os_client.search.return_value = {
+            "pit_id": "pit-1",
+            "hits": {
+                "hits": [
+                    {
+                        "_id": "1",
+                        "_source": {
+                            "name": "Merchant 1",
+                            "description": "Description 1",
+                            "website": "http://example1.com",
+                        },
+                        "sort": ["Merchant 1", "1"],
+                    },
+                ]
+            },
+        }
+
+    def test_export_csv(self) -> None:
+        response = self.rest_client.get(self.rest_endpoint)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="merchants.csv"')
+        self.assertEqual(
+            response.getvalue().decode().splitlines(),
+            ["id,name,description,website", "1,Merchant 1,Description 1,http://example1.com"],
+        )
+
+        # Check OpenSearch client calls
+        self.os_client.create_pit.assert_called_once_with(index="merchants", keep_alive="1m")
+        self.os_client.search.assert_called_once_with(
+            body={
+                "query": {"match_all": {}},
+                "_source": ["name", "description", "website"],
+                "sort": ["name", "_shard_doc"],
+                "size": 1000,
+                "pit": {"id": "pit-1", "keep_alive": "1m"},
+            },
+        )
+        self.os_client.delete_pit.assert_called_once_with(body={"pit_id": ["pit-1"]})
+
+    def test_export_ndjson(self) -> None:
+        response = self.rest_client.get(self.rest_endpoint, {"format": "ndjson"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(
+            [json.loads(line) for line in response.getvalue().decode().splitlines()],
+            [
+                {
+                    "id": "1",
+                    "name": "Merchant 1",
+                    "description": "Description 1",
+                    "website": "http://example1.com",
+                }
+            ],
+        )
+
+    def test_export_invalid_format(self) -> None:
+        response = self.rest_client.get(self.rest_endpoint, {"format": "xml"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "Invalid format"})
+        self.os_client.create_pit.assert_not_called()
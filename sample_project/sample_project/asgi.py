@@ -11,6 +11,9 @@ import os
 
 from django.core.asgi import get_asgi_application
 
+from django_opensearch_toolkit.async_client import OpenSearchLifespanMiddleware
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "sample_project.settings")
 
-application = get_asgi_application()
+# Closes the async OpenSearch clients when the ASGI server shuts down
+application = OpenSearchLifespanMiddleware(get_asgi_application())
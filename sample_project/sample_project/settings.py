@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
 from pathlib import Path
+import sys
 from typing import List
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -28,6 +29,9 @@ DEBUG = True
 
 ALLOWED_HOSTS: List[str] = []
 
+# Whether the unit tests are running (`manage.py test`)
+TESTING = sys.argv[1:2] == ["test"]
+
 
 # Application definition
 
@@ -53,6 +57,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "django_opensearch_toolkit.search.middleware.SearchBatchingMiddleware",
 ]
 
 ROOT_URLCONF = "sample_project.urls"
@@ -152,3 +157,35 @@ OPENSEARCH_MIGRATION_PATHS = {
     #   - The module will be dynamically imported and the MIGRATIONS variable will be used.
     "sample_app": "sample_app.opensearch_migrations",
 }
+
+
+# Caches
+# NOTE: a LocMemCache is per process, so the invalidations of cached searches after writes
+# only reach the process that made the write. Use a shared cache (e.g., Redis) in production.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "opensearch_search": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "opensearch_search",
+    },
+}
+
+
+# Cache the responses of searches executed with django_opensearch_toolkit.search.cached_execute()
+OPENSEARCH_SEARCH_CACHE = {
+    "cache": "opensearch_search",  # alias in CACHES
+    "timeout": 30,  # seconds
+    # seconds, the refresh interval of the indices. Writes to the mocked clusters of the unit tests are
+    # visible right away, so they don't start timers to invalidate the cached searches again.
+    "refresh_interval": 0 if TESTING else 1,
+}
+
+
+# OpenSearch Documents (used by opensearch_makemigrations)
+OPENSEARCH_DOCUMENT_PATHS = {
+    # cluster_name -> module_path
+    #   - Each module should define a variable named DOCUMENTS, with the Document classes of the cluster.
+    "sample_app": "sample_app.opensearch_models",
+}